@@ -0,0 +1,115 @@
+"""
+Command-line mode: solves one tour and prints or exports it.
+
+Only the chosen solver's module is imported (see src.solvers); tkinter and
+matplotlib never are, so a run starts in a small fraction of the GUI's
+start-up time (`python -m src.bench --startup` measures both). Runs use the
+tour cache shared with the GUI and batch runner, and are profiled when
+KNIGHT_PROFILE is set (see src.profiling).
+
+Example:
+    python -m src --size 8 --start 0,0
+    python -m src --algorithm divide --size 60 --format json --output tour.json
+    python -m src --algorithm cultural --size 6 --seed 1 --save tour.ktr
+    python -m src --algorithm portfolio --size 64 --budget 5
+    python -m src --gui
+"""
+
+import argparse
+import json
+import sys
+
+from src.cache import TourCache
+from src.profiling import maybe_profile
+from src.records import export_record, make_record
+from src.solvers import ALGORITHMS, create_solver, parse_start
+from src.tour import save_tour
+
+FORMATS = ("board", "path", "json", "summary")
+
+
+def format_board(path, n):
+    """
+    The board as a grid of step numbers; unvisited squares show as ".".
+    """
+    steps = [["."] * n for _ in range(n)]
+    for i, (x, y) in enumerate(path):
+        steps[x][y] = str(i)
+    width = len(str(n * n - 1))
+    return "\n".join(" ".join(cell.rjust(width) for cell in row) for row in steps)
+
+
+def format_result(res, n, start, fmt):
+    """
+    Renders a solver result in one of FORMATS (the summary line excluded).
+    """
+    if fmt == "board":
+        return format_board(res["path"], n)
+    if fmt == "path":
+        return "\n".join(f"{x} {y}" for x, y in res["path"])
+    return json.dumps(export_record(res, n, start))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src", description="Solve a Knight's Tour from the command line (no GUI).")
+    parser.add_argument("--algorithm", default="backtracking", choices=list(ALGORITHMS), help="solver to run (default: backtracking)")
+    parser.add_argument("--size", type=int, default=8, help="board size N (default: 8)")
+    parser.add_argument("--start", type=parse_start, default=(0, 0), help="start square as ROW,COL (default: 0,0)")
+    parser.add_argument("--format", default="board", choices=FORMATS, help="what to print (default: board)")
+    parser.add_argument("--output", default=None, help="write the formatted tour to this file instead of stdout")
+    parser.add_argument("--save", default=None, help="also save the tour in the binary tour format (see src.tour)")
+    parser.add_argument("--max-gens", type=int, default=None, help="generation limit for the cultural solvers")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the cultural solvers")
+    parser.add_argument("--budget", type=float, default=None, help="time budget in seconds for the portfolio race")
+    parser.add_argument("--cache-dir", default=".tour_cache", help="tour cache shared with the GUI")
+    parser.add_argument("--no-cache", action="store_true", help="always solve, ignoring the tour cache")
+    parser.add_argument("--gui", action="store_true", help="open the GUI instead (other options are ignored)")
+    args = parser.parse_args(argv)
+
+    if args.gui:
+        from src.main import launch
+        launch()
+        return 0
+
+    n = args.size
+    x, y = args.start
+    if n < 1:
+        parser.error("--size must be at least 1")
+    if not (0 <= x < n and 0 <= y < n):
+        parser.error(f"--start {x},{y} is off a {n}x{n} board")
+
+    options = {}
+    if args.algorithm in ("cultural", "islands"):
+        if args.max_gens is not None:
+            options["max_gens"] = args.max_gens
+        if args.seed is not None:
+            options["seed"] = args.seed
+    if args.algorithm == "portfolio" and args.budget is not None:
+        options["budget"] = args.budget
+
+    compute = lambda: maybe_profile(lambda: create_solver(args.algorithm, n, **options).run(x, y), f"{args.algorithm}-{n}")
+    if args.no_cache:
+        res = compute()
+    else:
+        res = TourCache(args.cache_dir).solve(args.algorithm, n, x, y, compute)
+
+    record = make_record(res, n, None)
+    cached = " (cached)" if res.get("cached") else ""
+    print(f"{record['Algorithm']} {record['Board']} from {x},{y}: {record['Result']} squares in {record['Time']}{cached}"
+          + (f", {record['Work']}" if record["Work"] else ""), file=sys.stderr)
+
+    if args.format != "summary" and len(res["path"]):
+        text = format_result(res, n, (x, y), args.format)
+        if args.output:
+            with open(args.output, "w") as file:
+                file.write(text + "\n")
+        else:
+            print(text)
+    if args.save and len(res["path"]):
+        save_tour(args.save, res["path"], n)
+
+    return 0 if res["success"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,9 @@
-import sys
 import time
+from array import array
 
+from src.board import KNIGHT_MOVES, get_geometry
+from src.tour import TourPath
 
-sys.setrecursionlimit(50000)
 
 class BacktrackingSolver:
     """
@@ -12,75 +13,347 @@ class BacktrackingSolver:
     This implementation utilizes 'Warnsdorff's Rule' heuristic. Instead of exploring 
     moves sequentially, it prioritizes moves that lead to squares with the fewest 
     onward moves. This drastically reduces the search space and backtracking steps.
+
+    The search runs on an explicit stack rather than the Python call stack, so
+    large boards do not depend on the interpreter's recursion limit. Move
+    ordering reads a degree array that is updated incrementally as squares are
+    visited and released, instead of re-counting onward moves for each candidate.
+
+    Optional layers for hard starts (all off by default):
+    - prune_dead_ends: backtrack as soon as an unvisited square is stranded
+      (no free neighbour left), or more than one square is left with a single
+      free neighbour (each of those can only be the last square).
+    - connectivity_interval: every K levels, flood-fill the unvisited squares
+      on a bitboard and backtrack if they no longer form one region with the
+      knight.
+    - tie_break: how Warnsdorff ties are broken. "pohl" prefers the candidate
+      whose own onward squares have the lowest total degree (Pohl's rule
+      applied one level down). "roth" prefers the candidate furthest from
+      the centre. A move_order permutation of KNIGHT_MOVES gives a fixed
+      preference order, as in Squirrel and Cull's per-board tables.
+    Squares cut off by the first two layers are counted in self.pruned.
     """
 
-    def __init__(self, n):
+    TIE_BREAKS = (None, "pohl", "roth")
+
+    def __init__(self, n, progress=None, cancel=None, progress_interval=20000,
+                 prune_dead_ends=False, connectivity_interval=0, tie_break=None, move_order=None):
         """
         Initialize the solver with board size N.
         
         Args:
             n (int): The dimension of the chessboard (NxN).
+            progress: Optional callable receiving {"depth", "nodes"} dicts.
+            cancel: Optional Event-like object; the search stops once it is set.
+            progress_interval (int): Nodes between progress reports and cancel checks.
+            prune_dead_ends (bool): Enable the stranded-square checks.
+            connectivity_interval (int): Flood-fill check every K levels (0 = off).
+            tie_break: None (first in move order), "pohl" or "roth".
+            move_order: Optional permutation of range(8) over KNIGHT_MOVES
+                giving the order tied candidates are tried in.
         """
+        if tie_break not in self.TIE_BREAKS:
+            raise ValueError(f"tie_break must be one of {self.TIE_BREAKS}, not {tie_break!r}")
         self.n = n
+        self.geometry = get_geometry(n)
+        self.progress = progress
+        self.cancel = cancel
+        self.progress_interval = progress_interval
+        self.cancelled = False
         
-        self.board = [[-1 for _ in range(n)] for _ in range(n)]
+        # Flat board: square (x, y) lives at index x * n + y. The search keeps
+        # plain lists (cheaper to read than array in the hot loop); the result
+        # path is packed into an array('I') TourPath.
+        self.board = [-1] * (n * n)
+        # degree[sq] = number of unvisited squares one knight move from sq.
+        self.degree = self.geometry.initial_degrees()
         
-        self.moves = [(2,1), (1,2), (-1,2), (-2,1), (-2,-1), (-1,-2), (1,-2), (2,-1)]
-        self.final_path = []
+        self.moves = KNIGHT_MOVES
+        self.final_path = TourPath(array('I'), n)
+
+        self.prune_dead_ends = prune_dead_ends
+        self.connectivity_interval = connectivity_interval
+        self.tie_break = tie_break
+        self.pruned = {"dead_ends": 0, "disconnected": 0}
+        self.stats = {}
+
+        # Candidate lists are built in neighbour order and sorted stably, so
+        # the neighbour order is the final tie-break.
+        self.neighbours = self.geometry.neighbours
+        if move_order is not None:
+            if sorted(move_order) != list(range(8)):
+                raise ValueError("move_order must be a permutation of range(8)")
+            self.moves = [KNIGHT_MOVES[i] for i in move_order]
+            self.neighbours = tuple(
+                tuple(
+                    (x + dx) * n + (y + dy)
+                    for dx, dy in self.moves
+                    if 0 <= x + dx < n and 0 <= y + dy < n
+                )
+                for x in range(n) for y in range(n)
+            )
+        self.order_key = self.make_order_key()
+
+    def record_stats(self, nodes, backtracks, evaluations, max_depth):
+        """
+        Stores the search counters in self.stats.
+        
+        Counters live in locals while the search runs and are copied here at
+        every progress report and when the search ends or is stopped.
+        """
+        self.stats = {
+            "nodes": nodes,
+            "backtracks": backtracks,
+            "degree_evaluations": evaluations,
+            "max_depth": max_depth,
+            "pruned_dead_ends": self.pruned["dead_ends"],
+            "pruned_disconnected": self.pruned["disconnected"],
+        }
+
+    def make_order_key(self):
+        """
+        Builds the sort key that orders candidate squares.
+        
+        Plain Warnsdorff sorts by degree alone; the tie-break rules add a
+        secondary term below the degree.
+        """
+        degree = self.degree
+        if self.tie_break is None:
+            return degree.__getitem__
+        board = self.board
+        neighbours = self.neighbours
+        if self.tie_break == "pohl":
+            # Onward degrees sum to at most 8 * 8, so degree * 65 dominates.
+            def pohl(square):
+                return degree[square] * 65 + sum(degree[nb] for nb in neighbours[square] if board[nb] == -1)
+            return pohl
+        n = self.n
+        far = [(2 * x - n + 1) ** 2 + (2 * y - n + 1) ** 2 for x in range(n) for y in range(n)]
+        scale = max(far) + 1
+        def roth(square):
+            return degree[square] * scale - far[square]
+        return roth
 
     def is_valid(self, x, y):
         """
         Check if a move is within board boundaries and the square is unvisited.
         """
-        return 0 <= x < self.n and 0 <= y < self.n and self.board[x][y] == -1
+        return 0 <= x < self.n and 0 <= y < self.n and self.board[x * self.n + y] == -1
 
     def get_degree(self, x, y):
         """
         Calculates the number of valid onward moves from a given square (x, y).
         This is the core of Warnsdorff's heuristic.
         """
-        count = 0
-        for dx, dy in self.moves:
-            if self.is_valid(x + dx, y + dy):
-                count += 1
-        return count
+        return self.degree[x * self.n + y]
 
-    def solve_recursive(self, curr_x, curr_y, pos):
+    def visit(self, square, pos):
         """
-        The recursive function that attempts to build the path.
-        
-        Args:
-            curr_x, curr_y: Current position of the knight.
-            pos: The current step number (0 to N*N-1).
+        Marks a square as step `pos` and takes it out of its neighbours' degrees.
+        """
+        self.board[square] = pos
+        degree = self.degree
+        for nb in self.geometry.neighbours[square]:
+            degree[nb] -= 1
+
+    def release(self, square):
+        """
+        Undoes visit() for a square when the search backtracks over it.
+        """
+        self.board[square] = -1
+        degree = self.degree
+        for nb in self.geometry.neighbours[square]:
+            degree[nb] += 1
+
+    def ordered_moves(self, square):
+        """
+        Lists the unvisited squares reachable from `square`, fewest onward moves first.
         
         Returns:
-            bool: True if a solution is found, False otherwise.
+            list: Flat square indices in Warnsdorff order.
         """
-        self.board[curr_x][curr_y] = pos
-        self.final_path.append((curr_x, curr_y))
+        board = self.board
+        possible_moves = [nb for nb in self.neighbours[square] if board[nb] == -1]
+        possible_moves.sort(key=self.order_key)
+        return possible_moves
 
+    def iter_events(self, start_x, start_y, trace=False):
+        """
+        Depth-first search over an explicit stack of candidate lists, as a
+        generator of search events.
         
-        if pos == self.n * self.n - 1:
-            return True
-
+        Each depth keeps its Warnsdorff-ordered candidates and a cursor into
+        them in flat arrays preallocated to N*N entries, so a move costs a few
+        list writes instead of a Python frame.
         
-        possible_moves = []
-        for dx, dy in self.moves:
-            nx, ny = curr_x + dx, curr_y + dy
-            if self.is_valid(nx, ny):
-                possible_moves.append((nx, ny))
-
+        The optional pruning layers empty a square's candidate list when they
+        reject it, so the next step backtracks over it.
         
-        possible_moves.sort(key=lambda m: self.get_degree(m[0], m[1]))
-
+        Events are dicts with an "event" key:
+            "progress"  every `progress_interval` nodes: depth, nodes, backtracks,
+                        max_depth.
+            "expand"    a square was added (only with trace=True): square, depth.
+            "backtrack" a square was undone (only with trace=True): square, depth.
+            "solution"  a full tour was found: path, nodes, backtracks.
+            "exhausted" every branch failed: nodes, backtracks.
         
-        for nx, ny in possible_moves:
-            if self.solve_recursive(nx, ny, pos + 1):
-                return True
+        The search only advances while the caller asks for events, so it can
+        be suspended and resumed at any event. Closing the generator stops
+        the search and leaves the partial path in self.final_path. While it
+        runs, self.search_path is the live stack of squares: at any event,
+        its first depth + 1 entries are the current path.
+        
+        self.stats holds the counters (nodes expanded, backtracks, degree
+        evaluations, i.e. candidate sort keys computed, and maximum depth)
+        as of the last progress report or the end of the search.
+        
+        Args:
+            start_x, start_y: Starting position of the knight.
+            trace (bool): Also yield a per-node "expand"/"backtrack" event.
+        """
+        n = self.n
+        total = n * n
+        board = self.board
+        degree = self.degree
+        neighbours = self.neighbours
+        order_key = self.order_key
+        self.search_path = path = [0] * total
+        candidates = [None] * total
+        cursor = [0] * total
+        nodes = backtracks = evaluations = max_depth = 0
+        next_report = self.progress_interval
+        prune = self.prune_dead_ends
+        ends = [-1] * total
+        connect_every = self.connectivity_interval
+        # The bitboards are only built when connectivity checks are on.
+        bits = self.geometry.bits if connect_every else None
+        reachable = self.geometry.reachable
+        pruned = self.pruned
+
+        depth = 0
+        square = start_x * n + start_y
+        self.visit(square, 0)
+        path[0] = square
+        free = self.geometry.all_bits ^ bits[square] if connect_every else 0
+        self.final_path = TourPath(array('I'), n)
+        if total == 1:
+            self.final_path = TourPath(array('I', path), n)
+            self.record_stats(nodes, backtracks, evaluations, max_depth)
+            yield {"event": "solution", "path": self.final_path, "nodes": nodes, "backtracks": backtracks}
+            return
+        candidates[0] = self.ordered_moves(square)
+        evaluations = len(candidates[0])
 
+        try:
+            while True:
+                cands = candidates[depth]
+                i = cursor[depth]
+                if i < len(cands):
+                    # Advance: take the next candidate at this depth.
+                    cursor[depth] = i + 1
+                    prev = path[depth]
+                    square = cands[i]
+                    depth += 1
+                    nodes += 1
+                    if depth > max_depth:
+                        max_depth = depth
+                    board[square] = depth
+                    nbrs = neighbours[square]
+                    for nb in nbrs:
+                        degree[nb] -= 1
+                    path[depth] = square
+                    if connect_every:
+                        free ^= bits[square]
+                    if trace:
+                        yield {"event": "expand", "square": divmod(square, n), "depth": depth}
+                    if depth == total - 1:
+                        break
+                    cands = [nb for nb in nbrs if board[nb] == -1]
+                    if prune:
+                        # Squares next to prev just lost it as a way in: with
+                        # no free neighbour they are stranded, with one they
+                        # can only be the last square, and there is one last.
+                        end = ends[depth - 1]
+                        for u in neighbours[prev]:
+                            if board[u] == -1:
+                                d = degree[u]
+                                if d == 0 or (d == 1 and end != -1 and end != u and board[end] == -1):
+                                    cands = None
+                                    break
+                                if d == 1:
+                                    end = u
+                        # A candidate with no way out can only be the last square.
+                        if cands and total - depth > 2:
+                            for u in cands:
+                                if degree[u] == 0:
+                                    cands = None
+                                    break
+                        if cands is None:
+                            pruned["dead_ends"] += 1
+                            cands = []
+                        ends[depth] = end
+                    if cands and connect_every and depth % connect_every == 0 and total - depth > 5:
+                        allowed = free | bits[square]
+                        if reachable(bits[square], allowed) != allowed:
+                            pruned["disconnected"] += 1
+                            cands = []
+                    evaluations += len(cands)
+                    cands.sort(key=order_key)
+                    candidates[depth] = cands
+                    cursor[depth] = 0
+                    if nodes >= next_report:
+                        next_report += self.progress_interval
+                        self.record_stats(nodes, backtracks, evaluations, max_depth)
+                        yield {"event": "progress", "depth": depth, "nodes": nodes, "backtracks": backtracks, "max_depth": max_depth}
+                else:
+                    # Exhausted: undo this square and return to the parent.
+                    self.release(path[depth])
+                    if connect_every:
+                        free |= bits[path[depth]]
+                    candidates[depth] = None
+                    if depth == 0:
+                        self.record_stats(nodes, backtracks, evaluations, max_depth)
+                        yield {"event": "exhausted", "nodes": nodes, "backtracks": backtracks}
+                        return
+                    backtracks += 1
+                    if trace:
+                        yield {"event": "backtrack", "square": divmod(path[depth], n), "depth": depth}
+                    depth -= 1
+        except GeneratorExit:
+            # Stopped early by the consumer: keep the partial path.
+            self.final_path = TourPath(array('I', path[:depth + 1]), n)
+            self.record_stats(nodes, backtracks, evaluations, max_depth)
+            raise
+
+        self.final_path = TourPath(array('I', path), n)
+        self.record_stats(nodes, backtracks, evaluations, max_depth)
+        yield {"event": "solution", "path": self.final_path, "nodes": nodes, "backtracks": backtracks}
+
+    def solve_iterative(self, start_x, start_y):
+        """
+        Consumes iter_events until the search ends.
+        
+        Progress events go to the progress callback; if the cancel event is
+        set at one of them, the search stops and keeps its partial path.
+        
+        Args:
+            start_x, start_y: Starting position of the knight.
         
-        self.board[curr_x][curr_y] = -1
-        self.final_path.pop()
+        Returns:
+            bool: True if a solution is found, False otherwise.
+        """
+        events = self.iter_events(start_x, start_y)
+        for event in events:
+            kind = event["event"]
+            if kind == "progress":
+                if self.progress is not None:
+                    self.progress(event)
+                if self.cancel is not None and self.cancel.is_set():
+                    self.cancelled = True
+                    events.close()
+                    return False
+            elif kind == "solution":
+                return True
         return False
 
     def run(self, start_x, start_y):
@@ -90,17 +363,20 @@ class BacktrackingSolver:
         Returns:
             dict: Contains algorithm name, success status, execution time, steps, and path.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         
-        success = self.solve_recursive(start_x, start_y, 0)
+        success = self.solve_iterative(start_x, start_y)
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         return {
             "algorithm": "Backtracking",
             "success": success,
             "path": self.final_path,
             "time": end_time - start_time,
-            "steps": len(self.final_path)
-        }
\ No newline at end of file
+            "steps": len(self.final_path),
+            "cancelled": self.cancelled,
+            "pruned": dict(self.pruned),
+            "stats": dict(self.stats)
+        }
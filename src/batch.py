@@ -0,0 +1,205 @@
+"""
+Headless batch runner for sweeping solvers over board sizes and start squares.
+
+Every (N, start square, algorithm) combination becomes one task. Tasks are
+spread over a process pool and each finished run is appended to a CSV file
+straight away, in the same record format the GUI logs. Nothing here imports
+tkinter or matplotlib.
+
+Example:
+    python -m src.batch --sizes 6-12:2 --rows 0-2 --cols 0-2 \\
+        --algorithms backtracking,divide --workers 4 --timeout 30
+"""
+
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+import signal
+import sys
+
+from src.cache import TourCache
+from src.records import RECORD_FIELDS, make_record
+from src.solvers import ALGORITHMS, STREAMING, Deadline, create_solver, display_name
+
+BATCH_FIELDS = RECORD_FIELDS + ["Start", "Cached", "Error"]
+
+# One cache per worker process; the disk tier is shared between them.
+_caches = {}
+
+
+class TaskTimeout(Exception):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise TaskTimeout()
+
+
+def parse_range(text):
+    """
+    Parses "5", "6-12", "6-12:2" or comma-separated mixes into a list of ints.
+    """
+    values = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        bounds, _, step = part.partition(":")
+        lo, _, hi = bounds.partition("-")
+        values.extend(range(int(lo), int(hi or lo) + 1, int(step or 1)))
+    return values
+
+
+def build_tasks(sizes, rows, cols, algorithms):
+    """
+    Yields (n, row, col, algorithm) for every start square that fits on the board.
+    """
+    for n, r, c, algorithm in itertools.product(sizes, rows, cols, algorithms):
+        if r < n and c < n:
+            yield n, r, c, algorithm
+
+
+def run_task(task, timeout=None, options=None, cache_dir=None):
+    """
+    Runs one solver in a worker process and returns its record fields.
+    
+    The path itself is dropped so only a small dict crosses back to the parent.
+    After `timeout` seconds the streaming solvers stop at their next progress
+    check and keep their partial path and counters. The others, which cannot
+    be cancelled, are interrupted by SIGALRM where it exists (not on Windows).
+    With a cache_dir, tours are looked up in and added to the shared
+    TourCache.
+    """
+    n, r, c, algorithm = task
+    res = {"algorithm": display_name(algorithm), "success": False, "time": 0.0, "steps": 0}
+    error = ""
+    solver_options = dict((options or {}).get(algorithm, {}))
+    if timeout and algorithm in STREAMING:
+        solver_options["cancel"] = Deadline(timeout)
+    use_alarm = timeout and algorithm not in STREAMING and hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        compute = lambda: create_solver(algorithm, n, **solver_options).run(r, c)
+        if cache_dir is None:
+            res = compute()
+        else:
+            if cache_dir not in _caches:
+                _caches[cache_dir] = TourCache(cache_dir)
+            res = _caches[cache_dir].solve(algorithm, n, r, c, compute)
+        if res.get("cancelled"):
+            error = f"timeout after {timeout}s"
+    except TaskTimeout:
+        error = f"timeout after {timeout}s"
+        res["time"] = float(timeout)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    record = make_record(res, n, None)
+    record["Start"] = f"{r},{c}"
+    record["Cached"] = "Yes" if res.get("cached") else "No"
+    record["Error"] = error
+    return record
+
+
+def _run_task_star(args):
+    return run_task(*args)
+
+
+def last_id(output):
+    """
+    Highest ID already in a batch CSV (0 for a missing or empty file).
+    """
+    if not os.path.exists(output):
+        return 0
+    with open(output, newline='') as file:
+        ids = [int(row["ID"]) for row in csv.DictReader(file) if (row.get("ID") or "").isdigit()]
+    return max(ids, default=0)
+
+
+def run_batch(tasks, output, workers=None, chunksize=1, timeout=None, options=None, progress=None, cache_dir=None):
+    """
+    Runs tasks on a process pool and appends each record to `output` as it finishes.
+    
+    Args:
+        tasks: Iterable of (n, row, col, algorithm).
+        output (str): CSV path; the header is written if the file is new,
+            and IDs continue from the last one already in it.
+        workers (int): Pool size (default: CPU count).
+        chunksize (int): Tasks handed to a worker at a time.
+        timeout (float): Per-task time limit in seconds.
+        options (dict): Per-algorithm solver constructor arguments.
+        progress: Optional callable receiving each record.
+        cache_dir (str): TourCache directory, or None to always solve.
+    
+    Returns:
+        int: Number of records written.
+    """
+    new_file = not os.path.exists(output) or os.path.getsize(output) == 0
+    first_id = 0 if new_file else last_id(output)
+    written = 0
+    with open(output, mode='a', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=BATCH_FIELDS)
+        if new_file:
+            writer.writeheader()
+        jobs = ((task, timeout, options, cache_dir) for task in tasks)
+        with multiprocessing.Pool(workers) as pool:
+            for record in pool.imap_unordered(_run_task_star, jobs, chunksize):
+                written += 1
+                record["ID"] = first_id + written
+                writer.writerow(record)
+                file.flush()
+                if progress:
+                    progress(record)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.batch", description="Run Knight's Tour solvers over a grid of boards and start squares.")
+    parser.add_argument("--sizes", default="8", help="board sizes, e.g. 8 or 6-12:2 or 6,8,30")
+    parser.add_argument("--rows", default="0", help="start rows (squares off the board are skipped)")
+    parser.add_argument("--cols", default="0", help="start columns (squares off the board are skipped)")
+    parser.add_argument("--algorithms", default="backtracking", help="comma-separated: backtracking, cultural, divide, closed")
+    parser.add_argument("--output", default="batch_results.csv", help="CSV file results are appended to")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=1, help="tasks sent to a worker at a time")
+    parser.add_argument("--timeout", type=float, default=None, help="per-task limit in seconds (needs SIGALRM, i.e. not Windows)")
+    parser.add_argument("--max-gens", type=int, default=None, help="generation limit for the cultural solvers")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the cultural solvers")
+    parser.add_argument("--cache-dir", default=".tour_cache", help="tour cache shared with the GUI")
+    parser.add_argument("--no-cache", action="store_true", help="always solve, ignoring the tour cache")
+    parser.add_argument("--quiet", action="store_true", help="do not print a line per finished run")
+    args = parser.parse_args(argv)
+
+    algorithms = [a.strip() for a in args.algorithms.split(",") if a.strip()]
+    unknown = [a for a in algorithms if a not in ALGORITHMS]
+    if unknown:
+        parser.error(f"unknown algorithm(s): {', '.join(unknown)}")
+    if "islands" in algorithms or "portfolio" in algorithms:
+        # Pool workers are daemon processes and cannot start processes of their own.
+        parser.error("'islands' and 'portfolio' run their own processes; use 'cultural' or 'backtracking' in batch sweeps")
+
+    cultural = {}
+    if args.max_gens is not None:
+        cultural["max_gens"] = args.max_gens
+    if args.seed is not None:
+        cultural["seed"] = args.seed
+    options = {"cultural": cultural}
+
+    tasks = build_tasks(parse_range(args.sizes), parse_range(args.rows), parse_range(args.cols), algorithms)
+
+    def report(record):
+        print(f"{record['Board']:>9} {record['Start']:>7} {record['Algorithm']:<28} {record['Time']:>10} {record['Result']:>11} {record['Success']:>3} {'(cached) ' if record['Cached'] == 'Yes' else ''}{record['Error']}")
+
+    cache_dir = None if args.no_cache else args.cache_dir
+    total = run_batch(tasks, args.output, args.workers, args.chunksize, args.timeout, options, None if args.quiet else report, cache_dir)
+    print(f"{total} runs written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
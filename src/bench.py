@@ -0,0 +1,360 @@
+"""
+Benchmark suite for the solvers.
+
+Runs a fixed matrix of board sizes, start squares and seeds. Each case is timed
+with perf_counter_ns after warmup runs. The report gives median and percentile
+timings, plus peak memory from one extra run under tracemalloc. Results can be
+saved as a baseline JSON. Later runs are compared against it and exit with
+status 1 when a case's median time or peak memory regresses past --threshold,
+or status 2 when there is no baseline to compare against.
+
+--startup instead times fresh interpreters starting the command-line mode
+and the GUI, checks them against STARTUP_TARGETS and checks that the
+command-line mode never imports the GUI's libraries.
+
+Example:
+    python -m src.bench --update-baseline          # record a baseline
+    python -m src.bench --threshold 0.15           # compare against it
+    python -m src.bench --filter backtracking --repeats 20
+    python -m src.bench --startup
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from src.backtracking import BacktrackingSolver
+from src.board import KNIGHT_MOVES
+from src.cultural import CulturalSolver
+from src.records import percentile
+
+# The fixed matrix. Every backtracking start here is solved by Warnsdorff
+# ordering without deep backtracking, so timings measure the search itself.
+BACKTRACKING_SIZES = [8, 16, 32, 60]
+BACKTRACKING_STARTS = [(0, 0), (1, 2), "centre"]
+GENOME_SIZES = [8, 16, 32]
+GENOME_SEEDS = [0, 1, 2]
+GENOME_BATCH = 200
+CULTURAL_SIZES = [6, 8]
+CULTURAL_SEEDS = [0, 1, 2]
+CULTURAL_GENS = 200
+
+# Start-up paths, timed from process launch until each is usable: the
+# command-line mode solving 8x8, and the GUI window drawn once (or only its
+# module imported when there is no display). Each snippet prints the
+# libraries in FORBIDDEN it loaded.
+FORBIDDEN = {"cli": ("tkinter", "matplotlib", "numpy"), "gui": ("matplotlib", "numpy")}
+STARTUP_SNIPPETS = {
+    "cli": "from src.__main__ import main; main(['--size', '8', '--format', 'summary', '--no-cache'])",
+    "gui": ("import tkinter as tk\n"
+            "from src.gui import KnightTourGUI\n"
+            "try:\n"
+            "    root = tk.Tk()\n"
+            "except tk.TclError:\n"
+            "    root = None\n"
+            "    print('no display: module import only')\n"
+            "if root is not None:\n"
+            "    KnightTourGUI(root)\n"
+            "    root.update()\n"
+            "    root.destroy()\n"),
+}
+STARTUP_TARGETS = {"cli": 0.15, "gui": 0.25}
+
+
+class Case:
+    """
+    One benchmark case: a name and a factory returning the callable to time.
+
+    The factory runs outside the timed region, so each repeat gets fresh
+    solver state without its construction being measured.
+    """
+
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+
+
+def resolve_start(start, n):
+    return (n // 2, n // 2) if start == "centre" else start
+
+
+def backtracking_cases():
+    for n in BACKTRACKING_SIZES:
+        for start in BACKTRACKING_STARTS:
+            x, y = resolve_start(start, n)
+
+            def factory(n=n, x=x, y=y):
+                solver = BacktrackingSolver(n)
+                return lambda: solver.run(x, y)
+
+            yield Case(f"backtracking/n={n}/start={x},{y}", factory)
+
+
+def genome_cases():
+    for n in GENOME_SIZES:
+        for seed in GENOME_SEEDS:
+            def evaluate_factory(n=n, seed=seed):
+                solver = CulturalSolver(n, seed=seed)
+                population = np.random.default_rng(seed).integers(0, 8, (GENOME_BATCH, n * n), dtype=np.int8)
+                return lambda: solver.evaluate(population, 0, 0)
+
+            yield Case(f"evaluate/n={n}/seed={seed}/batch={GENOME_BATCH}", evaluate_factory)
+
+            # One bred generation re-scored from its parents' walks, as every
+            # generation after the first is in a run.
+            def resume_factory(n=n, seed=seed):
+                solver = CulturalSolver(n, seed=seed)
+                population = np.random.default_rng(seed).integers(0, 8, (GENOME_BATCH, n * n), dtype=np.int8)
+                walks, visit_steps, scores = solver.start_state(population, 0, 0)
+                solver.belief_best_score = int(scores.max())
+                children, parents, first_changed = solver.breed(population, scores, int(np.argmax(scores)))
+                return lambda: solver.resume_state(children, parents, first_changed, walks, visit_steps, scores)
+
+            yield Case(f"resume_state/n={n}/seed={seed}/batch={GENOME_BATCH}", resume_factory)
+
+            def path_factory(n=n, seed=seed):
+                solver = CulturalSolver(n, seed=seed)
+                genome = np.random.default_rng(seed).integers(0, 8, n * n, dtype=np.int8)
+                return lambda: solver.genome_to_path(genome, 0, 0)
+
+            yield Case(f"genome_to_path/n={n}/seed={seed}", path_factory)
+
+        # A genome encoding a full tour walks all N^2 squares: the worst case.
+        path = BacktrackingSolver(n).run(0, 0)["path"]
+        moves = {move: i for i, move in enumerate(KNIGHT_MOVES)}
+        genome = np.zeros((1, n * n), dtype=np.int8)
+        genome[0, :-1] = [moves[(bx - ax, by - ay)] for (ax, ay), (bx, by) in zip(path, path[1:])]
+
+        def factory(n=n, genome=genome):
+            solver = CulturalSolver(n)
+            return lambda: solver.evaluate(genome, 0, 0)
+
+        yield Case(f"evaluate/n={n}/full-tour", factory)
+
+
+def cultural_cases():
+    for n in CULTURAL_SIZES:
+        for seed in CULTURAL_SEEDS:
+            def factory(n=n, seed=seed):
+                solver = CulturalSolver(n, max_gens=CULTURAL_GENS, seed=seed)
+                return lambda: solver.run(0, 0)
+
+            yield Case(f"cultural_run/n={n}/seed={seed}/gens={CULTURAL_GENS}", factory)
+
+
+def all_cases():
+    return [*backtracking_cases(), *genome_cases(), *cultural_cases()]
+
+
+def measure(case, warmup=2, repeats=10):
+    """
+    Times one case and records its peak traced memory.
+
+    The garbage collector is disabled around each timed call, as timeit does.
+    Peak memory comes from a separate, untimed run because tracemalloc slows
+    allocation-heavy code down considerably.
+
+    Returns:
+        dict: median/mean/min/max/p10/p90 in nanoseconds, the raw timings,
+        and peak_bytes.
+    """
+    for _ in range(warmup):
+        case.factory()()
+
+    timings = []
+    for _ in range(repeats):
+        fn = case.factory()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            started = time.perf_counter_ns()
+            fn()
+            timings.append(time.perf_counter_ns() - started)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    fn = case.factory()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    ordered = sorted(timings)
+    return {
+        "median_ns": percentile(ordered, 50),
+        "mean_ns": sum(ordered) // len(ordered),
+        "min_ns": ordered[0],
+        "max_ns": ordered[-1],
+        "p10_ns": percentile(ordered, 10),
+        "p90_ns": percentile(ordered, 90),
+        "timings_ns": timings,
+        "peak_bytes": peak,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Lists regressions of results against baseline.
+
+    A case regresses when its median time or peak memory exceeds the
+    baseline's by more than `threshold` (a fraction, 0.10 = 10%). Cases
+    missing from the baseline are not compared.
+
+    Returns:
+        list: (case name, metric, baseline value, new value) tuples.
+    """
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric in ("median_ns", "peak_bytes"):
+            if base[metric] and stats[metric] > base[metric] * (1 + threshold):
+                regressions.append((name, metric, base[metric], stats[metric]))
+    return regressions
+
+
+def measure_startup(path, repeats=5):
+    """
+    Times `repeats` fresh interpreters running one STARTUP_SNIPPETS entry.
+
+    Returns:
+        dict: median_s, min_s, max_s, the FORBIDDEN modules it loaded and
+        any note the snippet printed.
+    """
+    report = f"\nimport sys\nprint(','.join(m for m in {FORBIDDEN[path]!r} if m in sys.modules))"
+    command = [sys.executable, "-c", STARTUP_SNIPPETS[path] + report]
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        done = subprocess.run(command, capture_output=True, text=True, check=True)
+        timings.append(time.perf_counter() - started)
+    ordered = sorted(timings)
+    loaded = done.stdout.splitlines()
+    return {
+        "median_s": percentile(ordered, 50),
+        "min_s": ordered[0],
+        "max_s": ordered[-1],
+        "loaded": [m for m in (loaded[-1] if loaded else "").split(",") if m],
+        "note": " ".join(loaded[:-1]),
+    }
+
+
+def check_startup(repeats):
+    """
+    Prints the start-up timings and returns 1 if a target or import check fails.
+    """
+    failed = False
+    print(f"{'path':<5} {'median':>9} {'min':>9} {'max':>9} {'target':>9}  loaded")
+    for path, target in STARTUP_TARGETS.items():
+        stats = measure_startup(path, repeats)
+        slow = stats["median_s"] > target
+        failed |= slow or bool(stats["loaded"])
+        print(f"{path:<5} {stats['median_s']:>8.3f}s {stats['min_s']:>8.3f}s {stats['max_s']:>8.3f}s {target:>8.3f}s  "
+              f"{', '.join(stats['loaded']) or '-'}{'  SLOW' if slow else ''}{'  (' + stats['note'] + ')' if stats['note'] else ''}")
+    return 1 if failed else 0
+
+
+def format_ns(ns):
+    if ns >= 1_000_000_000:
+        return f"{ns / 1e9:.3f}s"
+    if ns >= 1_000_000:
+        return f"{ns / 1e6:.3f}ms"
+    return f"{ns / 1e3:.1f}us"
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        return json.load(file)["results"]
+
+
+def save_results(path, results, warmup, repeats):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "warmup": warmup,
+        "repeats": repeats,
+        "results": {name: {k: v for k, v in stats.items() if k != "timings_ns"} for name, stats in results.items()},
+    }
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.bench", description="Benchmark the Knight's Tour solvers against a stored baseline.")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed runs before timing each case")
+    parser.add_argument("--repeats", type=int, default=10, help="timed runs per case")
+    parser.add_argument("--baseline", default=os.path.join("benchmarks", "baseline.json"), help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed regression as a fraction of the baseline (default 0.10)")
+    parser.add_argument("--update-baseline", action="store_true", help="write this run's results as the new baseline")
+    parser.add_argument("--output", default=None, help="also write this run's results to a JSON file")
+    parser.add_argument("--list", action="store_true", help="list the case names and exit")
+    parser.add_argument("--startup", action="store_true", help="time the command-line and GUI start-up paths against their targets instead")
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        return check_startup(max(args.repeats // 2, 1))
+
+    cases = [case for case in all_cases() if args.filter in case.name]
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+
+    baseline = None
+    if not args.update_baseline:
+        baseline = load_baseline(args.baseline)
+        if baseline is None:
+            # Without a baseline nothing can regress, so passing would hide it.
+            parser.error(f"no baseline at {args.baseline}; run with --update-baseline to record one")
+    width = max(len(case.name) for case in cases)
+    print(f"{'case':<{width}} {'median':>10} {'p10':>10} {'p90':>10} {'peak mem':>10} {'vs base':>8}")
+
+    results = {}
+    for case in cases:
+        stats = measure(case, args.warmup, args.repeats)
+        results[case.name] = stats
+        change = ""
+        if baseline and case.name in baseline and baseline[case.name]["median_ns"]:
+            change = f"{stats['median_ns'] / baseline[case.name]['median_ns'] - 1:+.1%}"
+        print(f"{case.name:<{width}} {format_ns(stats['median_ns']):>10} {format_ns(stats['p10_ns']):>10} "
+              f"{format_ns(stats['p90_ns']):>10} {stats['peak_bytes'] / 1024:>8.0f}KB {change:>8}")
+
+    if args.output:
+        save_results(args.output, results, args.warmup, args.repeats)
+    if args.update_baseline:
+        save_results(args.baseline, results, args.warmup, args.repeats)
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, metric, old, new in regressions:
+        shown = (format_ns(old), format_ns(new)) if metric == "median_ns" else (f"{old / 1024:.0f}KB", f"{new / 1024:.0f}KB")
+        print(f"REGRESSION {name}: {metric} {shown[0]} -> {shown[1]} ({new / old - 1:+.1%})", file=sys.stderr)
+    if regressions:
+        return 1
+    print(f"no regressions beyond {args.threshold:.0%}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
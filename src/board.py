@@ -0,0 +1,117 @@
+from functools import cached_property, lru_cache
+
+# Knight move offsets, in the order the solvers have always tried them.
+KNIGHT_MOVES = [(2,1), (1,2), (-1,2), (-2,1), (-2,-1), (-1,-2), (1,-2), (2,-1)]
+
+
+class BoardGeometry:
+    """
+    Precomputed knight-move graph for an NxN board.
+    
+    Squares are addressed by flat index (x * n + y). The graph only depends on
+    N, so one instance is shared by every solver working on that size
+    (see get_geometry).
+    """
+
+    def __init__(self, n):
+        """
+        Build the neighbour lists for every square.
+        
+        Args:
+            n (int): The dimension of the chessboard (NxN).
+        """
+        self.n = n
+        self.size = n * n
+
+        # neighbours[sq] lists the flat indices one knight move away from sq,
+        # in KNIGHT_MOVES order.
+        self.neighbours = []
+        for x in range(n):
+            for y in range(n):
+                self.neighbours.append(tuple(
+                    (x + dx) * n + (y + dy)
+                    for dx, dy in KNIGHT_MOVES
+                    if 0 <= x + dx < n and 0 <= y + dy < n
+                ))
+        self.neighbours = tuple(self.neighbours)
+
+        # Bitboard layout for whole-board set operations: square (x, y) is bit
+        # x * (n + 2) + y. The two spare columns per row stop a +-2 column
+        # shift from wrapping onto the neighbouring row.
+        self.bit_shifts = tuple(dx * (n + 2) + dy for dx, dy in KNIGHT_MOVES)
+
+    @cached_property
+    def bits(self):
+        """
+        Single-square bitboards, indexed by flat square.
+        
+        Built on first use: only the connectivity checks need them, and the
+        table grows as O(N^4) bits, which plain searches on large boards
+        cannot afford.
+        """
+        width = self.n + 2
+        return tuple(1 << (x * width + y) for x in range(self.n) for y in range(self.n))
+
+    @cached_property
+    def all_bits(self):
+        """
+        Bitboard with every square of the board set.
+        """
+        row = (1 << self.n) - 1
+        width = self.n + 2
+        mask = 0
+        for x in range(self.n):
+            mask |= row << (x * width)
+        return mask
+
+    def index(self, x, y):
+        """
+        Flat index of square (x, y).
+        """
+        return x * self.n + y
+
+    def coords(self, square):
+        """
+        (x, y) coordinates of a flat square index.
+        """
+        return divmod(square, self.n)
+
+    def initial_degrees(self):
+        """
+        Fresh degree array for an empty board.
+        
+        Returns:
+            list: Number of onward moves from each square.
+        """
+        return [len(nbrs) for nbrs in self.neighbours]
+
+    def reachable(self, seed, allowed):
+        """
+        Flood-fills knight moves over a bitboard.
+        
+        Args:
+            seed (int): Bitboard of starting squares.
+            allowed (int): Bitboard of squares the fill may enter.
+        
+        Returns:
+            int: Bitboard of the allowed squares reachable from seed (seed
+            squares included when allowed).
+        """
+        reach = seed & allowed
+        frontier = reach
+        shifts = self.bit_shifts
+        while frontier:
+            spread = 0
+            for shift in shifts:
+                spread |= frontier << shift if shift > 0 else frontier >> -shift
+            frontier = spread & allowed & ~reach
+            reach |= frontier
+        return reach
+
+
+@lru_cache(maxsize=16)
+def get_geometry(n):
+    """
+    Returns the shared BoardGeometry for board size N.
+    """
+    return BoardGeometry(n)
@@ -0,0 +1,209 @@
+"""
+Solution cache shared by the GUI and headless tools.
+
+Tours are stored once per symmetry class of start squares: the 8 rotations
+and reflections of the board map a tour from one start square onto a tour
+from each of its images, so a single stored tour answers up to 8 starts.
+Entries live in an in-memory LRU tier, capped by the total number of squares
+it holds, backed on disk by one binary tour file (see src.tour) plus a small
+JSON file of run details per entry.
+
+The constructive solvers are not cached: they build a tour in less time than
+a cache entry takes to read.
+"""
+
+import json
+import os
+import sys
+import time
+from array import array
+from collections import OrderedDict
+
+from src.tour import TourPath, load_tour, save_tour
+
+# The 8 symmetries of an NxN board as (x, y, n) -> (x', y').
+SYMMETRIES = [
+    lambda x, y, n: (x, y),
+    lambda x, y, n: (y, n - 1 - x),
+    lambda x, y, n: (n - 1 - x, n - 1 - y),
+    lambda x, y, n: (n - 1 - y, x),
+    lambda x, y, n: (x, n - 1 - y),
+    lambda x, y, n: (n - 1 - x, y),
+    lambda x, y, n: (y, x),
+    lambda x, y, n: (n - 1 - y, n - 1 - x),
+]
+# INVERSE[t] undoes SYMMETRIES[t]: the rotations pair up, reflections are their own inverse.
+INVERSE = [0, 3, 2, 1, 4, 5, 6, 7]
+
+# Solvers that are never cached (registry names, see src.solvers).
+UNCACHED = ("divide", "closed")
+
+
+def canonical_start(n, x, y):
+    """
+    Picks the representative of (x, y)'s symmetry class.
+    
+    Returns:
+        tuple: (t, cx, cy) where SYMMETRIES[t] maps (x, y) to the smallest
+        square (cx, cy) in its class.
+    """
+    return min(((t,) + f(x, y, n) for t, f in enumerate(SYMMETRIES)), key=lambda e: (e[1], e[2], e[0]))
+
+
+def square_map(t, n):
+    """
+    SYMMETRIES[t] as a table over flat squares: entry x * n + y holds the
+    flat index of the image of (x, y).
+    
+    Every symmetry is affine, so each board row maps onto an arithmetic
+    progression and the table is built from ranges rather than per square.
+    """
+    f = SYMMETRIES[t]
+    table = array('I')
+    for x in range(n):
+        a, b = f(x, 0, n), f(x, 1, n)
+        first = a[0] * n + a[1]
+        step = (b[0] * n + b[1]) - first
+        table.extend(range(first, first + step * n, step) if n > 1 else (first,))
+    return table
+
+
+class TourCache:
+    """
+    Two-tier (memory LRU + disk) cache of successful tours.
+    
+    Only successful runs are stored: a valid tour stays valid whichever
+    solver options produced it, while a failed run says nothing about the
+    next attempt.
+    """
+
+    def __init__(self, directory=".tour_cache", capacity=4_000_000):
+        """
+        Args:
+            directory (str): Folder for the disk tier, or None for memory only.
+            capacity (int): Squares kept in memory, summed over all tours,
+                before the least recently used tours are dropped.
+        """
+        self.directory = directory
+        self.capacity = capacity
+        self.memory = OrderedDict()
+        self.memory_squares = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                "memory_entries": len(self.memory), "memory_squares": self.memory_squares}
+
+    def entry_path(self, key, ext=".json"):
+        return os.path.join(self.directory, key + ext)
+
+    def load(self, key):
+        """
+        Finds an entry in memory, then on disk (promoting it to memory).
+        
+        Returns:
+            dict: algorithm, time and the canonical tour's flat squares, or None.
+        """
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            return self.memory[key]
+        if self.directory is None:
+            return None
+        try:
+            with open(self.entry_path(key)) as file:
+                entry = json.load(file)
+            if "path" in entry:
+                # Entries written before the binary format kept the path inline.
+                squares = array('I', entry.pop("path"))
+            else:
+                squares = load_tour(self.entry_path(key, ".ktr")).squares
+        except (OSError, ValueError):
+            return None
+        entry["squares"] = squares
+        self.disk_hits += 1
+        self.remember(key, entry)
+        return entry
+
+    def remember(self, key, entry):
+        if key in self.memory:
+            self.memory_squares -= len(self.memory.pop(key)["squares"])
+        self.memory[key] = entry
+        self.memory_squares += len(entry["squares"])
+        while self.memory_squares > self.capacity and len(self.memory) > 1:
+            _, dropped = self.memory.popitem(last=False)
+            self.memory_squares -= len(dropped["squares"])
+
+    def get(self, algorithm, n, x, y):
+        """
+        Looks up a tour for `algorithm` on an NxN board from (x, y).
+        
+        Returns:
+            dict: A result dict with "cached": True, or None on a miss (and
+            always for UNCACHED solvers).
+        """
+        if algorithm in UNCACHED:
+            return None
+        lookup_start = time.perf_counter()
+        t, cx, cy = canonical_start(n, x, y)
+        entry = self.load(f"{algorithm}-{n}-{cx}-{cy}")
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        squares = entry["squares"]
+        if INVERSE[t]:
+            squares = array('I', map(square_map(INVERSE[t], n).__getitem__, squares))
+        path = TourPath(squares, n)
+        return {
+            "algorithm": entry["algorithm"],
+            "success": True,
+            "path": path,
+            "time": time.perf_counter() - lookup_start,
+            "steps": len(path),
+            "cached": True,
+            "solve_time": entry["time"]
+        }
+
+    def put(self, algorithm, n, x, y, res):
+        """
+        Stores a successful result under the canonical start of (x, y).
+        """
+        if not res.get("success") or algorithm in UNCACHED:
+            return
+        t, cx, cy = canonical_start(n, x, y)
+        path = res["path"]
+        squares = path.squares if isinstance(path, TourPath) else [px * n + py for px, py in path]
+        squares = array('I', map(square_map(t, n).__getitem__, squares) if t else squares)
+        entry = {"algorithm": res["algorithm"], "n": n, "start": [cx, cy], "time": res["time"]}
+        key = f"{algorithm}-{n}-{cx}-{cy}"
+        self.remember(key, dict(entry, squares=squares))
+
+        if self.directory is not None:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                # The tour goes first: an entry only counts once its JSON exists.
+                suffix = f".{os.getpid()}.tmp"
+                save_tour(self.entry_path(key, ".ktr") + suffix, TourPath(squares, n))
+                os.replace(self.entry_path(key, ".ktr") + suffix, self.entry_path(key, ".ktr"))
+                with open(self.entry_path(key) + suffix, "w") as file:
+                    json.dump(entry, file)
+                os.replace(self.entry_path(key) + suffix, self.entry_path(key))
+            except OSError as e:
+                print(f"Cache write failed: {e}", file=sys.stderr)
+
+    def solve(self, algorithm, n, x, y, compute):
+        """
+        Returns the cached tour if there is one, otherwise compute() and store it.
+        
+        Args:
+            algorithm (str): Cache namespace, normally the solver registry name.
+            compute: Zero-argument callable returning a solver result dict.
+        """
+        res = self.get(algorithm, n, x, y)
+        if res is None:
+            res = compute()
+            self.put(algorithm, n, x, y, res)
+        return res
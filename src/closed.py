@@ -0,0 +1,108 @@
+import time
+from array import array
+from functools import lru_cache
+
+from src.divide_conquer import DivideConquerSolver
+from src.tour import TourPath
+
+
+@lru_cache(maxsize=8)
+def closed_cycle(n):
+    """
+    Returns one closed (re-entrant) tour of an NxN board, computed once per N.
+    
+    Closed tours exist exactly for even N >= 6; they are built by
+    DivideConquerSolver in O(N^2).
+    
+    Returns:
+        tuple: (cycle, position) arrays, where cycle lists the flat squares in
+        tour order and position[sq] is sq's index in cycle; None if N has no
+        closed tour.
+    """
+    if n < 6 or n % 2:
+        return None
+    link_a, link_b = DivideConquerSolver(n).build_cycle()
+    total = n * n
+    cycle = array('i', bytes(4 * total))
+    position = array('i', bytes(4 * total))
+    prev, curr = -1, 0
+    for i in range(total):
+        cycle[i] = curr
+        position[curr] = i
+        nxt = link_a[curr]
+        if nxt == prev:
+            nxt = link_b[curr]
+        prev, curr = curr, nxt
+    return cycle, position
+
+
+class ClosedTourSolver:
+    """
+    Serves open tours from any start square by rotating one closed tour.
+    
+    Every square of a closed tour is a knight move from its successor and the
+    last square is a knight move from the first, so starting the cycle at any
+    square gives a valid tour from that square. After the per-N cycle is
+    built, a tour costs one O(N^2) copy and no search, which makes "a tour
+    from every start square" a cheap bulk operation (see tours()).
+    """
+
+    def __init__(self, n):
+        """
+        Initialize the solver with board size N.
+        
+        Args:
+            n (int): The dimension of the chessboard (NxN).
+        """
+        self.n = n
+        self.final_path = TourPath(array('i'), n)
+
+    def tour_squares(self, start_x, start_y):
+        """
+        Open tour from (start_x, start_y) as flat square indices.
+        
+        Returns:
+            array: N*N squares, or None if N has no closed tour.
+        """
+        cached = closed_cycle(self.n)
+        if cached is None:
+            return None
+        cycle, position = cached
+        i = position[start_x * self.n + start_y]
+        return cycle[i:] + cycle[:i]
+
+    def tours(self):
+        """
+        Yields ((x, y), squares) for every start square, in row-major order.
+        """
+        cached = closed_cycle(self.n)
+        if cached is None:
+            return
+        cycle, position = cached
+        for square in range(self.n * self.n):
+            i = position[square]
+            yield divmod(square, self.n), cycle[i:] + cycle[:i]
+
+    def run(self, start_x, start_y):
+        """
+        Executes the solver starting from a specific position.
+        
+        Returns:
+            dict: Contains algorithm name, success status, execution time, steps, and path.
+        """
+        start_time = time.perf_counter()
+
+        squares = self.tour_squares(start_x, start_y)
+        n = self.n
+        self.final_path = TourPath(array('i') if squares is None else squares, n)
+
+        end_time = time.perf_counter()
+
+        return {
+            "algorithm": "Closed Tour",
+            "success": squares is not None,
+            "path": self.final_path,
+            "time": end_time - start_time,
+            "steps": len(self.final_path),
+            "closed": squares is not None
+        }
@@ -1,93 +1,420 @@
-import random
 import time
 
+import numpy as np
+
+from src.board import KNIGHT_MOVES
+from src.tour import TourPath
+
+# Knight moves may step at most two squares past the edge, so a two-square
+# margin around the board is enough to catch every first step off it.
+MARGIN = 2
+
+# Visit-step value for squares a walk has not reached.
+UNVISITED = np.iinfo(np.int32).max
+
+
 class CulturalSolver:
     """
     Implements the Cultural Algorithm to solve the Knight's Tour problem.
     Utilizes Population Space for exploration and Belief Space for exploitation.
+    
+    The population is a (pop_size x N*N) integer array of move indices, so
+    fitness, selection and mutation each run as a handful of NumPy operations
+    per generation rather than a Python loop per genome.
+    
+    Each genome also carries its walk state: the squares of its path and the
+    step at which it visited each square. A child only differs from its parent
+    from the first mutated gene onward, so it inherits the parent's state and
+    is walked again from that gene only.
     """
 
-    def __init__(self, n, pop_size=150, max_gens=2000):
+    def __init__(self, n, pop_size=150, max_gens=2000, seed=None, progress=None, cancel=None):
+        """
+        Args:
+            n (int): The dimension of the chessboard (NxN).
+            pop_size (int): Genomes in the population.
+            max_gens (int): Generation limit.
+            seed: Seed for reproducible runs.
+            progress: Optional callable receiving {"generation", "best_score"}
+                dicts after every generation.
+            cancel: Optional Event-like object; run() stops once it is set.
+        """
         self.n = n
         self.pop_size = pop_size
         self.max_gens = max_gens
-        self.moves = [(2,1), (1,2), (-1,2), (-2,1), (-2,-1), (-1,-2), (1,-2), (2,-1)]
+        self.moves = KNIGHT_MOVES
+        self.rng = np.random.default_rng(seed)
+        self.progress = progress
+        self.cancel = cancel
+
+        # Squares are coded on a padded (N+4)x(N+4) grid so a move is a single
+        # integer offset and "on the board" is a table lookup.
+        width = n + 2 * MARGIN
+        self.padded_size = width * width
+        self.move_offsets = np.array([dx * width + dy for dx, dy in KNIGHT_MOVES], dtype=np.int32)
+        inside = np.zeros((width, width), dtype=bool)
+        inside[MARGIN:MARGIN + n, MARGIN:MARGIN + n] = True
+        self.inside = inside.ravel()
         
         
         self.belief_best_genome = [] 
         self.belief_best_score = 0
-        self.belief_best_path = []
+        self.belief_best_path = TourPath(np.empty(0, dtype=np.uint32), n)
+        self.population = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        Clears the run counters.
+        
+        eval_times[g] / breed_times[g] are the seconds spent scoring and
+        breeding generation g + 1; best_curve lists (generation, best score)
+        each time the belief-space best improves; evaluations counts genomes
+        scored and rewalked those actually walked (the rest reuse a parent).
+        """
+        self.stats = {
+            "generations": 0,
+            "evaluations": 0,
+            "rewalked": 0,
+            "eval_times": [],
+            "breed_times": [],
+            "best_curve": [],
+        }
 
     def genome_to_path(self, genome, start_x, start_y):
-        path = [(start_x, start_y)]
-        visited = {(start_x, start_y)}
-        curr_x, curr_y = start_x, start_y
+        """
+        Follows one genome from (start_x, start_y) up to its first illegal move.
         
-        for move_idx in genome:
-            dx, dy = self.moves[move_idx]
-            nx, ny = curr_x + dx, curr_y + dy
-            
-            if 0 <= nx < self.n and 0 <= ny < self.n and (nx, ny) not in visited:
-                curr_x, curr_y = nx, ny
-                path.append((nx, ny))
-                visited.add((nx, ny))
-            else:
-                break 
-        return path
+        The genome is walked as a one-row batch by the same masked walk that
+        evaluate() scores populations with.
+        
+        Returns:
+            list: The (x, y) squares of the path, start included.
+        """
+        population = np.asarray(genome, dtype=np.int8).reshape(1, -1)
+        walks, _, scores = self.start_state(population, start_x, start_y)
+        return list(self.walk_to_path(walks[0], scores[0]))
 
-    def run(self, start_x, start_y):
-        start_time = time.time()
+    def padded_square(self, x, y):
+        """
+        Index of square (x, y) on the padded grid used by evaluate().
+        """
+        return (x + MARGIN) * (self.n + 2 * MARGIN) + (y + MARGIN)
+
+    def walk_from(self, genes, origins, visit_steps, rows, resume):
+        """
+        Walks a batch of genome suffixes in one vectorized pass.
         
+        All moves are applied at once with a cumulative sum, which gives every
+        square of every walk as if nothing failed. A walk then ends at the
+        first square that is off the board, that was visited during the first
+        `resume` moves (looked up in `visit_steps`), or that repeats a square
+        of the suffix itself. Repeats are found by sorting each row of
+        (square, step) keys, which puts visits of the same square next to each
+        other in step order.
         
-        genome_len = self.n * self.n
-        population = [[random.randint(0, 7) for _ in range(genome_len)] for _ in range(self.pop_size)]
+        Args:
+            genes: (m, span) array of the moves from step `resume` onward.
+            origins: (m,) padded squares the knight stands on after `resume` moves.
+            visit_steps: Array of per-square visit steps for the prefixes.
+            rows: (m,) rows of `visit_steps` describing each walk's prefix.
+            resume: Number of moves already made before `genes`.
+        
+        Returns:
+            tuple: (m, span + 1) clipped squares starting at `origins`, and the
+            number of new squares each walk reaches before failing.
+        """
+        m, span = genes.shape
+        padded = self.padded_size
+        key_type = np.int32 if (padded + 2) * (span + 1) < 2 ** 31 else np.int64
 
-        for gen in range(1, self.max_gens + 1):
-            scored_population = []
-            
-            
-            for genome in population:
-                path = self.genome_to_path(genome, start_x, start_y)
-                score = len(path)
-                scored_population.append((score, genome))
-                
-                if score > self.belief_best_score:
-                    self.belief_best_score = score
-                    self.belief_best_path = path
-                    self.belief_best_genome = genome[:]
+        walk = np.empty((m, span + 1), dtype=key_type)
+        walk[:, 0] = origins
+        walk[:, 1:] = self.move_offsets.take(genes)
+        np.cumsum(walk, axis=1, out=walk)
+
+        # Squares after the first one off the board are meaningless; they are
+        # clipped onto the sentinel column and every walk is cut at that exit.
+        first_off = np.argmin(self.inside.take(walk, mode="clip"), axis=1)
+        first_off[first_off == 0] = span + 1
+        np.clip(walk, -1, padded, out=walk)
+        squares = walk[:, 1:]
+
+        prefix_hit = visit_steps[rows[:, None], squares] <= resume
+        first_hit = np.where(prefix_hit.any(axis=1), prefix_hit.argmax(axis=1) + 1, span + 1)
+
+        keys = squares * (span + 1)
+        keys += np.arange(1, span + 1, dtype=key_type)
+        keys.sort(axis=1)
+        keyed = keys // (span + 1)
+        keys -= keyed * (span + 1)
+        later = keys[:, 1:]
+        np.copyto(later, span + 1, where=keyed[:, 1:] != keyed[:, :-1])
+        first_repeat = later.min(axis=1) if span > 1 else span + 1
+
+        fail = np.minimum(np.minimum(first_off, first_hit), first_repeat)
+        return walk, fail - 1
+
+    def mark_steps(self, visit_steps, rows, walks, lo, hi, value=None):
+        """
+        Writes visit steps for walk squares lo..hi-1 of the given rows.
+        
+        Squares get their step number, or `value` when given (used to clear a
+        parent's squares that a child no longer shares).
+        """
+        cols = np.arange(lo, walks.shape[1])
+        rr, cc = np.nonzero(cols < hi[:, None])
+        rr = rows[rr]
+        cc = cc + lo
+        visit_steps[rr, walks[rr, cc]] = cc if value is None else value
+
+    def evaluate(self, population, start_x, start_y):
+        """
+        Scores every genome from scratch in one masked walk.
+        
+        Args:
+            population: (pop_size, N*N) array of move indices.
+            start_x, start_y: Starting position of the knight.
+        
+        Returns:
+            np.ndarray: Path length (fitness) of each genome.
+        """
+        pop = population.shape[0]
+        origin = self.padded_square(start_x, start_y)
+        visit_steps = np.full((1, self.padded_size + 1), UNVISITED, dtype=np.int32)
+        visit_steps[0, origin] = 0
+        _, reached = self.walk_from(population, np.full(pop, origin), visit_steps, np.zeros(pop, dtype=np.intp), 0)
+        return reached + 1
+
+    def start_state(self, population, start_x, start_y):
+        """
+        Walks the initial population from the start square.
+        
+        Returns:
+            tuple: (walks, visit_steps, scores). walks[i] holds genome i's path
+            as padded squares, visit_steps[i, sq] the step at which it reached
+            square sq (UNVISITED otherwise; the last column is a sentinel for
+            off-board squares), and scores[i] its path length.
+        """
+        pop, genome_len = population.shape
+        rows = np.arange(pop)
+        origin = self.padded_square(start_x, start_y)
+
+        visit_steps = np.full((pop, self.padded_size + 1), UNVISITED, dtype=np.int32)
+        visit_steps[:, origin] = 0
+        walks, reached = self.walk_from(population, np.full(pop, origin), visit_steps, rows, 0)
+        walks = walks.astype(np.int32)
+        scores = reached + 1
+        self.mark_steps(visit_steps, rows, walks, 1, scores)
+        return walks, visit_steps, scores
+
+    def resume_state(self, population, parents, first_changed, walks, visit_steps, scores):
+        """
+        Evaluates a bred population by reusing each parent's walk.
+        
+        A child whose first changed gene comes after its parent's failure
+        point has the parent's score. The rest are re-walked together from the
+        earliest changed gene among them, after the parent's squares beyond
+        that point are cleared from the inherited visit steps. The work
+        therefore grows with the mutated suffix, not with N*N.
+        
+        Returns:
+            tuple: (walks, visit_steps, scores) for the new population.
+        """
+        walks = walks[parents]
+        visit_steps = visit_steps[parents]
+        scores = scores[parents]
+
+        redo = np.flatnonzero(first_changed < scores)
+        if redo.size:
+            resume = int(first_changed[redo].min())
+            self.mark_steps(visit_steps, redo, walks, resume + 1, scores[redo], UNVISITED)
+
+            walk, reached = self.walk_from(population[redo, resume:], walks[redo, resume], visit_steps, redo, resume)
+            walks[redo, resume + 1:] = walk[:, 1:]
+            scores[redo] = resume + 1 + reached
+            self.mark_steps(visit_steps, redo, walks, resume + 1, scores[redo])
+        self.stats["rewalked"] += redo.size
+        return walks, visit_steps, scores
+
+    def walk_to_path(self, walk, score):
+        """
+        Converts the first `score` padded squares of a walk into a TourPath.
+        """
+        width = self.n + 2 * MARGIN
+        rows, cols = np.divmod(walk[:score], width)
+        return TourPath(((rows - MARGIN) * self.n + cols - MARGIN).astype(np.uint32), self.n)
+
+    def breed(self, population, scores, elite_row):
+        """
+        Builds the next generation from the top 30% and the belief space.
+        
+        Row 0 carries the belief-space best genome (elitism). Every other row
+        copies a random top performer and re-rolls each gene from its mutation
+        start onward with probability 0.2, where the mutation start sits up to
+        five genes before the belief-space failure point.
+        
+        Args:
+            elite_row: Row of `population` holding the belief-space best genome.
+        
+        Returns:
+            tuple: The new population, the parent row of each new genome, and
+            the index of each genome's first mutated gene (N*N if none).
+        """
+        rng = self.rng
+        pop_size, genome_len = population.shape
+
+        order = np.argsort(-scores, kind="stable")
+        top_rows = order[:int(self.pop_size * 0.3)]
+
+        parents = np.empty(pop_size, dtype=np.intp)
+        parents[0] = elite_row
+        parents[1:] = top_rows[rng.integers(0, len(top_rows), pop_size - 1)]
+        children = population[parents]
+        first_changed = np.full(pop_size, genome_len)
+
+        fail_idx = self.belief_best_score - 1
+        if fail_idx < genome_len:
+            # Only the tail from the earliest possible mutation start can
+            # change, so random draws are limited to those columns.
+            lo = max(0, fail_idx - 5)
+            tail = children[1:, lo:]
+            mutation_start = np.maximum(0, fail_idx - rng.integers(0, 6, pop_size - 1)) - lo
+            mask = np.arange(genome_len - lo) >= mutation_start[:, None]
+            mask &= rng.random(tail.shape) < 0.2
+            tail[mask] = rng.integers(0, 8, int(mask.sum()))
+            first_changed[1:] = np.where(mask.any(axis=1), mask.argmax(axis=1) + lo, genome_len)
+
+        return children, parents, first_changed
+
+    def iter_generations(self, population, start_x, start_y, generations):
+        """
+        Runs the generation loop on an existing population, as a generator.
+        
+        The belief-space best genome, if any, is put back into row 0 first, so
+        a solver can be resumed with a population or belief space it received
+        from elsewhere (see src/islands.py).
+        
+        Yields a {"event": "generation", "generation", "best_score"} dict
+        after each generation is scored, then a "solution" event (with the
+        path) if a full tour turns up. Timings and counters accumulate in
+        self.stats (see reset_stats). self.population always holds the
+        population the last event describes. The loop only advances while the
+        caller asks for events, so stopping early is just not asking again.
+        
+        Args:
+            population: (pop_size, N*N) array of move indices.
+            start_x, start_y: Starting position of the knight.
+            generations: Maximum number of generations to run.
+        """
+        if len(self.belief_best_genome):
+            population[0] = self.belief_best_genome
+        stats = self.stats
+        clock = time.perf_counter
+        started = clock()
+        walks, visit_steps, scores = self.start_state(population, start_x, start_y)
+        stats["rewalked"] += len(population)
+
+        for gen in range(1, generations + 1):
+            scored = clock()
+            stats["eval_times"].append(scored - started)
+            stats["evaluations"] += len(population)
+            stats["generations"] += 1
+            # Row 0 is the elite copy of the belief-space best genome.
+            elite_row = 0
+            best = int(np.argmax(scores))
+            if scores[best] > self.belief_best_score:
+                elite_row = best
+                self.belief_best_score = int(scores[best])
+                self.belief_best_genome = population[best].copy()
+                self.belief_best_path = self.walk_to_path(walks[best], self.belief_best_score)
+                stats["best_curve"].append((stats["generations"], self.belief_best_score))
             
+            self.population = population
+            yield {"event": "generation", "generation": gen, "best_score": self.belief_best_score}
             if self.belief_best_score == self.n * self.n:
-                break 
-            
-            
-            scored_population.sort(key=lambda x: x[0], reverse=True)
-            top_performers = [x[1] for x in scored_population[:int(self.pop_size * 0.3)]]
+                yield {"event": "solution", "generation": gen, "path": self.belief_best_path}
+                return
             
-            new_pop = [self.belief_best_genome[:]] # Elitism
-            
-            while len(new_pop) < self.pop_size:
-                parent = random.choice(top_performers)
-                child = parent[:]
-                
-                
-                fail_idx = self.belief_best_score - 1
-                if fail_idx < len(child):
-                    mutation_start = max(0, fail_idx - random.randint(0, 5))
-                    for k in range(mutation_start, len(child)):
-                        if random.random() < 0.2:
-                            child[k] = random.randint(0, 7)     
-                new_pop.append(child)
-            
-            population = new_pop
+            bred = clock()
+            population, parents, first_changed = self.breed(population, scores, elite_row)
+            started = clock()
+            stats["breed_times"].append(started - bred)
+            walks, visit_steps, scores = self.resume_state(population, parents, first_changed, walks, visit_steps, scores)
+
+    def evolve(self, population, start_x, start_y, generations, stop=None):
+        """
+        Consumes iter_generations, reporting each generation to the progress
+        callback.
+        
+        Args:
+            population: (pop_size, N*N) array of move indices.
+            start_x, start_y: Starting position of the knight.
+            generations: Maximum number of generations to run.
+            stop: Optional Event-like object; the loop ends once it is set.
+        
+        Returns:
+            tuple: The final population and the number of generations run.
+        """
+        gen = 0
+        self.population = population
+        for event in self.iter_generations(population, start_x, start_y, generations):
+            if event["event"] != "generation":
+                continue
+            gen = event["generation"]
+            if self.progress is not None:
+                self.progress(event)
+            if stop is not None and stop.is_set():
+                break
+        return self.population, gen
+
+    def iter_events(self, start_x, start_y):
+        """
+        Streams a full run from a fresh random population.
+        
+        Yields the events of iter_generations, ending with "solution" or,
+        once max_gens generations pass without a full tour, an "exhausted"
+        event carrying the best score reached.
+        """
+        genome_len = self.n * self.n
+        population = self.rng.integers(0, 8, (self.pop_size, genome_len), dtype=np.int8)
+        gen = 0
+        for event in self.iter_generations(population, start_x, start_y, self.max_gens):
+            yield event
+            if event["event"] == "solution":
+                return
+            gen = event["generation"]
+        yield {"event": "exhausted", "generation": gen, "best_score": self.belief_best_score}
+
+    def run(self, start_x, start_y):
+        start_time = time.perf_counter()
+        
+        cancelled = False
+        events = self.iter_events(start_x, start_y)
+        for event in events:
+            if event["event"] != "generation":
+                continue
+            if self.progress is not None:
+                self.progress(event)
+            if self.cancel is not None and self.cancel.is_set():
+                cancelled = True
+                events.close()
+                break
             
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         success = (self.belief_best_score == self.n * self.n)
+        stats = dict(self.stats)
+        stats["eval_time"] = sum(stats["eval_times"])
+        stats["breed_time"] = sum(stats["breed_times"])
+        stats["genomes_per_sec"] = stats["evaluations"] / stats["eval_time"] if stats["eval_time"] else 0.0
         
         return {
             "algorithm": "Cultural Algorithm",
             "success": success,
             "path": self.belief_best_path,
             "time": end_time - start_time,
-            "steps": len(self.belief_best_path)
-        }
\ No newline at end of file
+            "steps": len(self.belief_best_path),
+            "cancelled": cancelled and not success,
+            "stats": stats
+        }
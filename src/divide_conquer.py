@@ -0,0 +1,414 @@
+import time
+from array import array
+
+from src.board import KNIGHT_MOVES
+from src.tour import TourPath
+
+# Closed tours of the small boards the large board is tiled with, written as
+# the move index (into KNIGHT_MOVES) taken from each square of the cycle,
+# starting at the top-left corner. 8x6 is the transpose of 6x8. The odd x even
+# blocks surround the one odd x odd block of an odd board.
+BASE_TOURS = {
+    (6, 6): "120765274321667213456101472436570254",
+    (6, 8): "121075652743203170565431130764356102164236667244",
+    (8, 8): "1210705275653431216307065641634321270763365206355210652714705434",
+    (10, 10): "1212070765653425312127417070527565634342057070350130544116427125354175000143270544274361024706450544",
+    (5, 6): "120741654217143657033176530634",
+    (5, 8): "1742120756532127056447021245702365276634",
+    (7, 6): "120527417065430530521050056416321745712544",
+    (7, 8): "12107656343121630705654320660212464227703565712525521754",
+    (9, 6): "120527417076534305305210561005643002441676341207464244",
+    (9, 8): "121070630565434212061436561752470702366121345421667143014706347530763434",
+}
+
+# Sides of the odd block, smallest (cheapest to search) first.
+ODD_SIDES = (5, 7, 9)
+
+# Search budget for the open tour of one odd block. Layouts whose block
+# cannot be toured within it are skipped for the next candidate.
+BLOCK_NODE_LIMIT = 20000
+
+
+def base_cycle(h, w):
+    """
+    Decodes the stored closed tour of an h x w board.
+    
+    Returns:
+        list: (x, y) squares in cycle order.
+    """
+    if (h, w) not in BASE_TOURS:
+        return [(y, x) for x, y in base_cycle(w, h)]
+    x, y = 0, 0
+    cycle = []
+    for move in BASE_TOURS[(h, w)]:
+        cycle.append((x, y))
+        dx, dy = KNIGHT_MOVES[int(move)]
+        x, y = x + dx, y + dy
+    return cycle
+
+
+def split_side(n):
+    """
+    Splits a board side into block lengths of 6 and 8 (or a single 6/8/10 block).
+    
+    Returns:
+        list: Block lengths summing to n, or None if n cannot be tiled.
+    """
+    if n in (6, 8, 10):
+        return [n]
+    if n < 12 or n % 2:
+        return None
+    eights = n // 8
+    while (n - 8 * eights) % 6:
+        eights -= 1
+    return [8] * eights + [6] * ((n - 8 * eights) // 6)
+
+
+def even_split(m):
+    """
+    Splits an even length into 6 and 8 blocks (an empty list for 0). A 10
+    block is not used here, as there are no 10 x odd base tours.
+    
+    Returns:
+        list: Block lengths summing to m, or None if m cannot be tiled.
+    """
+    if m == 0:
+        return []
+    if m == 10:
+        return None
+    return split_side(m)
+
+
+def odd_splits(n, coord):
+    """
+    Yields the ways to split an odd board side into 6/8 blocks plus one odd
+    block (see ODD_SIDES) that covers `coord`.
+    
+    Yields:
+        tuple: (block lengths, index of the odd block).
+    """
+    for k in ODD_SIDES:
+        for p in range(max(0, coord - k + 1), min(coord, n - k) + 1):
+            before, after = even_split(p), even_split(n - k - p)
+            if before is not None and after is not None:
+                yield before + [k] + after, len(before)
+
+
+def block_tour(h, w, start, exits=None, limit=None):
+    """
+    Searches an open tour of an h x w block with Warnsdorff ordering.
+    
+    Args:
+        start (int): Local flat index (x * w + y) of the first square.
+        exits: Local squares the tour may end on (None = any square).
+        limit (int): Give up after this many nodes (None = exhaustive).
+    
+    Returns:
+        list: Local flat squares in tour order, or None if no tour was found.
+    """
+    total = h * w
+    neighbours = [
+        [(x + dx) * w + (y + dy) for dx, dy in KNIGHT_MOVES if 0 <= x + dx < h and 0 <= y + dy < w]
+        for x in range(h) for y in range(w)
+    ]
+    degree = [len(nbrs) for nbrs in neighbours]
+    visited = [False] * total
+    exits = set(range(total)) if exits is None else set(exits)
+    free_exits = [len(exits)]
+    path = []
+    nodes = [0]
+
+    def extend(square):
+        nodes[0] += 1
+        if limit is not None and nodes[0] > limit:
+            return False
+        visited[square] = True
+        path.append(square)
+        free_exits[0] -= square in exits
+        for nb in neighbours[square]:
+            degree[nb] -= 1
+        if len(path) == total:
+            if square in exits:
+                return True
+        elif free_exits[0]:
+            moves = [nb for nb in neighbours[square] if not visited[nb]]
+            # A move with no way out can only be the last square.
+            if len(path) == total - 1 or all(degree[nb] for nb in moves):
+                moves.sort(key=lambda nb: (degree[nb], nb not in exits))
+                for nb in moves:
+                    if extend(nb):
+                        return True
+        visited[square] = False
+        path.pop()
+        free_exits[0] += square in exits
+        for nb in neighbours[square]:
+            degree[nb] += 1
+        return False
+
+    return path if extend(start) else None
+
+
+def is_knight_move(a, b):
+    return sorted((abs(a[0] - b[0]), abs(a[1] - b[1]))) == [1, 2]
+
+
+_MERGE_PATTERNS = {}
+
+
+def merge_patterns(shape_a, shape_b, vertical):
+    """
+    Lists the ways two adjacent base tours can be spliced into one cycle.
+    
+    A splice removes edge (a1, a2) from block A and edge (b1, b2) from block B
+    and adds the knight moves a1-b1 and a2-b2. Coordinates are relative to the
+    top-left corner of A; B sits to the right of A, or below it if `vertical`.
+    The result only depends on the two block shapes, so it is cached.
+    
+    Returns:
+        list: (a1, a2, b1, b2) tuples of relative (x, y) squares.
+    """
+    key = (shape_a, shape_b, vertical)
+    if key in _MERGE_PATTERNS:
+        return _MERGE_PATTERNS[key]
+
+    (ha, wa), (hb, wb) = shape_a, shape_b
+    ox, oy = (ha, 0) if vertical else (0, wa)
+    axis = 0 if vertical else 1
+    boundary = ha if vertical else wa
+
+    def edges(cycle, shift, near):
+        found = []
+        for u, v in zip(cycle, cycle[1:] + cycle[:1]):
+            u, v = (u[0] + shift[0], u[1] + shift[1]), (v[0] + shift[0], v[1] + shift[1])
+            if near(u[axis]) and near(v[axis]):
+                found.append((u, v))
+        return found
+
+    a_edges = edges(base_cycle(ha, wa), (0, 0), lambda c: c >= boundary - 3)
+    b_edges = edges(base_cycle(hb, wb), (ox, oy), lambda c: c <= boundary + 2)
+
+    patterns = []
+    for a1, a2 in a_edges:
+        for b1, b2 in b_edges:
+            if is_knight_move(a1, b1) and is_knight_move(a2, b2):
+                patterns.append((a1, a2, b1, b2))
+            elif is_knight_move(a1, b2) and is_knight_move(a2, b1):
+                patterns.append((a1, a2, b2, b1))
+    _MERGE_PATTERNS[key] = patterns
+    return patterns
+
+
+class DivideConquerSolver:
+    """
+    Constructs a Knight's Tour directly instead of searching for one.
+    
+    In the spirit of Parberry's divide-and-conquer algorithm, the board is cut
+    into 6x6 to 8x8 blocks, each block is covered by a stored closed tour, and
+    neighbouring block tours are spliced together by swapping one pair of
+    edges across their shared border. Every square is touched a constant number
+    of times, so the tour is built in O(N^2) time and the cycle is kept in two
+    flat integer arrays.
+    
+    Odd boards have no closed tour, and an open tour must start on the
+    majority colour ((x + y) even), so other starts fail immediately. For the
+    rest, one side length 5, 7 or 9 is placed in both the row and column split
+    so that the odd x odd block holds the start square. That block gets an
+    open tour from the start (a small bounded search) ending next to a
+    neighbouring block, and the remaining blocks, which are all odd x even or
+    even x even, are spliced into one closed tour that the path continues
+    around. Boards too small to split (N < 13, apart from 6, 8, 10 and most
+    starts on 11) are searched directly.
+    """
+
+    def __init__(self, n):
+        """
+        Initialize the solver with board size N.
+        
+        Args:
+            n (int): The dimension of the chessboard (NxN).
+        """
+        self.n = n
+        self.sides = split_side(n)
+        self.final_path = TourPath(array('I'), n)
+
+    def build_cycle(self, rows=None, cols=None, skip=None):
+        """
+        Builds a closed tour of the whole board, or of every block but `skip`.
+        
+        Args:
+            rows, cols: Block lengths down and across (default: self.sides).
+            skip: (row, column) of a block left out of the cycle.
+        
+        Returns:
+            tuple: Two arrays holding the two cycle neighbours of every flat
+            square (zero for squares of the skipped block).
+        """
+        n = self.n
+        rows = self.sides if rows is None else rows
+        cols = self.sides if cols is None else cols
+        link_a = array('i', bytes(4 * n * n))
+        link_b = array('i', bytes(4 * n * n))
+
+        row_offsets, col_offsets = [0], [0]
+        for side in rows:
+            row_offsets.append(row_offsets[-1] + side)
+        for side in cols:
+            col_offsets.append(col_offsets[-1] + side)
+
+        # Lay every block's base tour onto the board.
+        layouts = {}
+        for bi in range(len(rows)):
+            for bj in range(len(cols)):
+                if (bi, bj) == skip:
+                    continue
+                shape = (rows[bi], cols[bj])
+                if shape not in layouts:
+                    cycle = base_cycle(*shape)
+                    local = [x * n + y for x, y in cycle]
+                    layouts[shape] = (local, local[1:] + local[:1], local[-1:] + local[:-1])
+                origin = row_offsets[bi] * n + col_offsets[bj]
+                for sq, nxt, prv in zip(*layouts[shape]):
+                    link_a[origin + sq] = origin + nxt
+                    link_b[origin + sq] = origin + prv
+
+        def has_edge(u, v):
+            return link_a[u] == v or link_b[u] == v
+
+        def relink(u, old, new):
+            if link_a[u] == old:
+                link_a[u] = new
+            else:
+                link_b[u] = new
+
+        def merge(bi, bj, vertical):
+            shape_a = (rows[bi], cols[bj])
+            shape_b = (rows[bi + vertical], cols[bj + (not vertical)])
+            ox, oy = row_offsets[bi], col_offsets[bj]
+            for a1, a2, b1, b2 in merge_patterns(shape_a, shape_b, vertical):
+                a1, a2, b1, b2 = [(x + ox) * n + (y + oy) for x, y in (a1, a2, b1, b2)]
+                if has_edge(a1, a2) and has_edge(b1, b2):
+                    relink(a1, a2, b1)
+                    relink(a2, a1, b2)
+                    relink(b1, b2, a1)
+                    relink(b2, b1, a2)
+                    return True
+            return False
+
+        # Join each row of blocks left to right, then stack the rows. A splice
+        # is only made between blocks whose cycles are still separate, so
+        # every splice joins two distinct cycles.
+        owner = list(range(len(rows) * len(cols)))
+
+        def find(block):
+            while owner[block] != block:
+                owner[block] = owner[owner[block]]
+                block = owner[block]
+            return block
+
+        pairs = [(bi, bj, False) for bi in range(len(rows)) for bj in range(len(cols) - 1)]
+        pairs += [(bi, bj, True) for bi in range(len(rows) - 1) for bj in range(len(cols))]
+        cycles = len(rows) * len(cols) - (skip is not None)
+        for bi, bj, vertical in pairs:
+            other = (bi + vertical, bj + (not vertical))
+            if skip in ((bi, bj), other):
+                continue
+            a, b = find(bi * len(cols) + bj), find(other[0] * len(cols) + other[1])
+            if a != b and merge(bi, bj, vertical):
+                owner[a] = b
+                cycles -= 1
+        if cycles != 1:
+            raise RuntimeError(f"Could not splice the block tours of a {n}x{n} board into one cycle")
+
+        return link_a, link_b
+
+    def odd_tour(self, start_x, start_y):
+        """
+        Builds an open tour of an odd board from a majority-colour square.
+        
+        Returns:
+            array: The flat squares in tour order, or None if no layout around
+            the start square worked (the caller then searches the whole board).
+        """
+        n = self.n
+        for rows, ri in odd_splits(n, start_x):
+            for cols, ci in odd_splits(n, start_y):
+                h, w = rows[ri], cols[ci]
+                ox, oy = sum(rows[:ri]), sum(cols[:ci])
+
+                # The block tour has to end two rows or columns from a side
+                # with another block behind it, so it can step into the cycle.
+                exits = [
+                    x * w + y for x in range(h) for y in range(w)
+                    if (ri > 0 and x < 2) or (ri < len(rows) - 1 and x >= h - 2)
+                    or (ci > 0 and y < 2) or (ci < len(cols) - 1 and y >= w - 2)
+                ]
+                local = block_tour(h, w, (start_x - ox) * w + (start_y - oy), exits, BLOCK_NODE_LIMIT)
+                if local is None:
+                    continue
+
+                squares = array('I', [0]) * (n * n)
+                for i, sq in enumerate(local):
+                    x, y = divmod(sq, w)
+                    squares[i] = (x + ox) * n + (y + oy)
+
+                ex, ey = divmod(squares[len(local) - 1], n)
+                for dx, dy in KNIGHT_MOVES:
+                    x, y = ex + dx, ey + dy
+                    if 0 <= x < n and 0 <= y < n and not (ox <= x < ox + h and oy <= y < oy + w):
+                        entry = x * n + y
+                        break
+
+                # Continue once around the cycle of the other blocks.
+                link_a, link_b = self.build_cycle(rows, cols, skip=(ri, ci))
+                prev, curr = -1, entry
+                for i in range(len(local), n * n):
+                    squares[i] = curr
+                    nxt = link_a[curr]
+                    if nxt == prev:
+                        nxt = link_b[curr]
+                    prev, curr = curr, nxt
+                return squares
+        return None
+
+    def run(self, start_x, start_y):
+        """
+        Executes the solver starting from a specific position.
+        
+        Returns:
+            dict: Contains algorithm name, success status, execution time, steps, and path.
+        """
+        start_time = time.perf_counter()
+
+        n = self.n
+        if self.sides is not None:
+            link_a, link_b = self.build_cycle()
+
+            # Walk the cycle once from the start square; this is an open tour.
+            squares = array('I', [0]) * (n * n)
+            prev, curr = -1, start_x * n + start_y
+            for i in range(n * n):
+                squares[i] = curr
+                nxt = link_a[curr]
+                if nxt == prev:
+                    nxt = link_b[curr]
+                prev, curr = curr, nxt
+        elif n % 2 and (start_x + start_y) % 2:
+            # A tour alternates colours and the majority colour has one square
+            # more, so it starts and ends there.
+            squares = None
+        else:
+            squares = self.odd_tour(start_x, start_y) if n % 2 else None
+            if squares is None:
+                local = block_tour(n, n, start_x * n + start_y)
+                squares = None if local is None else array('I', local)
+        self.final_path = TourPath(array('I') if squares is None else squares, n)
+
+        end_time = time.perf_counter()
+
+        return {
+            "algorithm": "Divide and Conquer",
+            "success": squares is not None,
+            "path": self.final_path,
+            "time": end_time - start_time,
+            "steps": len(self.final_path)
+        }
@@ -0,0 +1,375 @@
+"""
+Exhaustive enumeration and counting of knight's tours.
+
+TourEnumerator walks the whole search tree from a start square. It counts every
+open tour, and also the closed ones (last square a knight move from the
+start). Branches that cannot finish are pruned:
+- Dead ends. An unvisited square with no unvisited neighbours must be entered
+  next and be the last square. A square with a single unvisited neighbour can
+  only be the last square, so two such squares rule a branch out.
+- Connectivity. Every few levels, a bitboard flood fill checks that all
+  unvisited squares can still be reached from the knight.
+
+The tree is split at `split_depth` into one job per path prefix, and the
+jobs are counted in a process pool. Finished jobs are appended to a JSON-lines
+checkpoint, so an interrupted count resumes with only the unfinished jobs.
+
+Example:
+    python -m src.enumeration --size 5 --start 0,0
+    python -m src.enumeration --size 6 --all-starts --split-depth 8 \\
+        --workers 8 --checkpoint counts6.jsonl
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from array import array
+
+from src.board import get_geometry
+from src.cache import canonical_start
+from src.tour import TourPath
+
+# One enumerator per worker process, keyed by its settings.
+_enumerators = {}
+
+
+class TourEnumerator:
+    """
+    Counts or lists every knight's tour from a start square.
+    """
+
+    def __init__(self, n, closed_only=False, split_depth=6, workers=None, checkpoint=None,
+                 connectivity_interval=3, progress=None):
+        """
+        Args:
+            n (int): The dimension of the chessboard (NxN).
+            closed_only (bool): Only count closed tours (prunes branches that
+                can no longer return next to the start).
+            split_depth (int): Moves fixed by each parallel job's prefix.
+            workers (int): Pool processes; 1 counts in this process.
+            checkpoint (str): JSON-lines file for finished jobs, or None.
+            connectivity_interval (int): Run the flood-fill check every this
+                many levels (0 disables it).
+            progress: Optional callable receiving a dict per finished job.
+        """
+        self.n = n
+        self.geometry = get_geometry(n)
+        self.closed_only = closed_only
+        self.split_depth = split_depth
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.connectivity_interval = connectivity_interval
+        self.progress = progress
+
+    def search(self, prefix, limit=None, on_leaf=None):
+        """
+        Depth-first search below a path prefix with all pruning applied.
+
+        With on_leaf None this is the count-only fast path: no path is kept,
+        and only the counters are updated. Otherwise on_leaf(path, closed)
+        is called for every complete tour, and for every partial path that
+        reaches `limit` squares.
+
+        Args:
+            prefix: Flat squares already visited, starting square first.
+            limit (int): Stop at paths of this many squares, or None.
+            on_leaf: Optional callable(path list, closed flag).
+
+        Returns:
+            tuple: (tours, closed tours, nodes expanded).
+        """
+        geometry = self.geometry
+        total = geometry.size
+        neighbours = geometry.neighbours
+        bits = geometry.bits
+        reachable = geometry.reachable
+        interval = self.connectivity_interval
+        closed_only = self.closed_only
+        degree = geometry.initial_degrees()
+        start = prefix[0]
+        start_ring = set(neighbours[start])
+        path = list(prefix)
+        counts = [0, 0, 0]
+
+        unvisited = geometry.all_bits
+        for square in prefix:
+            unvisited &= ~bits[square]
+            for nb in neighbours[square]:
+                degree[nb] -= 1
+
+        def extend(prev, cur, unvisited, remaining, end):
+            counts[2] += 1
+            if remaining == 0:
+                closed = cur in start_ring
+                if closed or not closed_only:
+                    counts[0] += 1
+                    counts[1] += closed
+                    if on_leaf is not None:
+                        on_leaf(path, closed)
+                return
+            if on_leaf is not None and len(path) == limit:
+                on_leaf(path, False)
+                return
+
+            # Squares next to the previous square just lost it as a way in.
+            if prev is not None:
+                for u in neighbours[prev]:
+                    if unvisited & bits[u]:
+                        d = degree[u]
+                        if d == 0:
+                            return
+                        if d == 1:
+                            if end is not None and end != u and unvisited & bits[end]:
+                                return
+                            end = u
+            if closed_only:
+                if degree[start] == 0 or (end is not None and end not in start_ring):
+                    return
+
+            # A neighbour with no other way out must be the final square.
+            moves = []
+            for u in neighbours[cur]:
+                if unvisited & bits[u]:
+                    if degree[u] == 0:
+                        if remaining > 1:
+                            return
+                    moves.append(u)
+            if not moves:
+                return
+
+            if interval and len(path) % interval == 0 and remaining > 4:
+                allowed = unvisited | bits[cur]
+                if reachable(bits[cur], allowed) != allowed:
+                    return
+
+            for u in moves:
+                for nb in neighbours[u]:
+                    degree[nb] -= 1
+                path.append(u)
+                extend(cur, u, unvisited & ~bits[u], remaining - 1, end)
+                path.pop()
+                for nb in neighbours[u]:
+                    degree[nb] += 1
+
+        prev = prefix[-2] if len(prefix) > 1 else None
+        extend(prev, prefix[-1], unvisited, total - len(prefix), None)
+        return counts[0], counts[1], counts[2]
+
+    def count_from(self, prefix):
+        """
+        Count-only search of the subtree below one prefix.
+        """
+        return self.search(prefix)
+
+    def prefixes(self, start_x, start_y):
+        """
+        Splits the tree at split_depth into job prefixes.
+
+        Returns:
+            list: Tuples of flat squares (split_depth + 1 long, or shorter if
+            they already form complete tours).
+        """
+        jobs = []
+        start = start_x * self.n + start_y
+        self.search((start,), limit=self.split_depth + 1, on_leaf=lambda path, closed: jobs.append(tuple(path)))
+        return jobs
+
+    def tours(self, start_x, start_y):
+        """
+        Lists every tour from (x, y), serially.
+
+        Returns:
+            list: A TourPath per tour.
+        """
+        found = []
+        n = self.n
+        start = start_x * n + start_y
+        self.search((start,), limit=n * n + 1, on_leaf=lambda path, closed: found.append(TourPath(array('I', path), n)))
+        return found
+
+    # --- Checkpoints ---
+    def header(self):
+        return {"n": self.n, "split_depth": self.split_depth, "closed_only": self.closed_only}
+
+    def load_checkpoint(self):
+        """
+        Reads finished jobs from the checkpoint file.
+
+        Returns:
+            dict: (start, prefix) -> (tours, closed, nodes).
+        """
+        done = {}
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return done
+        with open(self.checkpoint) as file:
+            lines = file.read().splitlines()
+        if not lines:
+            return done
+        if json.loads(lines[0]) != self.header():
+            raise ValueError(f"{self.checkpoint} was written with different settings: {lines[0]}")
+        for line in lines[1:]:
+            try:
+                job = json.loads(line)
+            except ValueError:
+                # A line cut short by the interruption; that job is redone.
+                continue
+            done[(tuple(job["start"]), tuple(job["prefix"]))] = (job["tours"], job["closed"], job["nodes"])
+        return done
+
+    def open_checkpoint(self):
+        if self.checkpoint is None:
+            return None
+        fresh = not os.path.exists(self.checkpoint) or os.path.getsize(self.checkpoint) == 0
+        if not fresh:
+            with open(self.checkpoint, "rb") as file:
+                file.seek(-1, os.SEEK_END)
+                cut_short = file.read(1) != b"\n"
+        file = open(self.checkpoint, "a")
+        if fresh:
+            file.write(json.dumps(self.header()) + "\n")
+        elif cut_short:
+            # Keep the next job off the line left unfinished by an interruption.
+            file.write("\n")
+        file.flush()
+        return file
+
+    # --- Counting ---
+    def count(self, starts):
+        """
+        Counts the tours from each start square, resuming from the checkpoint.
+
+        Args:
+            starts: Iterable of (x, y) start squares.
+
+        Returns:
+            dict: Per-start and overall tour counts, node totals, job counts
+            and elapsed time.
+        """
+        started = time.perf_counter()
+        starts = [tuple(start) for start in starts]
+        done = self.load_checkpoint()
+        resumed = 0
+        jobs = []
+        for start in starts:
+            for prefix in self.prefixes(*start):
+                if (start, prefix) in done:
+                    resumed += 1
+                else:
+                    jobs.append((start, prefix))
+
+        settings = (self.n, self.closed_only, self.split_depth, self.connectivity_interval)
+        checkpoint = self.open_checkpoint()
+        try:
+            if self.workers == 1:
+                results = (_count_job((settings, start, prefix)) for start, prefix in jobs)
+                for result in results:
+                    self.record(result, done, checkpoint)
+            else:
+                with multiprocessing.Pool(self.workers) as pool:
+                    tasks = [(settings, start, prefix) for start, prefix in jobs]
+                    chunksize = max(1, len(tasks) // (16 * (self.workers or os.cpu_count() or 1)))
+                    for result in pool.imap_unordered(_count_job, tasks, chunksize):
+                        self.record(result, done, checkpoint)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+        per_start = {start: [0, 0, 0] for start in starts}
+        for (start, _), (tours, closed, nodes) in done.items():
+            if start in per_start:
+                totals = per_start[start]
+                totals[0] += tours
+                totals[1] += closed
+                totals[2] += nodes
+        return {
+            "n": self.n,
+            "closed_only": self.closed_only,
+            "starts": {start: {"tours": t, "closed": c, "nodes": nd} for start, (t, c, nd) in per_start.items()},
+            "tours": sum(t for t, _, _ in per_start.values()),
+            "closed": sum(c for _, c, _ in per_start.values()),
+            "nodes": sum(nd for _, _, nd in per_start.values()),
+            "jobs": len(jobs) + resumed,
+            "resumed_jobs": resumed,
+            "time": time.perf_counter() - started,
+        }
+
+    def record(self, result, done, checkpoint):
+        start, prefix, tours, closed, nodes = result
+        done[(start, prefix)] = (tours, closed, nodes)
+        if checkpoint is not None:
+            checkpoint.write(json.dumps({"start": start, "prefix": prefix, "tours": tours, "closed": closed, "nodes": nodes}) + "\n")
+            checkpoint.flush()
+        if self.progress is not None:
+            self.progress({"start": start, "prefix": prefix, "tours": tours, "nodes": nodes, "finished": len(done)})
+
+
+def _count_job(task):
+    settings, start, prefix = task
+    enumerator = _enumerators.get(settings)
+    if enumerator is None:
+        n, closed_only, split_depth, interval = settings
+        enumerator = _enumerators[settings] = TourEnumerator(n, closed_only, split_depth, connectivity_interval=interval)
+    return (start, prefix) + enumerator.count_from(prefix)
+
+
+def symmetry_classes(n):
+    """
+    Groups the squares of an NxN board by the 8 board symmetries.
+
+    Returns:
+        dict: Canonical (x, y) -> number of squares in its class.
+    """
+    classes = {}
+    for x in range(n):
+        for y in range(n):
+            _, cx, cy = canonical_start(n, x, y)
+            classes[(cx, cy)] = classes.get((cx, cy), 0) + 1
+    return classes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.enumeration", description="Count every knight's tour on a small board.")
+    parser.add_argument("--size", type=int, default=5, help="board size N")
+    parser.add_argument("--start", default="0,0", help="start square as row,col")
+    parser.add_argument("--all-starts", action="store_true", help="count from every square (one start per symmetry class)")
+    parser.add_argument("--closed-only", action="store_true", help="only count closed tours")
+    parser.add_argument("--split-depth", type=int, default=6, help="moves fixed by each parallel job")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count; 1 runs serially)")
+    parser.add_argument("--checkpoint", default=None, help="JSON-lines file of finished jobs, used to resume")
+    parser.add_argument("--connectivity-interval", type=int, default=3, help="flood-fill check every K levels (0 disables)")
+    parser.add_argument("--quiet", action="store_true", help="do not report finished jobs")
+    args = parser.parse_args(argv)
+
+    n = args.size
+    if args.all_starts:
+        classes = symmetry_classes(n)
+    else:
+        x, y = (int(v) for v in args.start.split(","))
+        if not (0 <= x < n and 0 <= y < n):
+            parser.error("start square is off the board")
+        classes = {(x, y): 1}
+
+    def report(event):
+        print(f"\rjobs finished: {event['finished']}", end="", file=sys.stderr, flush=True)
+
+    enumerator = TourEnumerator(n, args.closed_only, args.split_depth, args.workers, args.checkpoint,
+                                args.connectivity_interval, None if args.quiet else report)
+    res = enumerator.count(classes)
+    if not args.quiet:
+        print(file=sys.stderr)
+
+    for (x, y), stats in sorted(res["starts"].items()):
+        weight = f" x{classes[(x, y)]}" if args.all_starts else ""
+        print(f"start ({x},{y}){weight}: {stats['tours']} tours, {stats['closed']} closed, {stats['nodes']:,} nodes")
+    if args.all_starts:
+        tours = sum(stats["tours"] * classes[start] for start, stats in res["starts"].items())
+        closed = sum(stats["closed"] * classes[start] for start, stats in res["starts"].items())
+        print(f"all {n * n} starts: {tours} tours, {closed} closed")
+    print(f"{res['jobs']} jobs ({res['resumed_jobs']} from checkpoint), {res['nodes']:,} nodes, {res['time']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
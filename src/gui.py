@@ -1,16 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, Toplevel
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.patches as patches
 import time
-import csv
-import os
-from datetime import datetime
+import queue
+import threading
 
-# Import Solvers
-from src.backtracking import BacktrackingSolver
-from src.cultural import CulturalSolver
+from src.cache import TourCache
+from src.history import HISTORY_FIELDS, HistoryStore
+from src.profiling import maybe_profile
+from src.records import work_done
+from src.solvers import create_solver
+
+# Matplotlib, NumPy and the solver modules are imported on first use (see
+# ensure_plot and src.solvers), so the window opens before they load.
+
+# Radio-button values -> solver registry names (used as cache namespaces).
+SOLVER_KEYS = {"Backtracking": "backtracking", "Cultural": "cultural", "DivideConquer": "divide", "Portfolio": "portfolio"}
+
+# Seconds the portfolio race gets before the longest path so far is taken.
+PORTFOLIO_BUDGET = 10.0
 
 class KnightTourGUI:
     """
@@ -22,11 +29,21 @@ class KnightTourGUI:
         self.root.title("♟️ Knight's Tour Solver - Group 53")
         self.root.geometry("1150x800")
         
-        # Initialize History Data
+        # Background solve state (see start_job)
+        self.cancel_event = None
+        self.job_queue = None
+        self.on_job_done = None
+        self.animation = None
+
+        # Solved tours, reused across runs and symmetric start squares
+        self.cache = TourCache()
+
+        # History Data, opened on first use (see the history property)
         self.csv_filename = "knights_tour_results.csv"
-        self.history = [] 
-        self.initialize_csv() 
-        self.load_history_from_csv()
+        self.history_filename = "knights_tour_results.db"
+        self._history = None
+        self.flush_pending = False
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Styling Setup
         self.style = ttk.Style()
@@ -78,6 +95,8 @@ class KnightTourGUI:
         self.style.configure("TRadiobutton", background=self.panel_color, foreground="white", font=("Segoe UI", 10))
         ttk.Radiobutton(self.sidebar, text="Backtracking (Exact)", variable=self.algo_var, value="Backtracking").pack(anchor="w", padx=25)
         ttk.Radiobutton(self.sidebar, text="Cultural Algorithm (AI)", variable=self.algo_var, value="Cultural").pack(anchor="w", padx=25)
+        ttk.Radiobutton(self.sidebar, text="Divide & Conquer (Large N)", variable=self.algo_var, value="DivideConquer").pack(anchor="w", padx=25)
+        ttk.Radiobutton(self.sidebar, text=f"Portfolio Race ({PORTFOLIO_BUDGET:.0f}s budget)", variable=self.algo_var, value="Portfolio").pack(anchor="w", padx=25)
 
         # --- Action Buttons ---
         btn_frame = ttk.Frame(self.sidebar, style="Control.TFrame")
@@ -89,6 +108,9 @@ class KnightTourGUI:
         self.compare_btn = tk.Button(btn_frame, text="📊 COMPARE LAST TWO", bg="#2980b9", fg="white", font=("Segoe UI", 10, "bold"), bd=0, padx=10, pady=8, cursor="hand2", command=self.run_comparison)
         self.compare_btn.pack(fill=tk.X, pady=5)
 
+        self.cancel_btn = tk.Button(btn_frame, text="⏹ CANCEL", bg="#7f8c8d", fg="white", font=("Segoe UI", 10, "bold"), bd=0, padx=10, pady=8, cursor="hand2", state=tk.DISABLED, command=self.cancel_job)
+        self.cancel_btn.pack(fill=tk.X, pady=5)
+
         self.hist_btn = tk.Button(btn_frame, text="📜 VIEW ALL HISTORY", bg="#f39c12", fg="white", font=("Segoe UI", 10, "bold"), bd=0, padx=10, pady=10, cursor="hand2", command=self.view_full_history)
         self.hist_btn.pack(fill=tk.X, pady=10)
 
@@ -96,7 +118,7 @@ class KnightTourGUI:
         self.clear_btn.pack(fill=tk.X, pady=5)
 
         # --- Status Bar ---
-        self.status_var = tk.StringVar(value=f"Loaded {len(self.history)} records.")
+        self.status_var = tk.StringVar(value="Ready.")
         self.status_bar = tk.Label(self.sidebar, textvariable=self.status_var, bg="#1a252f", fg="#f39c12", font=("Consolas", 11, "bold"), pady=15, wraplength=300)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
@@ -104,32 +126,28 @@ class KnightTourGUI:
         self.plot_area = ttk.Frame(root, style="TFrame")
         self.plot_area.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=15, pady=15)
 
-        self.figure, self.ax = plt.subplots(figsize=(6, 6))
-        self.figure.patch.set_facecolor(self.bg_color)
-        self.canvas = FigureCanvasTkAgg(self.figure, master=self.plot_area)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        self.ax.axis('off')
-        self.canvas.draw()
-
-    # --- CSV HANDLING (LOAD & SAVE) ---
-    def initialize_csv(self):
-        if not os.path.exists(self.csv_filename):
-            try:
-                with open(self.csv_filename, mode='w', newline='') as file:
-                    writer = csv.writer(file)
-                    writer.writerow(["ID", "Timestamp", "Board", "Algorithm", "Time", "Result", "Success"])
-            except Exception as e:
-                messagebox.showerror("CSV Error", f"Could not create file: {e}")
-
-    def load_history_from_csv(self):
-        if os.path.exists(self.csv_filename):
-            try:
-                with open(self.csv_filename, mode='r') as file:
-                    reader = csv.DictReader(file)
-                    for row in reader:
-                        self.history.append(row)
-            except Exception as e:
-                print(f"Error loading: {e}")
+        # The board canvas is created by ensure_plot when first drawn.
+        self.figure = self.ax = self.canvas = None
+        self.placeholder = ttk.Label(self.plot_area, text="The board appears here after the first run.", style="TLabel",
+                                     background=self.bg_color, foreground="#7f8c8d", anchor="center")
+        self.placeholder.pack(fill=tk.BOTH, expand=True)
+
+    # --- HISTORY (SQLite, see src/history.py) ---
+    @property
+    def history(self):
+        """
+        The history store, opened on first use; the CSV of older versions is
+        imported then, once.
+        """
+        if self._history is None:
+            self._history = HistoryStore(self.history_filename)
+            self._history.import_csv(self.csv_filename)
+        return self._history
+
+    def on_close(self):
+        if self._history is not None:
+            self._history.close()
+        self.root.destroy()
 
     def create_spinbox(self, label, min_val, max_val, default):
         f = ttk.Frame(self.sidebar, style="Control.TFrame")
@@ -152,100 +170,236 @@ class KnightTourGUI:
             return None
 
     def log_result(self, res, n, r, c):
-        record = {
-            "ID": len(self.history) + 1,
-            "Timestamp": datetime.now().strftime("%H:%M:%S"),
-            "Board": f"{n}x{n}",
-            "Algorithm": res['algorithm'],
-            "Time": f"{res['time']:.4f}s",
-            "Result": f"{res['steps']}/{n*n}",
-            "Success": "Yes" if res['success'] else "No"
-        }
-        self.history.append(record)
+        """
+        Buffers a run in the history store; runs logged close together are
+        committed in one transaction shortly afterwards.
+        """
+        self.history.add(res, n)
+        if not self.flush_pending:
+            self.flush_pending = True
+            self.root.after(1000, self.flush_history)
+
+    def flush_history(self):
+        self.flush_pending = False
         try:
-            with open(self.csv_filename, mode='a', newline='') as file:
-                writer = csv.DictWriter(file, fieldnames=record.keys())
-                writer.writerow(record)
+            self.history.flush()
         except Exception as e:
             print(f"Auto-save failed: {e}")
 
     # --- View Full History Window ---
+    HISTORY_PAGE = 200
+
     def view_full_history(self):
-        if not self.history:
+        """
+        Opens a paged history browser.
+        
+        Only one page of rows is fetched at a time. The filters and column
+        sorting (click a heading) are applied by SQLite.
+        """
+        total = self.history.count()
+        if not total:
             messagebox.showinfo("Info", "History is empty.")
             return
 
         win = Toplevel(self.root)
-        win.title("📜 Complete Session History")
-        win.geometry("750x450")
-        
-        cols = ("ID", "Timestamp", "Board", "Algorithm", "Time", "Result", "Success")
+        win.title(f"📜 Complete History ({total} runs)")
+        win.geometry("900x500")
+        view = {"offset": 0, "sort": "ID", "descending": True}
+
+        filters = ttk.Frame(win)
+        filters.pack(fill=tk.X, padx=5, pady=5)
+        board_var = tk.StringVar(value="All")
+        algo_var = tk.StringVar(value="All")
+        success_var = tk.StringVar(value="All")
+        for label, var, values in (
+            ("Board:", board_var, ["All"] + [f"{n}x{n}" for n in self.history.boards()]),
+            ("Algorithm:", algo_var, ["All"] + self.history.algorithms()),
+            ("Success:", success_var, ["All", "Yes", "No"]),
+        ):
+            tk.Label(filters, text=label).pack(side=tk.LEFT, padx=(8, 2))
+            combo = ttk.Combobox(filters, textvariable=var, values=values, state="readonly", width=18 if var is algo_var else 8)
+            combo.pack(side=tk.LEFT)
+            combo.bind("<<ComboboxSelected>>", lambda e: show(0))
+
+        nav = ttk.Frame(win)
+        nav.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
+        page_var = tk.StringVar()
+        prev_btn = tk.Button(nav, text="◀ Prev", command=lambda: show(view["offset"] - self.HISTORY_PAGE))
+        prev_btn.pack(side=tk.LEFT)
+        next_btn = tk.Button(nav, text="Next ▶", command=lambda: show(view["offset"] + self.HISTORY_PAGE))
+        next_btn.pack(side=tk.RIGHT)
+        tk.Label(nav, textvariable=page_var).pack()
+
+        cols = tuple(HISTORY_FIELDS)
         tree = ttk.Treeview(win, columns=cols, show='headings')
         
+        def sort_by(col):
+            view["descending"] = not view["descending"] if view["sort"] == col else False
+            view["sort"] = col
+            show(0)
+
         for col in cols:
-            tree.heading(col, text=col)
+            tree.heading(col, text=col, command=lambda col=col: sort_by(col))
             tree.column(col, width=95, anchor="center")
-        
-        for row in self.history:
-            tree.insert("", "end", values=(row["ID"], row["Timestamp"], row["Board"], row["Algorithm"], row["Time"], row["Result"], row["Success"]))
-            
+
+        def selected():
+            board, algo, success = board_var.get(), algo_var.get(), success_var.get()
+            return {
+                "n": None if board == "All" else int(board.split("x")[0]),
+                "algorithm": None if algo == "All" else algo,
+                "success": None if success == "All" else success == "Yes",
+            }
+
+        def show(offset):
+            query = selected()
+            matching = self.history.count(**query)
+            offset = max(0, min(offset, (matching - 1) // self.HISTORY_PAGE * self.HISTORY_PAGE))
+            view["offset"] = offset
+            rows = self.history.page(offset, self.HISTORY_PAGE, sort=view["sort"], descending=view["descending"], **query)
+            tree.delete(*tree.get_children())
+            for row in rows:
+                tree.insert("", "end", values=[row[col] for col in cols])
+            for col in cols:
+                arrow = (" ▼" if view["descending"] else " ▲") if col == view["sort"] else ""
+                tree.heading(col, text=col + arrow)
+            page_var.set(f"{offset + 1 if rows else 0}-{offset + len(rows)} of {matching}")
+            prev_btn.config(state=tk.NORMAL if offset > 0 else tk.DISABLED)
+            next_btn.config(state=tk.NORMAL if offset + len(rows) < matching else tk.DISABLED)
+
         scrollbar = ttk.Scrollbar(win, orient=tk.VERTICAL, command=tree.yview)
         tree.configure(yscroll=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         tree.pack(fill=tk.BOTH, expand=True)
+        show(0)
 
     def clear_history(self):
         if messagebox.askyesno("Confirm", "Delete ALL history logs?"):
-            self.history = []
             try:
-                with open(self.csv_filename, mode='w', newline='') as file:
-                    writer = csv.writer(file)
-                    writer.writerow(["ID", "Timestamp", "Board", "Algorithm", "Time", "Result", "Success"])
+                self.history.clear()
                 self.status_var.set("History Cleared.")
                 messagebox.showinfo("Success", "History cleared.")
             except Exception as e:
                 messagebox.showerror("Error", str(e))
 
+    # --- RENDERING ---
+    # Tours are replayed in about this long, whatever their length.
+    ANIMATION_SECONDS = 6.0
+    ANIMATION_FPS = 30
+
+    def ensure_plot(self):
+        """
+        Creates the Matplotlib figure and canvas the first time the board is
+        drawn. Importing Matplotlib takes longer than building the rest of
+        the window, so it waits until a tour is shown.
+        """
+        if self.canvas is not None:
+            return
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.placeholder.destroy()
+        self.figure = Figure(figsize=(6, 6))
+        self.ax = self.figure.add_subplot()
+        self.figure.patch.set_facecolor(self.bg_color)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.plot_area)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.ax.axis('off')
+        self.canvas.draw()
+        # Blitted animation frames paint over a saved copy of the axes; any
+        # full redraw (e.g. a window resize) refreshes that copy.
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
+
     def draw_board_base(self, n):
+        import numpy as np
+        from matplotlib.colors import ListedColormap
+
+        self.ensure_plot()
         self.ax.clear()
         self.ax.axis('off')
-        for r in range(n):
-            for c in range(n):
-                color = '#f0d9b5' if (r + c) % 2 == 0 else '#b58863'
-                rect = patches.Rectangle((c, n - 1 - r), 1, 1, facecolor=color, edgecolor='none')
-                self.ax.add_patch(rect)
+        # One image for all N*N squares; row 0 is drawn at the top.
+        squares = np.add.outer(np.arange(n), np.arange(n)) % 2
+        self.ax.imshow(squares, cmap=ListedColormap(['#f0d9b5', '#b58863']), extent=(0, n, 0, n), interpolation='nearest')
         self.ax.set_xlim(0, n)
         self.ax.set_ylim(0, n)
         self.canvas.draw()
 
+    def on_canvas_draw(self, event):
+        anim = self.animation
+        if anim is not None:
+            anim["background"] = self.canvas.copy_from_bbox(self.ax.bbox)
+
     def animate_path(self, n, path, algo_name):
-        self.draw_board_base(n)
-        xs, ys = [], []
+        """
+        Replays a path on the board without blocking the Tk loop.
         
-        # Animation Speed (0.05 = Balanced speed)
-        delay = 0.05 
+        Frames are scheduled with root.after and blitted: each frame restores
+        the saved axes image, draws only the squares reached since the last
+        frame plus the knight, and saves the result for the next frame. The
+        number of squares per frame follows the wall clock, so any path plays
+        back in about ANIMATION_SECONDS.
+        """
+        import numpy as np
+
+        self.draw_board_base(n)
         
         color_line = '#2980b9' if algo_name == "Backtracking" else '#8e44ad'
-        total_sq = n * n
-
-        for i, (r, c) in enumerate(path):
-            px, py = c + 0.5, n - 1 - r + 0.5
-            xs.append(px)
-            ys.append(py)
-
-            if i > 0:
-                self.ax.plot(xs[-2:], ys[-2:], color=color_line, linewidth=2.5, alpha=0.8)
-            
-            if hasattr(self, 'knight'): self.knight.remove()
-            self.knight = self.ax.text(px, py, '♞', fontsize=26, ha='center', va='center', color='black')
-            self.ax.text(px, py, str(i), fontsize=8, ha='center', va='center', color='white', fontweight='bold')
+        total = len(path)
+        
+        # Screen coordinates of every step, filled in as the replay advances.
+        xs = np.empty(total)
+        ys = np.empty(total)
+        
+        # The full trail is a normal artist so full redraws show it; frames
+        # only draw the new segment on top of the saved background.
+        trail, = self.ax.plot([], [], color=color_line, linewidth=2.5, alpha=0.8)
+        segment, = self.ax.plot([], [], color=color_line, linewidth=2.5, alpha=0.8, animated=True)
+        knight = self.ax.text(0, 0, '♞', fontsize=26, ha='center', va='center', color='black', animated=True)
+        
+        self.animation = {"background": None, "skip": False}
+        self.canvas.draw()
+        self.set_busy(True)
+        started = time.time()
+        
+        def frame(done):
+            anim = self.animation
+            elapsed = time.time() - started
+            upto = total if anim["skip"] else min(total, max(done + 1, int(total * elapsed / self.ANIMATION_SECONDS)))
             
-            self.status_var.set(f"RUNNING... Steps: {i+1} / {total_sq}")
+            for i in range(done, upto):
+                r, c = path[i]
+                xs[i] = c + 0.5
+                ys[i] = n - 1 - r + 0.5
+            lo = max(done - 1, 0)
+            trail.set_data(xs[:upto], ys[:upto])
+            segment.set_data(xs[lo:upto], ys[lo:upto])
+            knight.set_position((xs[upto - 1], ys[upto - 1]))
             
-            self.canvas.draw()
-            self.root.update()
+            self.canvas.restore_region(anim["background"])
+            self.ax.draw_artist(segment)
+            anim["background"] = self.canvas.copy_from_bbox(self.ax.bbox)
+            self.ax.draw_artist(knight)
+            self.canvas.blit(self.ax.bbox)
             
-            time.sleep(delay)
+            self.status_var.set(f"RUNNING... Steps: {upto} / {n * n}")
+            if upto < total:
+                self.root.after(int(1000 / self.ANIMATION_FPS), frame, upto)
+            else:
+                knight.set_animated(False)
+                segment.remove()
+                self.animation = None
+                self.finish_animation(n, path)
+        
+        frame(0)
+
+    def finish_animation(self, n, path):
+        from matplotlib import patches
+
+        total_sq = n * n
+
+        # Step numbers only fit on small boards.
+        if n <= 12:
+            for i, (r, c) in enumerate(path):
+                self.ax.text(c + 0.5, n - 1 - r + 0.5, str(i), fontsize=8, ha='center', va='center', color='white', fontweight='bold')
 
         # Draw Start/End Markers
         sr, sc = path[0]
@@ -257,12 +411,87 @@ class KnightTourGUI:
         self.ax.text(ec+0.5, n - 1 - er + 0.5 - 0.35, "END", color='darkred', fontsize=9, fontweight='bold', ha='center')
         
         self.canvas.draw()
+        self.set_busy(False)
         
         if len(path) == total_sq:
-            self.status_var.set(f"✅ COMPLETE! (Saved)")
+            stats = self.cache.stats()
+            self.status_var.set(f"✅ COMPLETE! (Saved)\nCache: {stats['hits']} hits / {stats['misses']} misses")
         else:
             self.status_var.set(f"⚠️ INCOMPLETE (Saved)")
 
+    # --- BACKGROUND SOLVES ---
+    def start_job(self, work, on_done):
+        """
+        Runs work(progress, cancel) on a worker thread.
+        
+        Progress events and the final result come back through a queue that
+        poll_job drains from root.after, so the Tk thread never blocks on a
+        solve and never gets touched by the worker.
+        """
+        self.cancel_event = threading.Event()
+        self.job_queue = queue.Queue()
+        self.on_job_done = on_done
+        self.set_busy(True)
+
+        jobs = self.job_queue
+        last_report = [0.0]
+
+        def progress(event):
+            # Solvers can report thousands of times a second; keep the latest ~20/s.
+            now = time.time()
+            if now - last_report[0] >= 0.05:
+                last_report[0] = now
+                jobs.put(("progress", event))
+
+        def worker(cancel):
+            try:
+                jobs.put(("done", work(progress, cancel)))
+            except Exception as e:
+                jobs.put(("error", e))
+
+        threading.Thread(target=worker, args=(self.cancel_event,), daemon=True).start()
+        self.root.after(50, self.poll_job)
+
+    def poll_job(self):
+        try:
+            while True:
+                kind, payload = self.job_queue.get_nowait()
+                if kind == "progress":
+                    self.status_var.set(self.format_progress(payload))
+                    continue
+                self.set_busy(False)
+                if kind == "error":
+                    messagebox.showerror("Solver Error", str(payload))
+                    self.status_var.set("Failed.")
+                else:
+                    self.on_job_done(payload)
+                return
+        except queue.Empty:
+            pass
+        self.root.after(50, self.poll_job)
+
+    def format_progress(self, event):
+        stage = event.get("stage", "Solving")
+        if "generation" in event:
+            return f"{stage}... Gen {event['generation']} | Best {event['best_score']}"
+        if "strategy" in event:
+            return f"{stage}... {event['strategy']} leads | {event['steps']:,} squares"
+        return f"{stage}... Depth {event['depth']} | {event['nodes']:,} nodes"
+
+    def set_busy(self, busy):
+        state = tk.DISABLED if busy else tk.NORMAL
+        for btn in (self.run_btn, self.compare_btn, self.clear_btn):
+            btn.config(state=state)
+        self.cancel_btn.config(state=tk.NORMAL if busy else tk.DISABLED)
+
+    def cancel_job(self):
+        if self.animation is not None:
+            # Jump straight to the finished board.
+            self.animation["skip"] = True
+        elif self.cancel_event is not None:
+            self.cancel_event.set()
+            self.status_var.set("Cancelling...")
+
     def run_solver(self):
         vals = self.get_inputs()
         if not vals: return
@@ -270,13 +499,27 @@ class KnightTourGUI:
         algo = self.algo_var.get()
 
         self.status_var.set("Processing...")
-        self.root.update()
 
-        if algo == "Backtracking":
-            res = BacktrackingSolver(n).run(r, c)
-        else:
-            res = CulturalSolver(n, max_gens=3000).run(r, c)
-        
+        def work(progress, cancel):
+            report = lambda e: progress(dict(e, stage=algo))
+            def compute():
+                if algo == "Backtracking":
+                    return create_solver("backtracking", n, progress=report, cancel=cancel).run(r, c)
+                elif algo == "DivideConquer":
+                    return create_solver("divide", n).run(r, c)
+                elif algo == "Portfolio":
+                    return create_solver("portfolio", n, budget=PORTFOLIO_BUDGET, progress=report, cancel=cancel).run(r, c)
+                else:
+                    return create_solver("cultural", n, max_gens=3000, progress=report, cancel=cancel).run(r, c)
+            return self.cache.solve(SOLVER_KEYS[algo], n, r, c, lambda: maybe_profile(compute, f"{SOLVER_KEYS[algo]}-{n}"))
+
+        self.start_job(work, lambda res: self.show_solution(res, n, r, c, algo))
+
+    def show_solution(self, res, n, r, c, algo):
+        if res.get('cancelled'):
+            self.status_var.set("Cancelled.")
+            return
+
         self.log_result(res, n, r, c)
 
         if res['success'] or len(res['path']) > 0:
@@ -291,17 +534,29 @@ class KnightTourGUI:
         n, r, c = vals
         
         self.status_var.set("Benchmarking...")
-        self.root.update()
 
-        bt = BacktrackingSolver(n).run(r, c)
-        ca = CulturalSolver(n, max_gens=2000).run(r, c)
+        def work(progress, cancel):
+            bt = self.cache.solve("backtracking", n, r, c, lambda: maybe_profile(
+                lambda: create_solver("backtracking", n, progress=lambda e: progress(dict(e, stage="Backtracking")), cancel=cancel).run(r, c), f"backtracking-{n}"))
+            if bt.get('cancelled'):
+                return bt, None
+            ca = self.cache.solve("cultural", n, r, c, lambda: maybe_profile(
+                lambda: create_solver("cultural", n, max_gens=2000, progress=lambda e: progress(dict(e, stage="Cultural")), cancel=cancel).run(r, c), f"cultural-{n}"))
+            return bt, ca
+
+        self.start_job(work, lambda results: self.show_comparison(*results, n, r, c))
+
+    def show_comparison(self, bt, ca, n, r, c):
+        if ca is None or ca.get('cancelled'):
+            self.status_var.set("Cancelled.")
+            return
         
         self.log_result(bt, n, r, c)
         self.log_result(ca, n, r, c)
 
         win = Toplevel(self.root)
         win.title(f"Comparison Results (N={n})")
-        win.geometry("500x350")
+        win.geometry("520x560")
         win.configure(bg="white")
         
         tk.Label(win, text="🏆 Last Run Comparison", font=("Segoe UI", 14, "bold"), bg="white", fg="#2c3e50").pack(pady=15)
@@ -312,10 +567,31 @@ class KnightTourGUI:
         tk.Label(f, text="Backtracking", font=("bold"), bg="#3498db", fg="white", width=15).grid(row=0, column=1)
         tk.Label(f, text="Cultural Algo", font=("bold"), bg="#9b59b6", fg="white", width=15).grid(row=0, column=2)
 
+        # Work counters (see the solvers' "stats"); cached runs did no work.
+        bs, cs = bt.get('stats') or {}, ca.get('stats') or {}
+        def counter(stats, res, key, fmt="{:,}"):
+            if res.get('cached'):
+                return "cached"
+            return fmt.format(stats[key]) if key in stats else "-"
+
+        # A cached result's own time is the lookup; show the original solve.
+        def solve_time(res):
+            if res.get('cached'):
+                return f"{res['solve_time']:.6f} (cached)"
+            return f"{res['time']:.6f}"
+
         metrics = [
-            ("Time (sec)", f"{bt['time']:.5f}", f"{ca['time']:.5f}"),
+            ("Time (sec)", solve_time(bt), solve_time(ca)),
             ("Status", "Success ✅" if bt['success'] else "Fail ❌", "Success ✅" if ca['success'] else "Fail ❌"),
-            ("Steps", f"{bt['steps']}", f"{ca['steps']}")
+            ("Steps", f"{bt['steps']}", f"{ca['steps']}"),
+            ("Work", work_done(bs) or counter(bs, bt, "nodes"), work_done(cs) or counter(cs, ca, "evaluations")),
+            ("Backtracks", counter(bs, bt, "backtracks"), "-"),
+            ("Max Depth", counter(bs, bt, "max_depth"), "-"),
+            ("Degree Evals", counter(bs, bt, "degree_evaluations"), "-"),
+            ("Generations", "-", counter(cs, ca, "generations")),
+            ("Eval Time (sec)", "-", counter(cs, ca, "eval_time", "{:.4f}")),
+            ("Breed Time (sec)", "-", counter(cs, ca, "breed_time", "{:.4f}")),
+            ("Genomes / sec", "-", counter(cs, ca, "genomes_per_sec", "{:,.0f}")),
         ]
 
         for i, (m, v1, v2) in enumerate(metrics):
@@ -0,0 +1,232 @@
+"""
+SQLite-backed run history.
+
+Every solver run logged by the GUI becomes one row of the `runs` table. IDs
+come from an AUTOINCREMENT key, so they only ever grow, even across sessions
+and after the history is cleared. Writes are buffered and committed in a
+single transaction per batch. Reads are paged, and the filtering and sorting
+happen in SQL on indexed columns, so the viewer never loads the whole table.
+"""
+
+import csv
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from src.records import RECORD_FIELDS, scalar_stats, work_done, work_units
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT    NOT NULL,
+    n         INTEGER NOT NULL,
+    algorithm TEXT    NOT NULL,
+    time      REAL    NOT NULL,
+    steps     INTEGER NOT NULL,
+    success   INTEGER NOT NULL,
+    work      INTEGER,
+    stats     TEXT,
+    cached    INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_n ON runs (n);
+CREATE INDEX IF NOT EXISTS runs_algorithm ON runs (algorithm);
+CREATE INDEX IF NOT EXISTS runs_success ON runs (success);
+CREATE INDEX IF NOT EXISTS runs_time ON runs (time);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Viewer column -> SQL column it sorts by. Timestamps of imported rows carry no
+# date, so they sort by ID, which follows insertion order.
+SORT_COLUMNS = {
+    "ID": "id",
+    "Timestamp": "id",
+    "Board": "n",
+    "Algorithm": "algorithm",
+    "Time": "time",
+    "Result": "steps",
+    "Success": "success",
+    "Work": "work",
+    "Cached": "cached",
+}
+
+# Columns the viewer shows: a record plus whether the tour came from the
+# cache, in which case Time is the lookup time, not a solve.
+HISTORY_FIELDS = RECORD_FIELDS + ["Cached"]
+
+# Columns added after the first release, created on older databases.
+ADDED_COLUMNS = {"work": "INTEGER", "stats": "TEXT", "cached": "INTEGER NOT NULL DEFAULT 0"}
+
+
+class HistoryStore:
+    """
+    Run history kept in an indexed SQLite database.
+    """
+
+    def __init__(self, filename="knights_tour_results.db", batch_size=100):
+        """
+        Args:
+            filename (str): Database file (":memory:" for a throwaway store).
+            batch_size (int): Buffered runs that trigger a commit.
+        """
+        self.filename = filename
+        self.batch_size = batch_size
+        self.pending = []
+        self.conn = sqlite3.connect(filename)
+        if filename != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            existing = {row[1] for row in self.conn.execute("PRAGMA table_info(runs)")}
+            for column, kind in ADDED_COLUMNS.items():
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE runs ADD COLUMN {column} {kind}")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS runs_work ON runs (work)")
+
+    # --- Writing ---
+    def add(self, res, n, timestamp=None):
+        """
+        Buffers one solver result; commits once batch_size runs are pending.
+
+        Args:
+            res (dict): Result returned by a solver's run().
+            n (int): Board size the solver ran on.
+            timestamp (str): Defaults to now.
+        """
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        stats = scalar_stats(res.get("stats"))
+        self.pending.append((timestamp, n, res["algorithm"], res["time"], res["steps"], int(bool(res["success"])),
+                             work_units(stats), json.dumps(stats) if stats else None, int(bool(res.get("cached")))))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered runs in one transaction.
+        """
+        if not self.pending:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO runs (timestamp, n, algorithm, time, steps, success, work, stats, cached) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self.pending)
+        self.pending = []
+
+    def clear(self):
+        """
+        Deletes every run. IDs keep counting up from where they were.
+        """
+        self.pending = []
+        with self.conn:
+            self.conn.execute("DELETE FROM runs")
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def import_csv(self, filename):
+        """
+        Imports a history CSV written by earlier versions, once per file.
+
+        The CSV's IDs restart every session, so rows get fresh IDs in file
+        order. The import is recorded in the meta table and repeated calls
+        do nothing.
+
+        Returns:
+            int: Number of rows imported.
+        """
+        key = f"imported:{os.path.abspath(filename)}"
+        if not os.path.exists(filename) or self.conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+            return 0
+        self.flush()
+
+        rows = []
+        with open(filename, newline='') as file:
+            for row in csv.DictReader(file):
+                try:
+                    rows.append((
+                        row["Timestamp"],
+                        int(row["Board"].split("x")[0]),
+                        row["Algorithm"],
+                        float(row["Time"].rstrip("s")),
+                        int(row["Result"].split("/")[0]),
+                        int(row["Success"] == "Yes"),
+                    ))
+                except (KeyError, ValueError, AttributeError):
+                    continue
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO runs (timestamp, n, algorithm, time, steps, success) VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, str(len(rows))))
+        return len(rows)
+
+    # --- Reading ---
+    def where(self, n=None, algorithm=None, success=None):
+        clauses, params = [], []
+        if n is not None:
+            clauses.append("n = ?")
+            params.append(n)
+        if algorithm is not None:
+            clauses.append("algorithm = ?")
+            params.append(algorithm)
+        if success is not None:
+            clauses.append("success = ?")
+            params.append(int(success))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, n=None, algorithm=None, success=None):
+        """
+        Number of stored runs matching the filters (None means any).
+        """
+        self.flush()
+        where, params = self.where(n, algorithm, success)
+        return self.conn.execute(f"SELECT COUNT(*) FROM runs{where}", params).fetchone()[0]
+
+    def page(self, offset=0, limit=100, n=None, algorithm=None, success=None, sort="ID", descending=False):
+        """
+        Fetches one page of runs, filtered and sorted by the database.
+
+        Args:
+            offset, limit: Window of matching rows to return.
+            n, algorithm, success: Filters; None means any.
+            sort (str): A HISTORY_FIELDS column name.
+            descending (bool): Sort direction.
+
+        Returns:
+            list: Dicts keyed by HISTORY_FIELDS, formatted like make_record.
+        """
+        self.flush()
+        where, params = self.where(n, algorithm, success)
+        direction = "DESC" if descending else "ASC"
+        order = SORT_COLUMNS[sort]
+        query = (f"SELECT id, timestamp, n, algorithm, time, steps, success, stats, cached FROM runs{where} "
+                 f"ORDER BY {order} {direction}, id {direction} LIMIT ? OFFSET ?")
+        return [
+            dict(zip(HISTORY_FIELDS, (
+                run_id, timestamp, f"{n}x{n}", algorithm, f"{time:.6f}s", f"{steps}/{n*n}", "Yes" if success else "No",
+                work_done(json.loads(stats)) if stats else "", "Yes" if cached else "No"
+            )))
+            for run_id, timestamp, n, algorithm, time, steps, success, stats, cached
+            in self.conn.execute(query, params + [limit, offset])
+        ]
+
+    def stats(self, run_id):
+        """
+        The counters stored with a run (see the solvers' "stats" results).
+        """
+        self.flush()
+        row = self.conn.execute("SELECT stats FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return json.loads(row[0]) if row and row[0] else {}
+
+    def boards(self):
+        self.flush()
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT n FROM runs ORDER BY n")]
+
+    def algorithms(self):
+        self.flush()
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT algorithm FROM runs ORDER BY algorithm")]
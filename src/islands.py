@@ -0,0 +1,144 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.cultural import CulturalSolver
+
+# Set in each worker process by _init_worker; shared by all islands so the
+# first one to find a full tour can stop the others mid-epoch.
+_stop_event = None
+
+
+def _init_worker(stop_event):
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _evolve_island(solver, population, start_x, start_y, generations):
+    """
+    Runs one island for one migration interval inside a worker process.
+    
+    Returns:
+        tuple: The updated solver, its population sorted best-first, the
+        number of generations run and the time spent.
+    """
+    started = time.perf_counter()
+    population, gens = solver.evolve(population, start_x, start_y, generations, stop=_stop_event)
+    if solver.belief_best_score == solver.n * solver.n:
+        _stop_event.set()
+    scores = solver.evaluate(population, start_x, start_y)
+    population = population[np.argsort(-scores, kind="stable")]
+    return solver, population, gens, time.perf_counter() - started
+
+
+class IslandCulturalSolver:
+    """
+    Island-model Cultural Algorithm running several populations in parallel.
+    
+    Each island is a CulturalSolver with its own population and belief space,
+    evolved in a process pool for `migration_interval` generations at a time.
+    Between intervals the islands form a ring: each one replaces its worst
+    genomes with the best `migrants` genomes of its predecessor and adopts the
+    predecessor's belief space if it is better. All islands stop as soon as
+    any of them finds a full tour.
+    """
+
+    def __init__(self, n, islands=4, pop_size=150, max_gens=2000, migration_interval=50, migrants=5, seed=None, workers=None):
+        """
+        Args:
+            n (int): The dimension of the chessboard (NxN).
+            islands (int): Number of populations.
+            pop_size (int): Genomes per island.
+            max_gens (int): Generations per island.
+            migration_interval (int): Generations between migrations.
+            migrants (int): Genomes sent to the next island at each migration.
+            seed: Seed for reproducible runs; each island gets its own stream.
+            workers (int): Worker processes (default: one per island, up to the CPU count).
+        """
+        self.n = n
+        self.islands = islands
+        self.pop_size = pop_size
+        self.max_gens = max_gens
+        self.migration_interval = migration_interval
+        self.migrants = min(migrants, pop_size - 1)
+        self.seed = seed
+        self.workers = workers or min(islands, os.cpu_count() or 1)
+
+    def migrate(self, solvers, populations, stats):
+        """
+        Ring migration of elite genomes and belief-space knowledge.
+        
+        Populations must be sorted best-first, as returned by the workers.
+        """
+        k = self.migrants
+        elites = [pop[:k].copy() for pop in populations]
+        beliefs = [(s.belief_best_score, s.belief_best_genome, s.belief_best_path) for s in solvers]
+        for i, (solver, pop) in enumerate(zip(solvers, populations)):
+            source = (i - 1) % len(solvers)
+            if k:
+                pop[-k:] = elites[source]
+                stats[i]["migrants_in"] += k
+            score, genome, path = beliefs[source]
+            if score > solver.belief_best_score:
+                solver.belief_best_score = score
+                solver.belief_best_genome = genome.copy()
+                solver.belief_best_path = path
+
+    def run(self, start_x, start_y):
+        start_time = time.perf_counter()
+
+        genome_len = self.n * self.n
+        seeds = np.random.SeedSequence(self.seed).spawn(self.islands)
+        solvers = [CulturalSolver(self.n, self.pop_size, self.max_gens, seed=s) for s in seeds]
+        populations = [s.rng.integers(0, 8, (self.pop_size, genome_len), dtype=np.int8) for s in solvers]
+        stats = [
+            {"island": i, "generations": 0, "best_score": 0, "success": False, "time": 0.0, "migrants_in": 0}
+            for i in range(self.islands)
+        ]
+
+        ctx = multiprocessing.get_context()
+        stop = ctx.Event()
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx, initializer=_init_worker, initargs=(stop,)) as pool:
+            done = 0
+            while done < self.max_gens:
+                epoch = min(self.migration_interval, self.max_gens - done)
+                futures = [
+                    pool.submit(_evolve_island, solver, pop, start_x, start_y, epoch)
+                    for solver, pop in zip(solvers, populations)
+                ]
+                for i, future in enumerate(futures):
+                    solvers[i], populations[i], gens, elapsed = future.result()
+                    stats[i]["generations"] += gens
+                    stats[i]["time"] += elapsed
+                done += epoch
+
+                if stop.is_set():
+                    break
+                self.migrate(solvers, populations, stats)
+
+        for solver, island in zip(solvers, stats):
+            island["best_score"] = solver.belief_best_score
+            island["success"] = solver.belief_best_score == genome_len
+
+        best = max(solvers, key=lambda s: s.belief_best_score)
+        end_time = time.perf_counter()
+
+        # Counters summed over the islands (see CulturalSolver.reset_stats).
+        totals = {key: sum(s.stats[key] for s in solvers) for key in ("generations", "evaluations", "rewalked")}
+        totals["eval_time"] = sum(sum(s.stats["eval_times"]) for s in solvers)
+        totals["breed_time"] = sum(sum(s.stats["breed_times"]) for s in solvers)
+        totals["genomes_per_sec"] = totals["evaluations"] / totals["eval_time"] if totals["eval_time"] else 0.0
+        totals["best_curve"] = best.stats["best_curve"]
+
+        return {
+            "algorithm": "Cultural Algorithm (Islands)",
+            "success": best.belief_best_score == genome_len,
+            "path": best.belief_best_path,
+            "time": end_time - start_time,
+            "steps": len(best.belief_best_path),
+            "islands": stats,
+            "stats": totals
+        }
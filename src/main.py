@@ -3,12 +3,14 @@ Main Entry Point for the Knight's Tour Solver Application.
 
 This script initializes the Tkinter root window, configures high-DPI scaling
 for Windows systems (to ensure sharp text), and launches the main GUI application.
+For the command-line mode without a window, see `python -m src --help`.
 """
 
 import tkinter as tk
 from src.gui import KnightTourGUI
 
-if __name__ == "__main__":
+
+def launch():
     root = tk.Tk()
 
     
@@ -21,4 +23,8 @@ if __name__ == "__main__":
 
     
     app = KnightTourGUI(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    launch()
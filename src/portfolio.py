@@ -0,0 +1,250 @@
+"""
+Time-budgeted portfolio runs: several strategies race on the same start.
+
+Each strategy (a solver plus options or a seed) runs in its own process and
+streams improvements to its best path over a queue. The first complete tour
+wins, and the other processes are stopped. If the budget runs out first, the
+longest path seen wins. Strategies get a short grace period to stop at their
+next progress check and report; any still running after that (e.g. the
+divide-and-conquer solver, which has no cancel checks) are terminated.
+
+The island solver starts its own process pool, which a daemon process cannot
+do, and terminating it would orphan the pool's workers. So the portfolio
+races independently seeded CulturalSolvers instead, one process per seed:
+islands without migration.
+
+Example:
+    python -m src.portfolio --size 8 --start 0,0 --budget 5
+    python -m src.portfolio --size 30 --strategies warnsdorff,roth,cultural-0 --budget 2
+"""
+
+import argparse
+import multiprocessing
+import queue
+import sys
+import time
+from array import array
+
+from src.records import scalar_stats
+from src.solvers import STREAMING, create_solver, display_name, parse_start
+from src.tour import TourPath
+
+# name -> (solver registry name, constructor options)
+STRATEGIES = {
+    "warnsdorff": ("backtracking", {"progress_interval": 5000}),
+    "pohl": ("backtracking", {"progress_interval": 5000, "tie_break": "pohl"}),
+    "roth": ("backtracking", {"progress_interval": 5000, "tie_break": "roth"}),
+    "pruned": ("backtracking", {"progress_interval": 5000, "prune_dead_ends": True, "connectivity_interval": 4}),
+    "divide": ("divide", {}),
+    "cultural-0": ("cultural", {"max_gens": 100000, "seed": 0}),
+    "cultural-1": ("cultural", {"max_gens": 100000, "seed": 1}),
+}
+
+# Seconds between checks of the budget and the cancel event.
+POLL_INTERVAL = 0.1
+
+
+def _race(name, n, start_x, start_y, stop, results, report_interval):
+    """
+    Runs one strategy in a portfolio process.
+
+    Longer best paths go on the results queue as ("best", name, path), at
+    most every report_interval seconds. The run ends with ("done", name,
+    result) or ("error", name, message). Setting `stop` cancels the solver
+    at its next progress check.
+    """
+    algorithm, options = STRATEGIES[name]
+    solver = None
+    last = {"time": 0.0, "steps": 0}
+
+    def report(event):
+        now = time.perf_counter()
+        if now - last["time"] < report_interval:
+            return
+        if "generation" in event:
+            path = solver.belief_best_path
+        else:
+            path = TourPath(array('I', solver.search_path[:event["depth"] + 1]), n)
+        if len(path) > last["steps"]:
+            last["time"], last["steps"] = now, len(path)
+            results.put(("best", name, path))
+
+    try:
+        if algorithm in STREAMING:
+            options = dict(options, progress=report, cancel=stop)
+        solver = create_solver(algorithm, n, **options)
+        res = solver.run(start_x, start_y)
+        res["stats"] = scalar_stats(res.get("stats"))
+        results.put(("done", name, res))
+    except Exception as e:
+        results.put(("error", name, f"{type(e).__name__}: {e}"))
+
+
+class PortfolioSolver:
+    """
+    Races several strategies in parallel processes under a wall-clock budget.
+    """
+
+    def __init__(self, n, strategies=None, budget=10.0, grace=0.5, report_interval=0.25, progress=None, cancel=None):
+        """
+        Args:
+            n (int): The dimension of the chessboard (NxN).
+            strategies: STRATEGIES names to race (default: all of them).
+            budget (float): Seconds before the longest path so far is taken.
+            grace (float): Seconds stopped strategies get to report before
+                they are terminated.
+            report_interval (float): Minimum seconds between a strategy's
+                best-path reports.
+            progress: Optional callable receiving {"event": "best", "strategy",
+                "steps", "time"} dicts whenever the longest path so far grows.
+            cancel: Optional Event-like object; the race stops once it is set.
+        """
+        names = list(strategies or STRATEGIES)
+        unknown = [name for name in names if name not in STRATEGIES]
+        if unknown:
+            raise ValueError(f"Unknown strategies: {', '.join(unknown)}. Choose from: {', '.join(STRATEGIES)}")
+        self.n = n
+        self.strategies = names
+        self.budget = budget
+        self.grace = grace
+        self.report_interval = report_interval
+        self.progress = progress
+        self.cancel = cancel
+
+    def run(self, start_x, start_y):
+        """
+        Races the strategies from (start_x, start_y).
+
+        Returns:
+            dict: The usual result keys for the winning path, plus "winner"
+            (the strategy name) and "strategies", one dict per strategy:
+            strategy, algorithm, status ("solved", "finished", "stopped",
+            "terminated" or "failed"), success, steps (longest path
+            reported), time (seconds until it ended) and stats.
+        """
+        start_time = time.perf_counter()
+        deadline = start_time + self.budget
+        # Spawn, not fork: the GUI starts races from a worker thread, and a
+        # forked child would inherit its locks and Tk state mid-use.
+        ctx = multiprocessing.get_context("spawn")
+        stop = ctx.Event()
+        results = ctx.Queue()
+        processes = {
+            name: ctx.Process(target=_race, args=(name, self.n, start_x, start_y, stop, results, self.report_interval), daemon=True)
+            for name in self.strategies
+        }
+        report = {
+            name: {"strategy": name, "algorithm": display_name(STRATEGIES[name][0]), "status": "running",
+                   "success": False, "steps": 0, "time": 0.0, "stats": {}}
+            for name in self.strategies
+        }
+        paths = {}
+        longest = 0
+        winner = None
+        cancelled = False
+        stop_by = None
+        for process in processes.values():
+            process.start()
+
+        running = set(self.strategies)
+        while running:
+            now = time.perf_counter()
+            if stop_by is None:
+                cancelled = self.cancel is not None and self.cancel.is_set()
+                if winner is not None or cancelled or now >= deadline:
+                    stop.set()
+                    stop_by = now + self.grace
+            if stop_by is not None and now >= stop_by:
+                break
+            try:
+                kind, name, payload = results.get(timeout=min(POLL_INTERVAL, (stop_by or deadline) - now))
+            except queue.Empty:
+                # A process that died without reporting (e.g. out of memory).
+                for name in [name for name in running if processes[name].exitcode not in (None, 0)]:
+                    running.discard(name)
+                    report[name].update(status="failed", time=time.perf_counter() - start_time,
+                                        error=f"exit code {processes[name].exitcode}")
+                continue
+
+            entry = report[name]
+            if kind == "best":
+                if len(payload) > len(paths.get(name, ())):
+                    paths[name] = payload
+                    entry["steps"] = len(payload)
+                if len(payload) > longest:
+                    longest = len(payload)
+                    if self.progress is not None:
+                        self.progress({"event": "best", "strategy": name, "steps": longest, "time": time.perf_counter() - start_time})
+                continue
+
+            running.discard(name)
+            entry["time"] = time.perf_counter() - start_time
+            if kind == "error":
+                entry.update(status="failed", error=payload)
+                continue
+            res = payload
+            if len(res["path"]) >= len(paths.get(name, ())):
+                paths[name] = res["path"]
+            entry.update(success=res["success"], steps=len(paths[name]), stats=res["stats"],
+                         status="solved" if res["success"] else "stopped" if res.get("cancelled") else "finished")
+            if res["success"] and winner is None:
+                winner = name
+
+        for name in running:
+            processes[name].terminate()
+            report[name].update(status="terminated", time=time.perf_counter() - start_time)
+        for process in processes.values():
+            process.join()
+
+        if winner is None and paths:
+            winner = max(self.strategies, key=lambda name: len(paths.get(name, ())))
+        path = paths.get(winner, TourPath(array('I'), self.n))
+        success = winner is not None and report[winner]["success"]
+        return {
+            "algorithm": "Portfolio",
+            "success": success,
+            "path": path,
+            "time": time.perf_counter() - start_time,
+            "steps": len(path),
+            "cancelled": cancelled and not success,
+            "winner": winner,
+            "strategies": [report[name] for name in self.strategies],
+            "stats": dict(report[winner]["stats"]) if winner else {}
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.portfolio", description="Race several Knight's Tour strategies under a time budget.")
+    parser.add_argument("--size", type=int, default=8, help="board size N (default: 8)")
+    parser.add_argument("--start", type=parse_start, default=(0, 0), help="start square as ROW,COL (default: 0,0)")
+    parser.add_argument("--budget", type=float, default=10.0, help="wall-clock budget in seconds (default: 10)")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES), help=f"comma-separated: {', '.join(STRATEGIES)}")
+    parser.add_argument("--quiet", action="store_true", help="do not print improvements as they arrive")
+    args = parser.parse_args(argv)
+
+    names = [s.strip() for s in args.strategies.split(",") if s.strip()]
+    unknown = [s for s in names if s not in STRATEGIES]
+    if unknown:
+        parser.error(f"unknown strategy(s): {', '.join(unknown)}")
+    x, y = args.start
+    if not (0 <= x < args.size and 0 <= y < args.size):
+        parser.error(f"--start {x},{y} is off a {args.size}x{args.size} board")
+
+    def progress(event):
+        print(f"{event['time']:>8.3f}s  {event['strategy']:<12} {event['steps']:>7,} squares")
+
+    solver = PortfolioSolver(args.size, names, args.budget, progress=None if args.quiet else progress)
+    res = solver.run(x, y)
+    total = args.size * args.size
+    print(f"\n{'strategy':<12} {'algorithm':<20} {'status':<11} {'squares':>15} {'ran for':>9}")
+    for entry in res["strategies"]:
+        mark = "*" if entry["strategy"] == res["winner"] else " "
+        print(f"{entry['strategy']:<12} {entry['algorithm']:<20} {entry['status']:<11} {entry['steps']:>7,}/{total:<7,} "
+              f"{entry['time']:>8.3f}s {mark} {entry.get('error', '')}")
+    outcome = "complete tour" if res["success"] else f"{res['steps']}/{total} squares (budget ran out)"
+    print(f"\nwinner: {res['winner']} with a {outcome} after {res['time']:.3f}s")
+    return 0 if res["success"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
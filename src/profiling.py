@@ -0,0 +1,103 @@
+"""
+Opt-in profiling hooks for solver runs.
+
+profile_call wraps one call, usually a solver's run(), in a profiler and writes
+the stats to a file:
+- "cprofile" uses the standard deterministic profiler and writes a .prof
+  file, readable with `python -m pstats` or snakeviz.
+- "sampling" uses a background thread that samples the calling thread's stack
+  every `interval` seconds. It writes collapsed stacks ("a;b;c count" lines)
+  that flamegraph.pl and speedscope read directly. Its overhead does not grow
+  with the number of Python calls, so it suits long runs.
+
+The GUI and the command-line mode (`python -m src`) profile their solves when
+the KNIGHT_PROFILE environment variable is set to "cprofile" or "sampling"
+(see maybe_profile). Stats go to
+KNIGHT_PROFILE_DIR, or the current directory by default.
+"""
+
+import cProfile
+import collections
+import os
+import sys
+import threading
+import time
+
+PROFILERS = ("cprofile", "sampling")
+
+
+def sample_stacks(thread_id, stop, interval, counts):
+    """
+    Records the stack of `thread_id` every `interval` seconds until stop is set.
+    """
+    while not stop.wait(interval):
+        frame = sys._current_frames().get(thread_id)
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        if stack:
+            counts[";".join(reversed(stack))] += 1
+
+
+def profile_call(fn, output, profiler="cprofile", interval=0.005):
+    """
+    Calls fn() under a profiler and writes the stats to `output`.
+
+    Args:
+        fn: Zero-argument callable, e.g. lambda: solver.run(x, y).
+        output (str): Stats file to write.
+        profiler (str): "cprofile" or "sampling".
+        interval (float): Seconds between samples for the sampling profiler.
+
+    Returns:
+        The value returned by fn(). Result dicts also get a "profile" key
+        holding the output path.
+    """
+    if profiler not in PROFILERS:
+        raise ValueError(f"profiler must be one of {PROFILERS}, not {profiler!r}")
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if profiler == "cprofile":
+        prof = cProfile.Profile()
+        try:
+            result = prof.runcall(fn)
+        finally:
+            prof.dump_stats(output)
+    else:
+        counts = collections.Counter()
+        stop = threading.Event()
+        sampler = threading.Thread(target=sample_stacks, args=(threading.get_ident(), stop, interval, counts), daemon=True)
+        sampler.start()
+        try:
+            result = fn()
+        finally:
+            stop.set()
+            sampler.join()
+            with open(output, "w") as file:
+                for stack, count in counts.most_common():
+                    file.write(f"{stack} {count}\n")
+
+    if isinstance(result, dict):
+        result["profile"] = output
+    return result
+
+
+def maybe_profile(fn, label):
+    """
+    Profiles fn() if KNIGHT_PROFILE names a profiler, else just calls it.
+
+    Args:
+        fn: Zero-argument callable.
+        label (str): Used in the stats file name, e.g. "backtracking-8".
+    """
+    profiler = os.environ.get("KNIGHT_PROFILE")
+    if not profiler:
+        return fn()
+    suffix = "prof" if profiler == "cprofile" else "folded"
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    output = os.path.join(os.environ.get("KNIGHT_PROFILE_DIR", "."), f"{label}-{stamp}.{suffix}")
+    return profile_call(fn, output, profiler)
@@ -0,0 +1,108 @@
+"""
+Measures what each optional BacktrackingSolver layer saves.
+
+Every configuration is run from every start square of each board size, with
+a node budget per start. The report shows how many starts were solved, the
+node-count distribution (where the tail latency lives) and the nodes saved
+compared with plain Warnsdorff ordering.
+
+Example:
+    python -m src.pruning --sizes 5-8 --node-limit 200000
+    python -m src.pruning --sizes 7 --configs warnsdorff,dead-ends,all
+"""
+
+import argparse
+import time
+
+from src.backtracking import BacktrackingSolver
+from src.batch import parse_range
+from src.records import percentile
+
+CONFIGS = {
+    "warnsdorff": {},
+    "dead-ends": {"prune_dead_ends": True},
+    "connectivity": {"connectivity_interval": 4},
+    "pohl": {"tie_break": "pohl"},
+    "roth": {"tie_break": "roth"},
+    "all": {"prune_dead_ends": True, "connectivity_interval": 4, "tie_break": "pohl"},
+}
+
+
+def measure_start(n, options, start_x, start_y, node_limit):
+    """
+    Runs one search, stopping once it has expanded node_limit nodes.
+
+    Returns:
+        dict: solved, finished (False if the budget ran out), nodes,
+        time and the solver's pruning counters.
+    """
+    solver = BacktrackingSolver(n, progress_interval=min(node_limit, 1000), **options)
+    events = solver.iter_events(start_x, start_y)
+    started = time.perf_counter()
+    event = None
+    for event in events:
+        if event["event"] == "progress" and event["nodes"] >= node_limit:
+            events.close()
+            break
+    return {
+        "solved": event["event"] == "solution",
+        "finished": event["event"] in ("solution", "exhausted"),
+        "nodes": event["nodes"],
+        "time": time.perf_counter() - started,
+        "pruned": dict(solver.pruned),
+    }
+
+
+def sweep(n, options, node_limit):
+    """
+    Measures every start square of an NxN board.
+    """
+    return [measure_start(n, options, x, y, node_limit) for x in range(n) for y in range(n)]
+
+
+def summarize(runs):
+    nodes = sorted(run["nodes"] for run in runs)
+    times = sorted(run["time"] for run in runs)
+    return {
+        "solved": sum(run["solved"] for run in runs),
+        "capped": sum(not run["finished"] for run in runs),
+        "starts": len(runs),
+        "nodes": sum(nodes),
+        "p50": percentile(nodes, 50),
+        "p90": percentile(nodes, 90),
+        "p99": percentile(nodes, 99),
+        "max": nodes[-1],
+        "time_p99": percentile(times, 99),
+        "dead_ends": sum(run["pruned"]["dead_ends"] for run in runs),
+        "disconnected": sum(run["pruned"]["disconnected"] for run in runs),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.pruning", description="Compare BacktrackingSolver pruning layers over all start squares.")
+    parser.add_argument("--sizes", default="5-8", help="board sizes, e.g. 6 or 5-8 or 5,7,9")
+    parser.add_argument("--configs", default=",".join(CONFIGS), help=f"comma-separated: {', '.join(CONFIGS)}")
+    parser.add_argument("--node-limit", type=int, default=200000, help="node budget per start square")
+    args = parser.parse_args(argv)
+
+    names = [c.strip() for c in args.configs.split(",") if c.strip()]
+    unknown = [c for c in names if c not in CONFIGS]
+    if unknown:
+        parser.error(f"unknown config(s): {', '.join(unknown)}")
+
+    for n in parse_range(args.sizes):
+        print(f"\n{n}x{n}, {n * n} starts, node limit {args.node_limit:,}")
+        print(f"{'config':<13} {'solved':>7} {'capped':>6} {'total nodes':>12} {'saved':>7} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8} {'p99 time':>9} {'dead-end':>9} {'disconn':>8}")
+        reference = None
+        for name in names:
+            stats = summarize(sweep(n, CONFIGS[name], args.node_limit))
+            if reference is None and name == "warnsdorff":
+                reference = stats["nodes"]
+            saved = f"{1 - stats['nodes'] / reference:+.0%}" if reference else ""
+            print(f"{name:<13} {stats['solved']:>3}/{stats['starts']:<3} {stats['capped']:>6} {stats['nodes']:>12,} {saved:>7} "
+                  f"{stats['p50']:>8,} {stats['p90']:>8,} {stats['p99']:>8,} {stats['max']:>8,} {stats['time_p99']:>8.3f}s "
+                  f"{stats['dead_ends']:>9,} {stats['disconnected']:>8,}")
+
+
+if __name__ == "__main__":
+    main()
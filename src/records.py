@@ -0,0 +1,81 @@
+"""
+The run-history record schema shared by the GUI log and headless tools.
+"""
+
+from datetime import datetime
+
+RECORD_FIELDS = ["ID", "Timestamp", "Board", "Algorithm", "Time", "Result", "Success", "Work"]
+
+
+def make_record(res, n, record_id):
+    """
+    Builds a history record from a solver result dict.
+    
+    Args:
+        res (dict): Result returned by a solver's run().
+        n (int): Board size the solver ran on.
+        record_id: Value for the ID column.
+    """
+    return {
+        "ID": record_id,
+        "Timestamp": datetime.now().strftime("%H:%M:%S"),
+        "Board": f"{n}x{n}",
+        "Algorithm": res['algorithm'],
+        "Time": f"{res['time']:.6f}s",
+        "Result": f"{res['steps']}/{n*n}",
+        "Success": "Yes" if res['success'] else "No",
+        "Work": work_done(res.get('stats'))
+    }
+
+
+def export_record(res, n, start, record_id=None):
+    """
+    A record extended with the start square, whether the tour came from the
+    cache, and the path as [x, y] pairs. This is what the command-line mode
+    prints as JSON and what the solver service returns.
+    """
+    record = make_record(res, n, record_id)
+    record["Start"] = f"{start[0]},{start[1]}"
+    record["Cached"] = "Yes" if res.get("cached") else "No"
+    record["Path"] = [list(square) for square in res["path"]]
+    return record
+
+
+def scalar_stats(stats):
+    """
+    The scalar counters of a result's stats; per-generation series are
+    dropped before results cross a process boundary or reach the history.
+    """
+    return {k: v for k, v in (stats or {}).items() if isinstance(v, (int, float))}
+
+
+def work_units(stats):
+    """
+    The main work counter of a run: nodes expanded (backtracking) or genomes
+    evaluated (cultural). None for solvers without counters or cached runs.
+    """
+    if not stats:
+        return None
+    if "nodes" in stats:
+        return stats["nodes"]
+    return stats.get("evaluations")
+
+
+def work_done(stats):
+    """
+    Formats work_units for display, e.g. "1,234 nodes".
+    """
+    units = work_units(stats)
+    if units is None:
+        return ""
+    return f"{units:,} {'nodes' if 'nodes' in stats else 'genomes'}"
+
+
+def percentile(sorted_values, q):
+    """
+    Nearest-rank percentile of an already sorted list, q in [0, 100].
+    """
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
@@ -0,0 +1,468 @@
+"""
+Local HTTP/JSON solver service.
+
+Other tools can ask for tours over HTTP instead of embedding the solvers.
+Requests are solved in a process pool. At most `max_pending` jobs are queued
+or running at once; beyond that the service answers 503 with a Retry-After
+header instead of queueing without bound. A request identical to one still in
+flight shares its job, so the tour is only computed once. Tours found before
+are served from the tour cache shared with the GUI and the batch runner.
+
+Endpoints:
+    POST /solve    {"n": 8, "start": [0, 0], "algorithm": "backtracking",
+                    "budget": 10, "max_gens": 2000, "seed": 1, "stream": false}
+                   Only "n" is required. The reply is a history record (see
+                   src.records.export_record) with the path. With "stream":
+                   true the reply is newline-delimited JSON: progress events
+                   while the solver runs, then {"event": "result", "record": ...}.
+    GET /metrics   Request counts, throughput and latency percentiles.
+    GET /health    {"status": "ok"}
+
+The budget stops the backtracking and cultural solvers at their next
+progress check and returns the longest path so far. Where SIGALRM exists (not
+on Windows), a worker alarm also interrupts any solver still running shortly
+after its budget: the divide-and-conquer and closed-tour solvers, which have
+no progress checks, and a streaming solver stuck between two checks. Such a
+job frees its worker and reports an unsuccessful result with an empty path.
+
+Example:
+    python -m src.service --port 8765 --workers 4 --max-pending 32
+    curl -s localhost:8765/solve -d '{"n": 8, "start": [0, 0]}'
+    curl -sN localhost:8765/solve -d '{"n": 7, "start": [0, 1], "budget": 2, "stream": true}'
+    curl -s localhost:8765/metrics
+"""
+
+import argparse
+import collections
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.cache import TourCache
+from src.records import export_record, percentile, scalar_stats
+from src.solvers import STREAMING, Deadline, create_solver, display_name
+
+# Solvers the service runs; each job stays inside one worker process.
+SERVICE_ALGORITHMS = ("backtracking", "cultural", "divide", "closed")
+MAX_SIZE = 200
+DEFAULT_BUDGET = 30.0
+MAX_BUDGET = 300.0
+# Seconds between a job's progress events.
+EVENT_INTERVAL = 0.25
+# Seconds past the budget before the alarm interrupts a streaming solver that
+# has not reached its next progress check.
+ALARM_GRACE = 1.0
+# Responses kept for the latency percentiles.
+LATENCY_WINDOW = 1000
+
+# Set in each worker process by _init_worker.
+_events = None
+
+
+def _init_worker(events):
+    global _events
+    _events = events
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise BudgetExceeded()
+
+
+def _solve(job_id, algorithm, n, start_x, start_y, options, budget):
+    """
+    Runs one job inside a worker process.
+
+    Progress events go to the shared events queue as (job_id, event), at
+    most every EVENT_INTERVAL seconds. Solvers without a cancel argument are
+    interrupted by SIGALRM once the budget is spent (see the module docstring).
+    """
+    last = [0.0]
+
+    def progress(event):
+        now = time.perf_counter()
+        if now - last[0] >= EVENT_INTERVAL:
+            last[0] = now
+            _events.put((job_id, event))
+
+    alarm = budget
+    if algorithm in STREAMING:
+        options = dict(options, progress=progress, cancel=Deadline(budget))
+        alarm += ALARM_GRACE
+    use_alarm = hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, alarm)
+    try:
+        res = create_solver(algorithm, n, **options).run(start_x, start_y)
+    except BudgetExceeded:
+        res = {"algorithm": display_name(algorithm), "success": False, "path": [], "time": alarm, "steps": 0}
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    res["stats"] = scalar_stats(res.get("stats"))
+    return res
+
+
+def parse_request(body):
+    """
+    Validates a /solve request body.
+
+    Returns:
+        dict: algorithm, n, start (x, y), budget and solver options.
+
+    Raises:
+        ValueError: With a message for the client.
+    """
+    if not isinstance(body, dict):
+        raise ValueError("request body must be a JSON object")
+    algorithm = body.get("algorithm", "backtracking")
+    if algorithm not in SERVICE_ALGORITHMS:
+        raise ValueError(f"algorithm must be one of {', '.join(SERVICE_ALGORITHMS)}")
+    n = body.get("n")
+    if not isinstance(n, int) or not 1 <= n <= MAX_SIZE:
+        raise ValueError(f"n must be an integer from 1 to {MAX_SIZE}")
+    start = body.get("start", [0, 0])
+    if (not isinstance(start, list) or len(start) != 2 or not all(isinstance(v, int) for v in start)
+            or not all(0 <= v < n for v in start)):
+        raise ValueError(f"start must be [row, col] on the {n}x{n} board")
+    budget = body.get("budget", DEFAULT_BUDGET)
+    if not isinstance(budget, (int, float)) or not 0 < budget <= MAX_BUDGET:
+        raise ValueError(f"budget must be a number of seconds up to {MAX_BUDGET:g}")
+    options = {}
+    if algorithm == "cultural":
+        for name in ("max_gens", "seed"):
+            if body.get(name) is not None:
+                if not isinstance(body[name], int):
+                    raise ValueError(f"{name} must be an integer")
+                options[name] = body[name]
+    return {"algorithm": algorithm, "n": n, "start": tuple(start), "budget": float(budget), "options": options}
+
+
+class Job:
+    """
+    One solve in the pool, shared by every identical request in flight.
+    """
+
+    def __init__(self, job_id, request):
+        self.id = job_id
+        self.request = request
+        self.events = []
+        self.record = None
+        self.error = None
+        self.finished = False
+        self.changed = threading.Condition()
+
+    def add_event(self, event):
+        with self.changed:
+            self.events.append(event)
+            self.changed.notify_all()
+
+    def finish(self, record=None, error=None):
+        with self.changed:
+            self.record, self.error, self.finished = record, error, True
+            self.changed.notify_all()
+
+    def wait(self):
+        with self.changed:
+            self.changed.wait_for(lambda: self.finished)
+
+    def follow(self):
+        """
+        Yields the job's progress events as they arrive, until it finishes.
+        """
+        seen = 0
+        while True:
+            with self.changed:
+                self.changed.wait_for(lambda: self.finished or len(self.events) > seen)
+                new, finished = self.events[seen:], self.finished
+            seen += len(new)
+            yield from new
+            if finished:
+                return
+
+
+class SolverService:
+    """
+    Queues solve requests onto a bounded process pool and keeps metrics.
+    """
+
+    def __init__(self, workers=None, max_pending=32, cache_dir=".tour_cache"):
+        """
+        Args:
+            workers (int): Worker processes (default: CPU count).
+            max_pending (int): Jobs queued or running before requests get 503.
+            cache_dir: Directory of the shared tour cache (None: memory only).
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.slots = threading.BoundedSemaphore(max_pending)
+        ctx = multiprocessing.get_context()
+        self.events = ctx.Queue()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx, initializer=_init_worker, initargs=(self.events,))
+        self.cache = TourCache(cache_dir)
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.job_ids = itertools.count(1)
+        self.started = time.perf_counter()
+        self.counters = collections.Counter()
+        self.completions = collections.deque()
+        self.latencies = collections.deque(maxlen=LATENCY_WINDOW)
+        self.solve_times = collections.deque(maxlen=LATENCY_WINDOW)
+        self.router = threading.Thread(target=self.route_events, daemon=True)
+        self.router.start()
+
+    @staticmethod
+    def job_key(request):
+        return (request["algorithm"], request["n"], request["start"], request["budget"],
+                tuple(sorted(request["options"].items())))
+
+    def submit(self, request):
+        """
+        Finds or starts the job for a parsed request.
+
+        Returns:
+            Job: A finished job for cache hits, the in-flight job for a
+            duplicate request, or a newly queued one; None if the queue is
+            full.
+        """
+        algorithm, n, (x, y) = request["algorithm"], request["n"], request["start"]
+        key = self.job_key(request)
+        with self.lock:
+            self.counters["requests"] += 1
+            job = self.jobs.get(key)
+            if job is not None:
+                self.counters["deduplicated"] += 1
+                return job
+            res = self.cache.get(algorithm, n, x, y)
+            if res is not None:
+                self.counters["cached"] += 1
+                job = Job(next(self.job_ids), request)
+                job.finish(export_record(res, n, (x, y), job.id))
+                return job
+            if not self.slots.acquire(blocking=False):
+                self.counters["rejected"] += 1
+                return None
+            job = Job(next(self.job_ids), request)
+            self.jobs[key] = job
+            self.counters["accepted"] += 1
+        try:
+            future = self.pool.submit(_solve, job.id, algorithm, n, x, y, request["options"], request["budget"])
+        except RuntimeError as e:
+            self.job_done(key, job, None, f"{type(e).__name__}: {e}")
+            return job
+        future.add_done_callback(lambda f: self.job_done(key, job, f))
+        return job
+
+    def job_done(self, key, job, future, error=None):
+        record = None
+        if future is not None:
+            try:
+                res = future.result()
+                n, start = job.request["n"], job.request["start"]
+                with self.lock:
+                    self.cache.put(job.request["algorithm"], n, *start, res)
+                record = export_record(res, n, start, job.id)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+        with self.lock:
+            del self.jobs[key]
+            self.counters["failed" if error else "completed"] += 1
+            if record is not None:
+                self.completions.append(time.perf_counter())
+                self.solve_times.append(float(record["Time"].rstrip("s")))
+        self.slots.release()
+        job.finish(record, error)
+
+    def route_events(self):
+        """
+        Hands progress events from the workers to their jobs' followers.
+        """
+        while True:
+            item = self.events.get()
+            if item is None:
+                return
+            job_id, event = item
+            with self.lock:
+                job = next((job for job in self.jobs.values() if job.id == job_id), None)
+            if job is not None:
+                job.add_event(event)
+
+    def record_latency(self, seconds):
+        with self.lock:
+            self.latencies.append(seconds)
+
+    def metrics(self):
+        """
+        Request counters, pool state, throughput and latency percentiles.
+        """
+        now = time.perf_counter()
+        with self.lock:
+            while self.completions and now - self.completions[0] > 60:
+                self.completions.popleft()
+            counters = dict(self.counters)
+            latencies = sorted(self.latencies)
+            solve_times = sorted(self.solve_times)
+            in_flight = len(self.jobs)
+            last_minute = len(self.completions)
+        uptime = now - self.started
+
+        def summary(values):
+            if not values:
+                return {"count": 0}
+            return {"count": len(values), "mean": sum(values) / len(values), "p50": percentile(values, 50),
+                    "p90": percentile(values, 90), "p99": percentile(values, 99), "max": values[-1]}
+
+        counts = {name: counters.get(name, 0) for name in
+                  ("requests", "accepted", "deduplicated", "cached", "rejected", "invalid", "completed", "failed")}
+        return {
+            "uptime": uptime,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": in_flight,
+            **counts,
+            "throughput": {"per_sec": counts["completed"] / uptime if uptime else 0.0, "last_minute_per_sec": last_minute / 60},
+            "latency": summary(latencies),
+            "solve_time": summary(solve_times),
+        }
+
+    def count(self, name):
+        with self.lock:
+            self.counters[name] += 1
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.events.put(None)
+        self.router.join()
+
+
+class SolveHandler(BaseHTTPRequestHandler):
+    """
+    HTTP front end of a SolverService (held by the server as `service`).
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def write_chunk(self, body):
+        data = json.dumps(body).encode() + b"\n"
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == "/metrics":
+            self.send_json(200, service.metrics())
+        elif self.path == "/health":
+            self.send_json(200, {"status": "ok"})
+        else:
+            self.send_json(404, {"error": f"no such endpoint: {self.path}"})
+
+    def do_POST(self):
+        service = self.server.service
+        if self.path != "/solve":
+            self.send_json(404, {"error": f"no such endpoint: {self.path}"})
+            return
+        received = time.perf_counter()
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            request = parse_request(body)
+        except ValueError as e:
+            service.count("invalid")
+            self.send_json(400, {"error": str(e)})
+            return
+
+        job = service.submit(request)
+        if job is None:
+            self.send_json(503, {"error": "solver queue is full, retry later"}, {"Retry-After": "1"})
+            return
+
+        if body.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            try:
+                for event in job.follow():
+                    self.write_chunk(event)
+                if job.error:
+                    self.write_chunk({"event": "error", "error": job.error})
+                else:
+                    self.write_chunk({"event": "result", "record": job.record})
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                # The client went away; the job still finishes for the others.
+                self.close_connection = True
+        else:
+            job.wait()
+            if job.error:
+                self.send_json(500, {"error": job.error})
+            else:
+                self.send_json(200, job.record)
+        service.record_latency(time.perf_counter() - received)
+
+
+def make_server(service, host="127.0.0.1", port=8765, verbose=False):
+    """
+    Creates (but does not start) the HTTP server; port 0 picks a free port.
+    """
+    server = ThreadingHTTPServer((host, port), SolveHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.service", description="Serve Knight's Tour solves over local HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: localhost only)")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on (0 picks a free one)")
+    parser.add_argument("--workers", type=int, default=None, help="solver processes (default: CPU count)")
+    parser.add_argument("--max-pending", type=int, default=32, help="jobs queued or running before requests get 503")
+    parser.add_argument("--cache-dir", default=".tour_cache", help="tour cache shared with the GUI")
+    parser.add_argument("--no-cache", action="store_true", help="keep the tour cache in memory only")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+    if args.max_pending < 1:
+        parser.error("--max-pending must be at least 1")
+
+    service = SolverService(args.workers, args.max_pending, None if args.no_cache else args.cache_dir)
+    server = make_server(service, args.host, args.port, args.verbose)
+    host, port = server.server_address[:2]
+    print(f"serving on http://{host}:{port} with {service.workers} workers, up to {args.max_pending} pending jobs", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Registry of the available solvers, keyed by a short algorithm name.
+
+Solver modules are imported on first use, so tools that only need one
+strategy do not pay for the others (or for NumPy when it is not needed).
+"""
+
+import argparse
+import time
+from importlib import import_module
+
+# name -> (module, class, the "algorithm" value its results carry)
+ALGORITHMS = {
+    "backtracking": ("src.backtracking", "BacktrackingSolver", "Backtracking"),
+    "cultural": ("src.cultural", "CulturalSolver", "Cultural Algorithm"),
+    "divide": ("src.divide_conquer", "DivideConquerSolver", "Divide and Conquer"),
+    "closed": ("src.closed", "ClosedTourSolver", "Closed Tour"),
+    "islands": ("src.islands", "IslandCulturalSolver", "Cultural Algorithm (Islands)"),
+    "portfolio": ("src.portfolio", "PortfolioSolver", "Portfolio"),
+}
+
+# Solvers taking progress and cancel arguments; the others run to completion.
+STREAMING = ("backtracking", "cultural")
+
+
+class Deadline:
+    """
+    Event-like object that counts as set once `seconds` have passed; pass it
+    as `cancel` to a STREAMING solver to give the run a time limit.
+    """
+
+    def __init__(self, seconds):
+        self.at = time.perf_counter() + seconds
+
+    def is_set(self):
+        return time.perf_counter() >= self.at
+
+
+def create_solver(algorithm, n, **options):
+    """
+    Instantiates the solver registered under `algorithm` for an NxN board.
+    
+    Args:
+        algorithm (str): One of the ALGORITHMS keys.
+        n (int): The dimension of the chessboard (NxN).
+        **options: Extra constructor arguments (e.g. max_gens, seed).
+    """
+    try:
+        module_name, class_name, _ = ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm '{algorithm}'. Choose from: {', '.join(ALGORITHMS)}") from None
+    return getattr(import_module(module_name), class_name)(n, **options)
+
+
+def display_name(algorithm):
+    """
+    The "algorithm" value results of the named solver carry (e.g. "Backtracking").
+    """
+    return ALGORITHMS[algorithm][2]
+
+
+def parse_start(text):
+    """
+    Parses a "ROW,COL" start square (an argparse type for the command-line tools).
+    """
+    try:
+        x, y = (int(part) for part in text.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROW,COL, got {text!r}") from None
+    return x, y
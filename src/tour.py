@@ -0,0 +1,172 @@
+"""
+Compact tour storage.
+
+TourPath keeps a path as flat square indices (x * n + y) in an array and
+shows it to callers as a read-only sequence of (x, y) tuples, so code written
+against the old list-of-tuples paths keeps working.
+
+Tours can also be saved in a small binary format: a fixed header followed by
+one 3-bit knight-move code per step. Files are read through mmap.
+
+    offset  size  field
+    0       4     magic b"KTOR"
+    4       1     format version (1)
+    5       3     reserved
+    8       4     board size N          (uint32, little-endian)
+    12      4     number of squares L   (uint32)
+    16      4     first square x*N+y    (uint32)
+    20      ...   L-1 move codes, 3 bits each, least significant bit first
+"""
+
+import mmap
+import struct
+from array import array
+from collections.abc import Sequence
+
+from src.board import KNIGHT_MOVES
+
+MAGIC = b"KTOR"
+VERSION = 1
+HEADER = struct.Struct("<4sB3xIII")
+
+
+class TourPath(Sequence):
+    """
+    Read-only sequence view of a path stored as flat square indices.
+    """
+
+    __slots__ = ("squares", "n")
+
+    def __init__(self, squares, n):
+        """
+        Args:
+            squares: Integer buffer (array or numpy array) of flat squares.
+            n (int): Board size.
+        """
+        self.squares = squares
+        self.n = n
+
+    @classmethod
+    def from_coords(cls, path, n):
+        return cls(array('I', [x * n + y for x, y in path]), n)
+
+    def __len__(self):
+        return len(self.squares)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TourPath(self.squares[index], self.n)
+        return divmod(int(self.squares[index]), self.n)
+
+    def __iter__(self):
+        n = self.n
+        for square in self.squares:
+            yield divmod(int(square), n)
+
+    def __eq__(self, other):
+        if isinstance(other, TourPath):
+            return self.n == other.n and list(self.squares) == list(other.squares)
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"TourPath(n={self.n}, steps={len(self)})"
+
+    def to_bytes(self):
+        """
+        Encodes the path in the binary tour format.
+        """
+        n = self.n
+        codes = {(dx, dy): i for i, (dx, dy) in enumerate(KNIGHT_MOVES)}
+        out = bytearray(HEADER.pack(MAGIC, VERSION, n, len(self), int(self.squares[0]) if len(self) else 0))
+
+        # Pack moves eight at a time: 8 x 3 bits = 3 bytes.
+        acc = bits = 0
+        prev = None
+        for square in self.squares:
+            x, y = divmod(int(square), n)
+            if prev is not None:
+                acc |= codes[(x - prev[0], y - prev[1])] << bits
+                bits += 3
+                if bits == 24:
+                    out += acc.to_bytes(3, "little")
+                    acc = bits = 0
+            prev = (x, y)
+        if bits:
+            out += acc.to_bytes((bits + 7) // 8, "little")
+        return bytes(out)
+
+
+def save_tour(filename, path, n=None):
+    """
+    Writes a path (TourPath or list of (x, y)) to a binary tour file.
+    """
+    if not isinstance(path, TourPath):
+        path = TourPath.from_coords(path, n)
+    with open(filename, "wb") as file:
+        file.write(path.to_bytes())
+
+
+class MappedTour:
+    """
+    A binary tour file opened through mmap and decoded on iteration.
+    
+    Use as a context manager; to_path() decodes the whole tour into a TourPath.
+    """
+
+    def __init__(self, filename):
+        with open(filename, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.n, self.length, self.start = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{filename} is not a version {VERSION} tour file")
+
+    def __len__(self):
+        return self.length
+
+    def squares(self):
+        """
+        Yields the flat squares of the tour in order.
+        """
+        n = self.n
+        offsets = [dx * n + dy for dx, dy in KNIGHT_MOVES]
+        square = self.start
+        if self.length:
+            yield square
+        moves = self.length - 1
+        pos = HEADER.size
+        while moves > 0:
+            chunk = int.from_bytes(self.buffer[pos:pos + 3], "little")
+            pos += 3
+            for _ in range(min(8, moves)):
+                square += offsets[chunk & 7]
+                chunk >>= 3
+                yield square
+            moves -= 8
+
+    def __iter__(self):
+        n = self.n
+        for square in self.squares():
+            yield divmod(square, n)
+
+    def to_path(self):
+        return TourPath(array('I', self.squares()), self.n)
+
+    def close(self):
+        self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_tour(filename):
+    """
+    Reads a binary tour file into a TourPath.
+    """
+    with MappedTour(filename) as tour:
+        return tour.to_path()
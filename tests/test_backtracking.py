@@ -0,0 +1,96 @@
+import itertools
+
+import pytest
+
+from src.backtracking import BacktrackingSolver
+from src.board import KNIGHT_MOVES
+
+LAYERS = {
+    "prune_dead_ends": [False, True],
+    "connectivity_interval": [0, 1, 4],
+    "tie_break": [None, "pohl", "roth"],
+    "move_order": [None, [7, 6, 5, 4, 3, 2, 1, 0]],
+}
+COMBINATIONS = [dict(zip(LAYERS, values)) for values in itertools.product(*LAYERS.values())]
+
+
+def assert_tour(path, n, start):
+    path = list(path)
+    assert len(path) == len(set(path)) == n * n
+    assert path[0] == start
+    assert all(sorted((abs(a[0] - b[0]), abs(a[1] - b[1]))) == [1, 2] for a, b in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("n", [5, 6])
+def test_layers_keep_every_solvable_start(n):
+    for start in itertools.product(range(n), repeat=2):
+        # Odd boards have no tour from the minority colour. Exhausting those
+        # starts takes seconds without dead-end pruning and can only fail, so
+        # only the dead-end pruned combinations run there (connectivity alone
+        # is exhausted once in test_pruning_counters_and_stats).
+        unsolvable = n % 2 == 1 and sum(start) % 2 == 1
+        expected = False if unsolvable else BacktrackingSolver(n).run(*start)["success"]
+        for options in COMBINATIONS:
+            if unsolvable and not options["prune_dead_ends"]:
+                continue
+            res = BacktrackingSolver(n, **options).run(*start)
+            assert res["success"] == expected, (start, options)
+            if expected:
+                assert_tour(res["path"], n, start)
+
+
+@pytest.mark.parametrize("move_order", [[0, 1, 2, 3, 4, 5, 6], [0, 0, 1, 2, 3, 4, 5, 6], list(range(1, 9))])
+def test_move_order_must_be_a_permutation(move_order):
+    with pytest.raises(ValueError):
+        BacktrackingSolver(6, move_order=move_order)
+
+
+def test_unknown_tie_break():
+    with pytest.raises(ValueError):
+        BacktrackingSolver(6, tie_break="random")
+
+
+def test_pruning_counters_and_stats():
+    # 5x5 from (0, 1) has no tour, so the whole (pruned) tree is searched.
+    # Plain search of that tree expands 1,829,420 nodes.
+    for options, counter in [({"prune_dead_ends": True}, "dead_ends"), ({"connectivity_interval": 1}, "disconnected")]:
+        res = BacktrackingSolver(5, **options).run(0, 1)
+        assert not res["success"]
+        assert res["pruned"][counter] > 0
+        stats = res["stats"]
+        assert stats["pruned_dead_ends"] == res["pruned"]["dead_ends"]
+        assert stats["pruned_disconnected"] == res["pruned"]["disconnected"]
+        assert 0 < stats["nodes"] < 1829420
+        assert stats["backtracks"] == stats["nodes"]
+        assert stats["degree_evaluations"] >= stats["nodes"]
+        assert 0 < stats["max_depth"] < 24
+
+    res = BacktrackingSolver(6).run(0, 0)
+    assert res["pruned"] == {"dead_ends": 0, "disconnected": 0}
+    assert res["stats"]["nodes"] >= 35 and res["stats"]["max_depth"] == 35
+
+
+@pytest.mark.parametrize("n", [8, 30, 300])
+def test_finds_valid_tour(n):
+    res = BacktrackingSolver(n).run(0, 0)
+    assert res["success"]
+    assert_tour(res["path"], n, (0, 0))
+
+
+def brute_degree(solver, x, y):
+    n = solver.n
+    return sum(0 <= x + dx < n and 0 <= y + dy < n and solver.board[(x + dx) * n + y + dy] == -1
+               for dx, dy in KNIGHT_MOVES)
+
+
+@pytest.mark.parametrize("options", [{"prune_dead_ends": True}, {"prune_dead_ends": True, "connectivity_interval": 1}])
+def test_degrees_follow_the_search(options):
+    # 5x5 from (0, 1) has no tour: the search visits and releases every branch.
+    solver = BacktrackingSolver(5, **options)
+    for event in solver.iter_events(0, 1, trace=True):
+        if event["event"] in ("expand", "backtrack"):
+            assert all(solver.get_degree(x, y) == brute_degree(solver, x, y)
+                       for x in range(5) for y in range(5))
+    assert event["event"] == "exhausted"
+    assert list(solver.degree) == list(solver.geometry.initial_degrees())
+    assert all(square == -1 for square in solver.board)
@@ -0,0 +1,25 @@
+import csv
+
+from src.batch import build_tasks, run_batch, run_task
+
+
+def read(path):
+    with open(path, newline='') as file:
+        return list(csv.DictReader(file))
+
+
+def test_ids_continue_across_runs(tmp_path):
+    output = str(tmp_path / "runs.csv")
+    tasks = list(build_tasks([5], [0], [0, 2], ["backtracking"]))
+    assert run_batch(tasks, output, workers=1) == 2
+    assert run_batch(tasks, output, workers=1) == 2
+    assert [row["ID"] for row in read(output)] == ["1", "2", "3", "4"]
+
+
+def test_timeout_keeps_partial_progress():
+    # 7x7 from (0, 1) has no tour, so the search runs until the deadline.
+    record = run_task((7, 0, 1, "backtracking"), timeout=0.5)
+    assert record["Error"] == "timeout after 0.5s"
+    assert record["Success"] == "No"
+    assert int(record["Result"].split("/")[0]) > 1
+    assert record["Work"].endswith("nodes")
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from src.backtracking import BacktrackingSolver
+from src.cache import TourCache
+
+
+def is_tour(path, n, start):
+    path = list(path)
+    return (len(path) == len(set(path)) == n * n and path[0] == start
+            and all(sorted((abs(a[0] - b[0]), abs(a[1] - b[1]))) == [1, 2] for a, b in zip(path, path[1:])))
+
+
+@pytest.mark.parametrize("directory", [None, "disk"])
+def test_one_tour_serves_its_symmetry_class(tmp_path, directory):
+    n = 6
+    cache = TourCache(None if directory is None else str(tmp_path))
+    cache.put("backtracking", n, 0, 1, BacktrackingSolver(n).run(0, 1))
+    if directory is not None:
+        cache = TourCache(str(tmp_path))
+    for start in [(0, 1), (1, 0), (0, 4), (4, 0), (5, 1), (1, 5), (5, 4), (4, 5)]:
+        res = cache.get("backtracking", n, *start)
+        assert res["cached"] and is_tour(res["path"], n, start)
+    assert cache.get("backtracking", n, 0, 0) is None
+
+
+def test_constructive_solvers_are_not_cached(tmp_path):
+    from src.divide_conquer import DivideConquerSolver
+    cache = TourCache(str(tmp_path))
+    res = cache.solve("divide", 8, 0, 0, lambda: DivideConquerSolver(8).run(0, 0))
+    assert not res.get("cached")
+    assert cache.get("divide", 8, 0, 0) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_memory_tier_is_capped_by_squares():
+    cache = TourCache(None, capacity=100)
+    for start in [(0, 0), (0, 1), (1, 1)]:
+        cache.put("backtracking", 6, *start, BacktrackingSolver(6).run(*start))
+    assert cache.memory_squares == 72
+    assert cache.get("backtracking", 6, 0, 0) is None
+    assert cache.get("backtracking", 6, 1, 1) is not None
+
+
+def test_reads_inline_json_entries(tmp_path):
+    n = 5
+    path = BacktrackingSolver(n).run(0, 0)["path"]
+    entry = {"algorithm": "Backtracking", "n": n, "start": [0, 0], "time": 0.1,
+             "path": [x * n + y for x, y in path]}
+    (tmp_path / "backtracking-5-0-0.json").write_text(json.dumps(entry))
+    res = TourCache(str(tmp_path)).get("backtracking", n, 4, 4)
+    assert res["solve_time"] == 0.1 and is_tour(res["path"], n, (4, 4))
@@ -0,0 +1,131 @@
+import numpy as np
+import pytest
+
+from src.cultural import CulturalSolver
+
+
+def reference_score(solver, genome, start_x, start_y):
+    """
+    Path length of a genome walked one move at a time, stopping at the first
+    move off the board or onto a visited square.
+    """
+    visited = {(start_x, start_y)}
+    x, y = start_x, start_y
+    for move in genome:
+        dx, dy = solver.moves[move]
+        x, y = x + dx, y + dy
+        if not (0 <= x < solver.n and 0 <= y < solver.n) or (x, y) in visited:
+            break
+        visited.add((x, y))
+    return len(visited)
+
+
+def reference_scores(solver, population, start_x, start_y):
+    return [reference_score(solver, genome, start_x, start_y) for genome in population.tolist()]
+
+
+def long_walks(n, count, rng):
+    """
+    Genomes that follow a random self-avoiding walk as far as it goes, so
+    scores are long enough to exercise repeats and prefix reuse.
+    """
+    population = rng.integers(0, 8, (count, n * n), dtype=np.int8)
+    solver = CulturalSolver(n)
+    for genome in population:
+        x, y = 0, 0
+        visited = {(x, y)}
+        for i in range(n * n):
+            options = [m for m, (dx, dy) in enumerate(solver.moves)
+                       if 0 <= x + dx < n and 0 <= y + dy < n and (x + dx, y + dy) not in visited]
+            if not options:
+                break
+            genome[i] = options[rng.integers(len(options))]
+            dx, dy = solver.moves[genome[i]]
+            x, y = x + dx, y + dy
+            visited.add((x, y))
+    return population
+
+
+@pytest.mark.parametrize("n", [1, 3, 5, 8, 12])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_evaluate_matches_reference(n, seed):
+    solver = CulturalSolver(n, seed=seed)
+    population = np.random.default_rng(seed).integers(0, 8, (100, n * n), dtype=np.int8)
+    for start in [(0, 0), (n // 2, n // 2), (n - 1, 0)]:
+        assert solver.evaluate(population, *start).tolist() == reference_scores(solver, population, *start)
+
+
+@pytest.mark.parametrize("n", [5, 8, 12])
+def test_evaluate_matches_reference_on_long_walks(n):
+    rng = np.random.default_rng(n)
+    solver = CulturalSolver(n)
+    population = long_walks(n, 50, rng)
+    assert solver.evaluate(population, 0, 0).tolist() == reference_scores(solver, population, 0, 0)
+
+
+@pytest.mark.parametrize("n", [5, 8, 12])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_start_state_records_each_walk(n, seed):
+    solver = CulturalSolver(n, seed=seed)
+    population = long_walks(n, 40, np.random.default_rng(seed))
+    walks, visit_steps, scores = solver.start_state(population, 0, 0)
+    assert scores.tolist() == reference_scores(solver, population, 0, 0)
+    for i, score in enumerate(scores):
+        path = solver.walk_to_path(walks[i], score)
+        assert len(set(path)) == score
+        visited = np.flatnonzero(visit_steps[i, :-1] != np.iinfo(np.int32).max)
+        assert sorted(visited) == sorted(walks[i, :score])
+
+
+@pytest.mark.parametrize("n", [5, 8, 12])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_resume_state_matches_fresh_evaluation(n, seed):
+    solver = CulturalSolver(n, pop_size=60, seed=seed)
+    population = long_walks(n, 60, np.random.default_rng(seed))
+    walks, visit_steps, scores = solver.start_state(population, 0, 0)
+    elite_row = int(np.argmax(scores))
+    solver.belief_best_score = int(scores[elite_row])
+
+    # Several generations in a row, so children inherit state that was
+    # itself produced by resume_state.
+    for _ in range(5):
+        population, parents, first_changed = solver.breed(population, scores, elite_row)
+        walks, visit_steps, scores = solver.resume_state(population, parents, first_changed, walks, visit_steps, scores)
+        assert scores.tolist() == reference_scores(solver, population, 0, 0)
+        assert scores.tolist() == solver.evaluate(population, 0, 0).tolist()
+        for i, score in enumerate(scores):
+            visited = np.flatnonzero(visit_steps[i, :-1] != np.iinfo(np.int32).max)
+            assert sorted(visited) == sorted(walks[i, :score])
+        elite_row = int(np.argmax(scores))
+        solver.belief_best_score = max(solver.belief_best_score, int(scores[elite_row]))
+
+
+def test_resume_state_with_arbitrary_mutation_points():
+    n = 8
+    rng = np.random.default_rng(7)
+    solver = CulturalSolver(n)
+    parents_pop = long_walks(n, 30, rng)
+    walks, visit_steps, scores = solver.start_state(parents_pop, 0, 0)
+
+    parents = rng.integers(0, len(parents_pop), 30)
+    children = parents_pop[parents].copy()
+    first_changed = rng.integers(0, n * n + 1, 30)
+    for i, lo in enumerate(first_changed):
+        if lo < n * n:
+            children[i, lo:] = rng.integers(0, 8, n * n - lo)
+            children[i, lo] = (parents_pop[parents[i], lo] + 1) % 8
+
+    _, _, new_scores = solver.resume_state(children, parents, first_changed, walks, visit_steps, scores)
+    assert new_scores.tolist() == reference_scores(solver, children, 0, 0)
+
+
+@pytest.mark.parametrize("n", [1, 5, 8])
+def test_genome_to_path_matches_evaluate(n):
+    solver = CulturalSolver(n)
+    population = long_walks(n, 20, np.random.default_rng(n))
+    scores = solver.evaluate(population, 0, 0)
+    for genome, score in zip(population, scores):
+        path = solver.genome_to_path(genome, 0, 0)
+        assert len(path) == score == reference_score(solver, genome, 0, 0)
+        assert path[0] == (0, 0) and len(set(path)) == len(path)
+        assert all(sorted((abs(a[0] - b[0]), abs(a[1] - b[1]))) == [1, 2] for a, b in zip(path, path[1:]))
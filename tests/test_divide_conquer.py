@@ -0,0 +1,68 @@
+import pytest
+
+from src.closed import ClosedTourSolver, closed_cycle
+from src.divide_conquer import DivideConquerSolver
+
+
+def is_knight_move(a, b):
+    return sorted((abs(a[0] - b[0]), abs(a[1] - b[1]))) == [1, 2]
+
+
+def assert_tour(path, n, start):
+    assert len(path) == n * n
+    assert len(set(path)) == n * n
+    assert path[0] == start
+    assert all(is_knight_move(a, b) for a, b in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("n", range(6, 42, 2))
+def test_even_boards(n):
+    solver = DivideConquerSolver(n)
+    for start in [(0, 0), (1, 2), (n // 2, n // 2 - 1), (n - 1, n - 1)]:
+        res = solver.run(*start)
+        assert res["success"]
+        assert_tour(list(res["path"]), n, start)
+
+
+@pytest.mark.parametrize("n", range(5, 42, 2))
+def test_odd_boards(n):
+    solver = DivideConquerSolver(n)
+    # Open tours of odd boards start on the majority colour, (x + y) even.
+    starts = [(0, 0), (2, 4), (5, 5), (n // 2, n // 2), (n - 6, 5), (n - 1, n - 1)]
+    for start in {(x, y) for x, y in starts if x < n and y < n and (x + y) % 2 == 0}:
+        res = solver.run(*start)
+        assert res["success"]
+        assert_tour(list(res["path"]), n, start)
+
+
+@pytest.mark.parametrize("n", [5, 9, 13, 21, 101])
+def test_odd_boards_reject_minority_colour(n):
+    res = DivideConquerSolver(n).run(0, 1)
+    assert not res["success"]
+    assert len(res["path"]) == 0
+
+
+@pytest.mark.parametrize("n", range(6, 42, 2))
+def test_closed_cycle(n):
+    cycle, position = closed_cycle(n)
+    squares = [divmod(sq, n) for sq in cycle]
+    assert_tour(squares, n, (0, 0))
+    assert is_knight_move(squares[-1], squares[0])
+    assert all(position[sq] == i for i, sq in enumerate(cycle))
+
+
+@pytest.mark.parametrize("n", [3, 5, 7, 13])
+def test_no_closed_cycle_on_odd_boards(n):
+    assert closed_cycle(n) is None
+    assert not ClosedTourSolver(n).run(0, 0)["success"]
+
+
+def test_closed_tours_from_every_start():
+    n = 8
+    starts = []
+    for start, squares in ClosedTourSolver(n).tours():
+        path = [divmod(sq, n) for sq in squares]
+        assert_tour(path, n, start)
+        assert is_knight_move(path[-1], path[0])
+        starts.append(start)
+    assert len(starts) == n * n
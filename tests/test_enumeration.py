@@ -0,0 +1,49 @@
+from src.enumeration import TourEnumerator, main, symmetry_classes
+
+
+def test_corner_count_5x5():
+    res = TourEnumerator(5, workers=1).count([(0, 0)])
+    assert res["tours"] == 304
+    assert res["closed"] == 0
+
+
+def test_all_starts_5x5(capsys):
+    main(["--size", "5", "--all-starts", "--workers", "1", "--quiet"])
+    assert "all 25 starts: 1728 tours, 0 closed" in capsys.readouterr().out
+
+
+def test_all_starts_weights_cover_the_board():
+    classes = symmetry_classes(5)
+    assert sum(classes.values()) == 25
+    counts = TourEnumerator(5, workers=1).count(classes)["starts"]
+    assert sum(counts[start]["tours"] * weight for start, weight in classes.items()) == 1728
+
+
+def test_closed_only_corner_6x6():
+    res = TourEnumerator(6, closed_only=True).count([(0, 0)])
+    assert res["tours"] == res["closed"] == 19724
+
+
+def test_tours_lists_every_counted_tour():
+    tours = TourEnumerator(5, workers=1).tours(0, 0)
+    assert len(tours) == 304
+    assert len({tuple(tour.squares) for tour in tours}) == 304
+
+
+def test_truncated_checkpoint_resumes(tmp_path):
+    checkpoint = tmp_path / "counts.jsonl"
+    full = TourEnumerator(5, workers=1, checkpoint=str(checkpoint)).count([(0, 0), (0, 2)])
+
+    # Keep the header and part of the jobs, the last one cut mid-line.
+    lines = checkpoint.read_text().splitlines(keepends=True)
+    kept = len(lines) // 2
+    checkpoint.write_text("".join(lines[:kept]) + lines[kept][:len(lines[kept]) // 2])
+
+    resumed = TourEnumerator(5, workers=1, checkpoint=str(checkpoint)).count([(0, 0), (0, 2)])
+    assert resumed["resumed_jobs"] == kept - 1
+    for key in ("tours", "closed", "nodes", "jobs", "starts"):
+        assert resumed[key] == full[key]
+
+    again = TourEnumerator(5, workers=1, checkpoint=str(checkpoint)).count([(0, 0), (0, 2)])
+    assert again["resumed_jobs"] == again["jobs"]
+    assert again["tours"] == full["tours"]
@@ -0,0 +1,34 @@
+import sqlite3
+
+from src.history import HistoryStore
+
+
+def result(time, cached=False):
+    res = {"algorithm": "Backtracking", "success": True, "time": time, "steps": 64, "path": []}
+    if cached:
+        res.update(cached=True, solve_time=0.5)
+    return res
+
+
+def test_cached_runs_are_flagged():
+    store = HistoryStore(":memory:")
+    store.add(result(0.5), 8)
+    store.add(result(0.0001, cached=True), 8)
+    rows = store.page(sort="ID")
+    assert [row["Cached"] for row in rows] == ["No", "Yes"]
+    assert [row["ID"] for row in store.page(sort="Cached", descending=True)] == [2, 1]
+
+
+def test_older_databases_gain_the_cached_column(tmp_path):
+    filename = str(tmp_path / "history.db")
+    conn = sqlite3.connect(filename)
+    conn.execute("CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, n INTEGER NOT NULL, "
+                 "algorithm TEXT NOT NULL, time REAL NOT NULL, steps INTEGER NOT NULL, success INTEGER NOT NULL)")
+    conn.execute("INSERT INTO runs (timestamp, n, algorithm, time, steps, success) VALUES ('12:00:00', 8, 'Backtracking', 0.5, 64, 1)")
+    conn.commit()
+    conn.close()
+
+    store = HistoryStore(filename)
+    store.add(result(0.0001, cached=True), 8)
+    assert [row["Cached"] for row in store.page(sort="ID")] == ["No", "Yes"]
+    store.close()
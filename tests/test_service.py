@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.records import RECORD_FIELDS
+from src.service import SolverService, make_server
+
+# 7x7 from a minority square has no tour: the search runs until its budget.
+SLOW = {"n": 7, "algorithm": "backtracking", "budget": 1}
+
+
+@pytest.fixture
+def server():
+    service = SolverService(workers=1, max_pending=2, cache_dir=None)
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}", service
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def post(url, body):
+    request = urllib.request.Request(url + "/solve", json.dumps(body).encode(), {"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as reply:
+            return reply.status, reply.headers, reply.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def get_metrics(url):
+    with urllib.request.urlopen(url + "/metrics", timeout=30) as reply:
+        return json.load(reply)
+
+
+def post_in_thread(url, body, replies):
+    thread = threading.Thread(target=lambda: replies.append(post(url, body)))
+    thread.start()
+    return thread
+
+
+def test_solve_returns_a_record(server):
+    url, _ = server
+    status, _, data = post(url, {"n": 6, "start": [0, 0]})
+    assert status == 200
+    record = json.loads(data)
+    assert set(record) == set(RECORD_FIELDS) | {"Start", "Cached", "Path"}
+    assert record["Success"] == "Yes" and record["Start"] == "0,0"
+    assert len(record["Path"]) == 36 and record["Path"][0] == [0, 0]
+
+    metrics = get_metrics(url)
+    assert metrics["requests"] == metrics["accepted"] == metrics["completed"] == 1
+    assert metrics["latency"]["count"] == metrics["solve_time"]["count"] == 1
+
+
+def test_invalid_request(server):
+    url, _ = server
+    status, _, data = post(url, {"n": 0})
+    assert status == 400 and "error" in json.loads(data)
+    assert get_metrics(url)["invalid"] == 1
+
+
+def test_identical_requests_share_a_job(server):
+    url, _ = server
+    replies = []
+    threads = [post_in_thread(url, dict(SLOW, start=[0, 1]), replies)]
+    time.sleep(0.3)
+    threads.append(post_in_thread(url, dict(SLOW, start=[0, 1]), replies))
+    for thread in threads:
+        thread.join()
+    records = [json.loads(data) for _, _, data in replies]
+    assert [status for status, _, _ in replies] == [200, 200]
+    assert records[0]["ID"] == records[1]["ID"]
+    metrics = get_metrics(url)
+    assert metrics["accepted"] == 1 and metrics["deduplicated"] == 1 and metrics["completed"] == 1
+
+
+def test_full_queue_is_rejected(server):
+    url, _ = server
+    replies = []
+    threads = [post_in_thread(url, dict(SLOW, start=start), replies) for start in ([0, 1], [1, 0])]
+    time.sleep(0.3)
+    status, headers, _ = post(url, dict(SLOW, start=[1, 2]))
+    assert status == 503
+    assert headers["Retry-After"] == "1"
+    for thread in threads:
+        thread.join()
+    assert [status for status, _, _ in replies] == [200, 200]
+    metrics = get_metrics(url)
+    assert metrics["rejected"] == 1 and metrics["completed"] == 2
+
+
+def test_stream_stops_at_the_budget(server):
+    url, _ = server
+    started = time.perf_counter()
+    status, headers, data = post(url, dict(SLOW, start=[0, 1], stream=True))
+    assert time.perf_counter() - started < SLOW["budget"] + 5
+    assert status == 200 and headers["Content-Type"] == "application/x-ndjson"
+    events = [json.loads(line) for line in data.splitlines()]
+    assert events[-1]["event"] == "result"
+    assert events[:-1] and all(event["event"] == "progress" for event in events[:-1])
+    record = events[-1]["record"]
+    assert record["Success"] == "No"
+    assert 1 < len(record["Path"]) < 49
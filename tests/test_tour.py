@@ -0,0 +1,57 @@
+from array import array
+
+import pytest
+
+from src.divide_conquer import DivideConquerSolver
+from src.tour import HEADER, MappedTour, TourPath, load_tour, save_tour
+
+
+def knight_walk(n, length):
+    return DivideConquerSolver(n).run(0, 0)["path"][:length]
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 7, 8, 9, 15, 16, 17, 24, 25, 63, 64])
+def test_round_trip(tmp_path, length):
+    path = knight_walk(8, length)
+    filename = tmp_path / "tour.ktr"
+    save_tour(filename, path)
+    # 3 bits per move, rounded up to whole bytes.
+    assert filename.stat().st_size == HEADER.size + (3 * max(length - 1, 0) + 7) // 8
+    loaded = load_tour(filename)
+    assert loaded == path
+    assert loaded.n == 8
+    assert len(loaded) == length
+
+
+@pytest.mark.parametrize("n", [5, 6, 13, 30])
+def test_round_trip_full_tours(tmp_path, n):
+    path = DivideConquerSolver(n).run(0, 0)["path"]
+    filename = tmp_path / "tour.ktr"
+    save_tour(filename, path)
+    with MappedTour(filename) as tour:
+        assert len(tour) == n * n
+        assert list(tour.squares()) == list(path.squares)
+        assert list(tour) == list(path)
+
+
+def test_save_coordinate_lists(tmp_path):
+    coords = [(0, 0), (2, 1), (4, 2), (3, 0), (1, 1)]
+    filename = tmp_path / "tour.ktr"
+    save_tour(filename, coords, 5)
+    assert load_tour(filename) == coords
+
+
+def test_empty_path(tmp_path):
+    filename = tmp_path / "tour.ktr"
+    save_tour(filename, TourPath(array('I'), 6))
+    loaded = load_tour(filename)
+    assert len(loaded) == 0
+    assert loaded.n == 6
+    assert list(loaded) == []
+
+
+def test_rejects_other_files(tmp_path):
+    filename = tmp_path / "tour.ktr"
+    filename.write_bytes(b"NOPE" + bytes(HEADER.size))
+    with pytest.raises(ValueError):
+        MappedTour(filename)